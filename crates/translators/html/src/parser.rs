@@ -79,20 +79,57 @@ impl HtmlParser {
         let body_selector = Selector::parse("body").unwrap();
         let body = fragment.select(&body_selector).next();
 
-        if let Some(body_element) = body {
-            self.process_children(&mut doc, &root, body_element, 0)?;
-        } else {
-            // No body tag, process entire document
-            if let Some(root_element) = fragment.root_element().first_child() {
-                if let Some(element) = ElementRef::wrap(root_element) {
-                    self.process_children(&mut doc, &root, element, 0)?;
-                }
-            }
+        // No body tag means the entire document is processed
+        let start = body.or_else(|| {
+            fragment
+                .root_element()
+                .first_child()
+                .and_then(ElementRef::wrap)
+        });
+
+        if let Some(element) = start {
+            // Size the block and structure maps once up front instead of
+            // letting them rehash repeatedly while blocks are added.
+            let estimate = self
+                .estimate_block_count(element, 0)
+                .min(self.config.max_blocks);
+            doc.reserve(estimate);
+            self.process_children(&mut doc, &root, element, 0)?;
         }
 
         Ok(doc)
     }
 
+    /// Estimate how many blocks `process_children` will emit for an element.
+    ///
+    /// Mirrors the dispatch in `process_element`: container tags are walked,
+    /// skipped tags count nothing and every other element or non-blank text
+    /// node counts as one block.
+    fn estimate_block_count(&self, element: ElementRef, depth: usize) -> usize {
+        if depth > self.config.max_depth {
+            return 0;
+        }
+
+        let mut count = 0;
+        for child in element.children() {
+            if let Some(child_element) = ElementRef::wrap(child) {
+                count += match child_element.value().name() {
+                    "script" | "style" | "meta" | "link" | "head" | "noscript" | "br" | "hr" => 0,
+                    "div" | "section" | "article" | "main" | "aside" | "nav" | "header"
+                    | "footer" | "span" | "figure" | "figcaption" => {
+                        self.estimate_block_count(child_element, depth + 1)
+                    }
+                    _ => 1,
+                };
+            } else if let Some(text_node) = child.value().as_text() {
+                if !text_node.trim().is_empty() {
+                    count += 1;
+                }
+            }
+        }
+        count
+    }
+
     /// Process all children of an element
     fn process_children(
         &self,
@@ -564,6 +601,20 @@ mod tests {
         assert!(doc.block_count() >= 2);
     }
 
+    #[test]
+    fn test_estimate_block_count_matches_parse() {
+        let html = r#"<body><h1>Title</h1><div><p>One</p><section><p>Two</p></section></div><script>x()</script><p>Three</p></body>"#;
+        let parser = HtmlParser::new();
+        let fragment = Html::parse_document(html);
+        let body = fragment
+            .select(&Selector::parse("body").unwrap())
+            .next()
+            .unwrap();
+        let doc = parser.parse(html).unwrap();
+        // Root block is not produced by the walk
+        assert_eq!(parser.estimate_block_count(body, 0), doc.block_count() - 1);
+    }
+
     #[test]
     fn test_max_depth_limit() {
         let config = HtmlParserConfig {
@@ -3,6 +3,11 @@
 use crate::{Result, TranslatorError};
 use ucm_core::{Block, Content, Document};
 
+/// Semantic roles for heading levels 1-6, indexed by `level - 1`
+const HEADING_ROLES: [&str; 6] = [
+    "heading1", "heading2", "heading3", "heading4", "heading5", "heading6",
+];
+
 /// Markdown parser that converts to UCM
 #[derive(Debug, Clone)]
 pub struct MarkdownParser {
@@ -44,7 +49,7 @@ impl MarkdownParser {
 
             // Heading - creates hierarchical structure
             if let Some(heading) = self.parse_heading(line) {
-                let block = Block::new(Content::text(&heading.text), Some(&heading.role));
+                let block = Block::new(Content::text(heading.text), Some(heading.role));
 
                 // Find the parent: look for the nearest heading of a higher level
                 let parent = if heading.level == 1 {
@@ -95,7 +100,7 @@ impl MarkdownParser {
             // List item
             if self.is_list_item(line) {
                 let (list_content, consumed) = self.parse_list(&lines[i..]);
-                let block = Block::new(Content::text(&list_content), Some("list"));
+                let block = Block::new(Content::text(list_content), Some("list"));
                 doc.add_block(block, &current_parent)
                     .map_err(|e| TranslatorError::InvalidStructure(e.to_string()))?;
                 i += consumed;
@@ -105,7 +110,7 @@ impl MarkdownParser {
             // Blockquote
             if line.starts_with('>') {
                 let (quote, consumed) = self.parse_blockquote(&lines[i..]);
-                let block = Block::new(Content::text(&quote), Some("quote"));
+                let block = Block::new(Content::text(quote), Some("quote"));
                 doc.add_block(block, &current_parent)
                     .map_err(|e| TranslatorError::InvalidStructure(e.to_string()))?;
                 i += consumed;
@@ -124,7 +129,7 @@ impl MarkdownParser {
 
             // Regular paragraph
             let (para, consumed) = self.parse_paragraph(&lines[i..]);
-            let block = Block::new(Content::text(&para), Some("paragraph"));
+            let block = Block::new(Content::text(para), Some("paragraph"));
             doc.add_block(block, &current_parent)
                 .map_err(|e| TranslatorError::InvalidStructure(e.to_string()))?;
             i += consumed;
@@ -145,7 +150,7 @@ impl MarkdownParser {
         }
 
         let text = trimmed[level..].trim().to_string();
-        let role = format!("heading{}", level);
+        let role = HEADING_ROLES[level - 1];
         Some(Heading { level, text, role })
     }
 
@@ -171,7 +176,7 @@ impl MarkdownParser {
         }
 
         let code = code_lines.join("\n");
-        Ok((Content::code(&lang, &code), i))
+        Ok((Content::code(lang, code), i))
     }
 
     fn is_list_item(&self, line: &str) -> bool {
@@ -271,8 +276,9 @@ impl MarkdownParser {
             i += 1;
         }
 
-        let paragraph = para_lines.join("\n");
-        (paragraph.trim_end_matches('\n').to_string(), i.max(1))
+        let mut paragraph = para_lines.join("\n");
+        paragraph.truncate(paragraph.trim_end_matches('\n').len());
+        (paragraph, i.max(1))
     }
 }
 
@@ -285,7 +291,7 @@ impl Default for MarkdownParser {
 struct Heading {
     level: usize,
     text: String,
-    role: String,
+    role: &'static str,
 }
 
 #[cfg(test)]
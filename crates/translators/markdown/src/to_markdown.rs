@@ -8,6 +8,7 @@
 //! derivation for blocks without heading roles.
 
 use crate::{Result, TranslatorError};
+use std::fmt::Write;
 use ucm_core::metadata::RoleCategory;
 use ucm_core::{Block, BlockId, Cell, Content, Document, MediaSource, Row};
 
@@ -61,13 +62,14 @@ impl MarkdownRenderer {
         let mut output = String::new();
         self.render_block(doc, &doc.root, &mut output, 0)?;
 
-        // Trim trailing whitespace but ensure single newline at end
-        let trimmed = output.trim_end();
-        if trimmed.is_empty() {
-            Ok(String::new())
-        } else {
-            Ok(format!("{}\n", trimmed))
+        // Trim trailing whitespace but ensure single newline at end.
+        // Done in place so the rendered document is not copied a second time.
+        let trimmed_len = output.trim_end().len();
+        output.truncate(trimmed_len);
+        if !output.is_empty() {
+            output.push('\n');
         }
+        Ok(output)
     }
 
     fn render_block(
@@ -126,29 +128,29 @@ impl MarkdownRenderer {
                     output.push_str("$\n\n");
                 }
             }
+            // Writing into a String cannot fail, so the fmt::Results below are ignored.
             Content::Media(media) => {
-                let src = match &media.source {
-                    MediaSource::Url(u) => u.clone(),
-                    MediaSource::Base64(b) => format!("data:image;base64,{}", b),
-                    MediaSource::Reference(id) => format!("[ref:{}]", id),
-                    MediaSource::External(ext) => format!("[{}:{}]", ext.provider, ext.key),
+                output.push_str("![");
+                output.push_str(media.alt_text.as_deref().unwrap_or(""));
+                output.push_str("](");
+                let _ = match &media.source {
+                    MediaSource::Url(u) => write!(output, "{}", u),
+                    MediaSource::Base64(b) => write!(output, "data:image;base64,{}", b),
+                    MediaSource::Reference(id) => write!(output, "[ref:{}]", id),
+                    MediaSource::External(ext) => {
+                        write!(output, "[{}:{}]", ext.provider, ext.key)
+                    }
                 };
-                output.push_str(&format!(
-                    "![{}]({})\n\n",
-                    media.alt_text.as_deref().unwrap_or(""),
-                    src
-                ));
+                output.push_str(")\n\n");
             }
             Content::Json { value, .. } => {
-                output.push_str("```json\n");
-                output.push_str(&value.to_string());
-                output.push_str("\n```\n\n");
+                let _ = write!(output, "```json\n{}\n```\n\n", value);
             }
             Content::Composite { children, .. } => {
-                output.push_str(&format!("[Composite: {} children]\n\n", children.len()));
+                let _ = write!(output, "[Composite: {} children]\n\n", children.len());
             }
             Content::Binary { mime_type, .. } => {
-                output.push_str(&format!("[Binary: {}]\n\n", mime_type));
+                let _ = write!(output, "[Binary: {}]\n\n", mime_type);
             }
         }
 
@@ -191,15 +193,9 @@ impl MarkdownRenderer {
 
     fn role_to_heading_level(&self, role: RoleCategory) -> Option<usize> {
         match role {
-            RoleCategory::Heading1 => Some(1),
-            RoleCategory::Heading2 => Some(2),
-            RoleCategory::Heading3 => Some(3),
-            RoleCategory::Heading4 => Some(4),
-            RoleCategory::Heading5 => Some(5),
-            RoleCategory::Heading6 => Some(6),
             RoleCategory::Title => Some(1),
             RoleCategory::Subtitle => Some(2),
-            _ => None,
+            _ => role.heading_level(),
         }
     }
 
@@ -226,8 +222,7 @@ impl MarkdownRenderer {
     ) {
         // Check for heading
         if let Some(level) = self.resolve_heading_level(explicit_role, depth) {
-            let hashes = "#".repeat(level);
-            output.push_str(&hashes);
+            output.extend(std::iter::repeat('#').take(level));
             output.push(' ');
             output.push_str(text);
             output.push_str("\n\n");
@@ -269,7 +264,7 @@ impl MarkdownRenderer {
         output.push('|');
         for cell in &header.cells {
             output.push(' ');
-            output.push_str(&cell_to_string(cell));
+            write_cell(cell, output);
             output.push_str(" |");
         }
         output.push('\n');
@@ -286,7 +281,7 @@ impl MarkdownRenderer {
             output.push('|');
             for cell in &row.cells {
                 output.push(' ');
-                output.push_str(&cell_to_string(cell));
+                write_cell(cell, output);
                 output.push_str(" |");
             }
             output.push('\n');
@@ -295,15 +290,17 @@ impl MarkdownRenderer {
     }
 }
 
-fn cell_to_string(cell: &Cell) -> String {
+fn write_cell(cell: &Cell, output: &mut String) {
     match cell {
-        Cell::Null => String::new(),
-        Cell::Text(s) => s.clone(),
-        Cell::Number(n) => n.to_string(),
-        Cell::Boolean(b) => b.to_string(),
-        Cell::Date(s) => s.clone(),
-        Cell::DateTime(s) => s.clone(),
-        Cell::Json(v) => v.to_string(),
+        Cell::Null => {}
+        Cell::Text(s) | Cell::Date(s) | Cell::DateTime(s) => output.push_str(s),
+        Cell::Number(n) => {
+            let _ = write!(output, "{}", n);
+        }
+        Cell::Boolean(b) => output.push_str(if *b { "true" } else { "false" }),
+        Cell::Json(v) => {
+            let _ = write!(output, "{}", v);
+        }
     }
 }
 
@@ -340,4 +337,19 @@ mod tests {
         assert!(md.contains("```rust"));
         assert!(md.contains("fn main()"));
     }
+
+    #[test]
+    fn test_render_table() {
+        let mut doc = Document::create();
+        let root = doc.root;
+        let rows = vec![
+            vec!["name".to_string(), "count".to_string()],
+            vec!["a".to_string(), "1".to_string()],
+        ];
+        doc.add_block(Block::new(Content::table(rows), None), &root)
+            .unwrap();
+
+        let md = MarkdownRenderer::new().render(&doc).unwrap();
+        assert_eq!(md, "| name | count |\n| --- | --- |\n| a | 1 |\n");
+    }
 }
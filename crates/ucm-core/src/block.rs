@@ -2,7 +2,7 @@
 
 use crate::content::Content;
 use crate::edge::Edge;
-use crate::id::{compute_content_hash, generate_block_id, BlockId};
+use crate::id::{compute_content_hash, generate_block_id_and_hash, BlockId};
 use crate::metadata::BlockMetadata;
 use crate::version::Version;
 use serde::{Deserialize, Serialize};
@@ -42,8 +42,7 @@ pub struct Block {
 impl Block {
     /// Create a new block with generated ID
     pub fn new(content: Content, semantic_role: Option<&str>) -> Self {
-        let id = generate_block_id(&content, semantic_role, None);
-        let content_hash = compute_content_hash(&content);
+        let (id, content_hash) = generate_block_id_and_hash(&content, semantic_role, None);
         let mut metadata = BlockMetadata::new(content_hash);
 
         if let Some(role) = semantic_role {
@@ -131,6 +130,15 @@ impl Block {
             .unwrap_or_else(|| crate::metadata::TokenEstimate::compute(&self.content))
     }
 
+    /// Get the estimated token count, storing it in the metadata so later
+    /// calls do not recompute it. Cleared again by `update_content`.
+    pub fn cache_token_estimate(&mut self) -> crate::metadata::TokenEstimate {
+        *self
+            .metadata
+            .token_estimate
+            .get_or_insert_with(|| crate::metadata::TokenEstimate::compute(&self.content))
+    }
+
     /// Get content size in bytes
     pub fn size_bytes(&self) -> usize {
         self.content.size_bytes()
@@ -139,8 +147,10 @@ impl Block {
     /// Update the content and regenerate ID
     pub fn update_content(&mut self, content: Content, semantic_role: Option<&str>) {
         self.content = content;
-        self.id = generate_block_id(&self.content, semantic_role, None);
-        self.metadata.content_hash = compute_content_hash(&self.content);
+        let (id, content_hash) = generate_block_id_and_hash(&self.content, semantic_role, None);
+        self.id = id;
+        self.metadata.content_hash = content_hash;
+        self.metadata.token_estimate = None;
         self.metadata.touch();
         self.version.increment();
     }
@@ -165,10 +175,32 @@ impl Block {
 
     /// Get edges of a specific type
     pub fn edges_of_type(&self, edge_type: &crate::edge::EdgeType) -> Vec<&Edge> {
-        self.edges
-            .iter()
-            .filter(|e| &e.edge_type == edge_type)
-            .collect()
+        self.iter_edges_of_type(edge_type).collect()
+    }
+
+    /// Iterate edges of a specific type without collecting them
+    pub fn iter_edges_of_type<'a, 'b>(
+        &'a self,
+        edge_type: &'b crate::edge::EdgeType,
+    ) -> impl Iterator<Item = &'a Edge> + 'b
+    where
+        'a: 'b,
+    {
+        self.edges.iter().filter(move |e| &e.edge_type == edge_type)
+    }
+
+    /// Check if the block has an edge to `target`, optionally restricted to one edge type.
+    ///
+    /// Stops at the first matching edge instead of collecting matches.
+    pub fn has_edge_to(&self, target: &BlockId, edge_type: Option<&crate::edge::EdgeType>) -> bool {
+        // Branch on the filter once rather than per edge
+        match edge_type {
+            Some(et) => self
+                .edges
+                .iter()
+                .any(|e| &e.target == target && &e.edge_type == et),
+            None => self.edges.iter().any(|e| &e.target == target),
+        }
     }
 
     /// Check if block has a specific tag
@@ -212,6 +244,16 @@ mod tests {
         assert!(block.edges.is_empty());
     }
 
+    #[test]
+    fn test_new_block_defaults_do_not_allocate() {
+        // Most parsed blocks never get tags or edges; their empty defaults
+        // must stay allocation-free.
+        let block = Block::new(Content::text("Leaf"), Some("paragraph"));
+        assert_eq!(block.edges.capacity(), 0);
+        assert_eq!(block.metadata.tags.capacity(), 0);
+        assert_eq!(block.metadata.custom.capacity(), 0);
+    }
+
     #[test]
     fn test_deterministic_id() {
         let block1 = Block::new(Content::text("Hello"), Some("intro"));
@@ -256,11 +298,36 @@ mod tests {
 
         assert_eq!(block.edges.len(), 1);
         assert_eq!(block.edges_of_type(&EdgeType::References).len(), 1);
+        assert_eq!(
+            block
+                .iter_edges_of_type(&EdgeType::References)
+                .map(|e| e.target)
+                .collect::<Vec<_>>(),
+            block
+                .edges_of_type(&EdgeType::References)
+                .into_iter()
+                .map(|e| e.target)
+                .collect::<Vec<_>>()
+        );
 
         block.remove_edge(&target_id, &EdgeType::References);
         assert!(block.edges.is_empty());
     }
 
+    #[test]
+    fn test_has_edge_to() {
+        let target_id = BlockId::from_bytes([1u8; 12]);
+        let other_id = BlockId::from_bytes([2u8; 12]);
+
+        let block = Block::new(Content::text("Test"), None)
+            .with_edge(Edge::new(EdgeType::References, target_id));
+
+        assert!(block.has_edge_to(&target_id, None));
+        assert!(block.has_edge_to(&target_id, Some(&EdgeType::References)));
+        assert!(!block.has_edge_to(&target_id, Some(&EdgeType::Supports)));
+        assert!(!block.has_edge_to(&other_id, None));
+    }
+
     #[test]
     fn test_update_content() {
         let mut block = Block::new(Content::text("Original"), Some("intro"));
@@ -272,4 +339,17 @@ mod tests {
         assert_ne!(block.id, original_id);
         assert!(block.version.counter > original_version);
     }
+
+    #[test]
+    fn test_cache_token_estimate() {
+        let mut block = Block::new(Content::text("a few words of text"), None);
+        assert!(block.metadata.token_estimate.is_none());
+
+        let estimate = block.cache_token_estimate();
+        assert_eq!(block.metadata.token_estimate, Some(estimate));
+        assert_eq!(block.token_estimate(), estimate);
+
+        block.update_content(Content::text("different"), None);
+        assert!(block.metadata.token_estimate.is_none());
+    }
 }
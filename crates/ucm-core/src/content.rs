@@ -159,7 +159,7 @@ impl Content {
                 MediaSource::Url(s) => s.len(),
                 _ => 32,
             },
-            Content::Json { value, .. } => value.to_string().len(),
+            Content::Json { value, .. } => json_size_bytes(value),
             Content::Binary { data, .. } => data.len(),
             Content::Composite { children, .. } => children.len() * 12,
         }
@@ -310,7 +310,7 @@ impl Cell {
             Cell::Boolean(_) => 1,
             Cell::Date(s) => s.len(),
             Cell::DateTime(s) => s.len(),
-            Cell::Json(v) => v.to_string().len(),
+            Cell::Json(v) => json_size_bytes(v),
         }
     }
 
@@ -404,7 +404,7 @@ impl Code {
     }
 
     pub fn line_count(&self) -> usize {
-        self.source.lines().count()
+        count_lines(&self.source)
     }
 
     pub fn get_lines(&self, start: usize, end: usize) -> Option<String> {
@@ -577,6 +577,41 @@ pub enum CompositeLayout {
     Tabs,
 }
 
+/// Number of lines in `text`, matching `text.lines().count()`.
+///
+/// Counts newline bytes directly instead of splitting out each line, so the
+/// scan is a single byte loop the compiler can vectorize.
+pub(crate) fn count_lines(text: &str) -> usize {
+    let newlines = text.bytes().filter(|&b| b == b'\n').count();
+    if text.is_empty() || text.ends_with('\n') {
+        newlines
+    } else {
+        newlines + 1
+    }
+}
+
+/// Length of the compact JSON encoding of `value`, measured without building the string.
+fn json_size_bytes(value: &serde_json::Value) -> usize {
+    struct ByteCounter(usize);
+
+    impl std::io::Write for ByteCounter {
+        fn write(&mut self, buf: &[u8]) -> std::io::Result<usize> {
+            self.0 += buf.len();
+            Ok(buf.len())
+        }
+
+        fn flush(&mut self) -> std::io::Result<()> {
+            Ok(())
+        }
+    }
+
+    let mut counter = ByteCounter(0);
+    match serde_json::to_writer(&mut counter, value) {
+        Ok(()) => counter.0,
+        Err(_) => 0,
+    }
+}
+
 // Base64 serde helper
 mod base64_serde {
     use base64::{engine::general_purpose::STANDARD, Engine as _};
@@ -638,6 +673,21 @@ mod tests {
         let code = Code::new("rust", "line1\nline2\nline3\nline4");
         assert_eq!(code.line_count(), 4);
         assert_eq!(code.get_lines(2, 3), Some("line2\nline3".to_string()));
+
+        for text in ["", "a", "a\n", "a\n\nb", "a\r\nb\r\n", "\n\n"] {
+            assert_eq!(count_lines(text), text.lines().count(), "{text:?}");
+        }
+    }
+
+    #[test]
+    fn test_json_size_bytes_matches_serialized_length() {
+        let value = serde_json::json!({"name": "caf\u{e9}", "tags": ["a", "b"], "n": 1.5});
+        let content = Content::json(value.clone());
+        assert_eq!(content.size_bytes(), value.to_string().len());
+        assert_eq!(
+            Cell::Json(value.clone()).size_bytes(),
+            value.to_string().len()
+        );
     }
 
     #[test]
@@ -4,7 +4,7 @@ use crate::block::{Block, BlockState};
 use crate::edge::EdgeIndex;
 use crate::error::{Error, ErrorCode, Result, ValidationIssue};
 use crate::id::BlockId;
-use crate::metadata::TokenModel;
+use crate::metadata::{SemanticRole, TokenModel};
 use crate::version::DocumentVersion;
 use chrono::{DateTime, Utc};
 use serde::{Deserialize, Serialize};
@@ -107,22 +107,16 @@ impl DocumentIndices {
 
         // Index by tags
         for tag in &block.metadata.tags {
-            self.by_tag.entry(tag.clone()).or_default().insert(*id);
+            index_insert(&mut self.by_tag, tag, *id);
         }
 
         // Index by semantic role
         if let Some(role) = &block.metadata.semantic_role {
-            self.by_role
-                .entry(role.category.as_str().to_string())
-                .or_default()
-                .insert(*id);
+            index_insert(&mut self.by_role, role.category.as_str(), *id);
         }
 
         // Index by content type
-        self.by_content_type
-            .entry(block.content_type().to_string())
-            .or_default()
-            .insert(*id);
+        index_insert(&mut self.by_content_type, block.content_type(), *id);
 
         // Index by label
         if let Some(label) = &block.metadata.label {
@@ -186,6 +180,18 @@ impl DocumentIndices {
     }
 }
 
+/// Add `id` under `key`, allocating the owned key only the first time it is seen.
+///
+/// Almost every block lands in an existing bucket (most are text, most share a
+/// handful of roles), so the common case is a lookup with no `String` built.
+fn index_insert(index: &mut HashMap<String, HashSet<BlockId>>, key: &str, id: BlockId) {
+    if let Some(set) = index.get_mut(key) {
+        set.insert(id);
+    } else {
+        index.insert(key.to_string(), HashSet::from([id]));
+    }
+}
+
 /// Canonical JSON-safe representation of a [`Document`].
 ///
 /// This is the shared storage/interchange form for UCP documents and graph-backed
@@ -231,7 +237,7 @@ impl PortableDocument {
         let root =
             BlockId::from_str(&self.root).map_err(|_| Error::InvalidBlockId(self.root.clone()))?;
 
-        let mut structure = HashMap::new();
+        let mut structure = HashMap::with_capacity(self.structure.len());
         for (parent, children) in &self.structure {
             let parent_id =
                 BlockId::from_str(parent).map_err(|_| Error::InvalidBlockId(parent.clone()))?;
@@ -244,7 +250,7 @@ impl PortableDocument {
             structure.insert(parent_id, parsed_children);
         }
 
-        let mut blocks = HashMap::new();
+        let mut blocks = HashMap::with_capacity(self.blocks.len());
         for (id, block) in &self.blocks {
             let block_id = BlockId::from_str(id).map_err(|_| Error::InvalidBlockId(id.clone()))?;
             blocks.insert(block_id, block.clone());
@@ -331,6 +337,16 @@ impl Document {
         portable.to_document()
     }
 
+    /// Reserve capacity for at least `additional` more blocks.
+    ///
+    /// Bulk builders (parsers, importers) that know roughly how many blocks they
+    /// will insert can call this up front so the block and structure maps grow
+    /// once instead of rehashing repeatedly during construction.
+    pub fn reserve(&mut self, additional: usize) {
+        self.blocks.reserve(additional);
+        self.structure.reserve(additional);
+    }
+
     /// Set document metadata
     pub fn with_metadata(mut self, metadata: DocumentMetadata) -> Self {
         self.metadata = metadata;
@@ -347,6 +363,44 @@ impl Document {
         self.blocks.get_mut(id)
     }
 
+    /// Add a tag to a block, keeping the tag index in sync.
+    ///
+    /// Returns `false` if the block already had the tag.
+    pub fn add_tag(&mut self, id: &BlockId, tag: &str) -> Result<bool> {
+        let block = self
+            .blocks
+            .get_mut(id)
+            .ok_or_else(|| Error::BlockNotFound(id.to_string()))?;
+        if block.metadata.tags.iter().any(|t| t == tag) {
+            return Ok(false);
+        }
+        block.metadata.tags.push(tag.to_string());
+        index_insert(&mut self.indices.by_tag, tag, *id);
+        Ok(true)
+    }
+
+    /// Remove a tag from a block, keeping the tag index in sync.
+    ///
+    /// Returns `false` if the block did not have the tag.
+    pub fn remove_tag(&mut self, id: &BlockId, tag: &str) -> Result<bool> {
+        let block = self
+            .blocks
+            .get_mut(id)
+            .ok_or_else(|| Error::BlockNotFound(id.to_string()))?;
+        let len_before = block.metadata.tags.len();
+        block.metadata.tags.retain(|t| t != tag);
+        if block.metadata.tags.len() == len_before {
+            return Ok(false);
+        }
+        if let Some(set) = self.indices.by_tag.get_mut(tag) {
+            set.remove(id);
+            if set.is_empty() {
+                self.indices.by_tag.remove(tag);
+            }
+        }
+        Ok(true)
+    }
+
     /// Get children of a block
     pub fn children(&self, parent: &BlockId) -> &[BlockId] {
         self.structure
@@ -424,6 +478,42 @@ impl Document {
         Ok(id)
     }
 
+    /// Append several blocks under the same parent, in order.
+    ///
+    /// Equivalent to calling `add_block` for each block, but the block map
+    /// and the parent's child list grow once for the whole batch.
+    pub fn add_blocks(
+        &mut self,
+        blocks: impl IntoIterator<Item = Block>,
+        parent: &BlockId,
+    ) -> Result<Vec<BlockId>> {
+        if !self.blocks.contains_key(parent) {
+            return Err(Error::BlockNotFound(parent.to_string()));
+        }
+
+        let blocks = blocks.into_iter();
+        let mut ids = Vec::with_capacity(blocks.size_hint().0);
+        self.blocks.reserve(ids.capacity());
+
+        for block in blocks {
+            let id = block.id;
+            for edge in &block.edges {
+                self.edge_index.add_edge(&id, edge);
+            }
+            self.indices.index_block(&block);
+            self.blocks.insert(id, block);
+            ids.push(id);
+        }
+
+        self.structure
+            .entry(*parent)
+            .or_default()
+            .extend_from_slice(&ids);
+
+        self.touch();
+        Ok(ids)
+    }
+
     /// Add an edge between two blocks (wrapper for edge_index)
     pub fn add_edge(
         &mut self,
@@ -431,10 +521,11 @@ impl Document {
         edge_type: crate::edge::EdgeType,
         target: BlockId,
     ) {
-        let edge = crate::edge::Edge::new(edge_type, target);
         if let Some(block) = self.blocks.get_mut(source) {
-            block.edges.push(edge.clone());
+            let edge = crate::edge::Edge::new(edge_type, target);
+            // Index first so the edge can be moved into the block without a clone.
             self.edge_index.add_edge(source, &edge);
+            block.edges.push(edge);
         }
     }
 
@@ -480,21 +571,38 @@ impl Document {
 
     /// Delete a block and all its descendants
     pub fn delete_cascade(&mut self, id: &BlockId) -> Result<Vec<Block>> {
-        let descendants = self.descendants(id);
-        let mut deleted = Vec::new();
-
         // Delete in reverse order (children first)
-        for desc_id in descendants.into_iter().rev() {
-            if let Ok(block) = self.delete_block(&desc_id) {
+        let mut ids = self.descendants(id);
+        ids.reverse();
+        ids.push(*id);
+
+        Ok(self.delete_many(&ids))
+    }
+
+    /// Delete a set of blocks, skipping ids that are not in the document.
+    ///
+    /// Detaches all of them in one pass over `structure`, where calling
+    /// `delete_block` per id would rescan every child list for each block.
+    fn delete_many(&mut self, ids: &[BlockId]) -> Vec<Block> {
+        let doomed: HashSet<&BlockId> = ids.iter().collect();
+        for children in self.structure.values_mut() {
+            children.retain(|c| !doomed.contains(c));
+        }
+
+        let mut deleted = Vec::with_capacity(ids.len());
+        for id in ids {
+            self.structure.remove(id);
+            self.edge_index.remove_block(id);
+            if let Some(block) = self.blocks.remove(id) {
+                self.indices.remove_block(&block);
                 deleted.push(block);
             }
         }
 
-        if let Ok(block) = self.delete_block(id) {
-            deleted.push(block);
+        if !deleted.is_empty() {
+            self.touch();
         }
-
-        Ok(deleted)
+        deleted
     }
 
     /// Move a block to a new parent
@@ -606,17 +714,61 @@ impl Document {
     }
 
     /// Check if a block is an ancestor of another
+    ///
+    /// Walks up from `block` through a parent map built once, so the check is
+    /// one scan of `structure` plus O(depth) lookups rather than one `parent()`
+    /// scan per level.
     pub fn is_ancestor(&self, potential_ancestor: &BlockId, block: &BlockId) -> bool {
-        let mut current = Some(*block);
-        while let Some(id) = current {
-            if &id == potential_ancestor {
+        if potential_ancestor == block {
+            return true;
+        }
+        let parents = self.parent_map();
+        let mut current = block;
+        let mut steps = 0;
+        while let Some(parent) = parents.get(current) {
+            if *parent == potential_ancestor {
                 return true;
             }
-            current = self.parent(&id).cloned();
+            // A malformed structure could loop; never walk more steps than blocks.
+            steps += 1;
+            if steps >= self.blocks.len() {
+                break;
+            }
+            current = parent;
         }
         false
     }
 
+    /// Child-to-parent map built in a single pass over `structure`.
+    fn parent_map(&self) -> HashMap<&BlockId, &BlockId> {
+        let mut parents: HashMap<&BlockId, &BlockId> = HashMap::with_capacity(self.blocks.len());
+        for (parent, children) in &self.structure {
+            for child in children {
+                parents.insert(child, parent);
+            }
+        }
+        parents
+    }
+
+    /// Get the ancestors of a block, nearest parent first and ending at the root.
+    ///
+    /// Builds the child-to-parent map in a single pass over `structure`, so the
+    /// whole chain costs one scan instead of one `parent()` scan per level.
+    pub fn ancestors(&self, id: &BlockId) -> Vec<BlockId> {
+        let parents = self.parent_map();
+        let mut result = Vec::new();
+        let mut current = id;
+        while let Some(parent) = parents.get(current) {
+            // A malformed structure could loop; never walk more steps than blocks.
+            if result.len() >= self.blocks.len() {
+                break;
+            }
+            result.push(**parent);
+            current = parent;
+        }
+        result
+    }
+
     /// Get all descendants of a block
     pub fn descendants(&self, id: &BlockId) -> Vec<BlockId> {
         let mut result = Vec::new();
@@ -659,17 +811,11 @@ impl Document {
 
     /// Find all orphaned blocks
     pub fn find_orphans(&self) -> Vec<BlockId> {
-        let mut reachable = HashSet::new();
-        let mut stack = vec![self.root];
-
-        while let Some(current) = stack.pop() {
-            if reachable.insert(current) {
-                if let Some(children) = self.structure.get(&current) {
-                    stack.extend(children.iter().cloned());
-                }
-            }
-        }
+        let (reachable, _) = self.walk_structure();
+        self.orphans_given(&reachable)
+    }
 
+    fn orphans_given(&self, reachable: &HashSet<BlockId>) -> Vec<BlockId> {
         self.blocks
             .keys()
             .filter(|id| !reachable.contains(*id))
@@ -677,6 +823,38 @@ impl Document {
             .collect()
     }
 
+    /// Walk the structure from the root once, returning the reachable blocks
+    /// and whether any child link points back to a block on the current path.
+    ///
+    /// Iterative so deep documents cannot overflow the stack.
+    fn walk_structure(&self) -> (HashSet<BlockId>, bool) {
+        let mut reachable = HashSet::from([self.root]);
+        let mut on_path = HashSet::from([self.root]);
+        let mut stack = vec![(self.root, 0usize)];
+        let mut has_cycle = false;
+
+        while let Some((node, next)) = stack.last_mut() {
+            let node = *node;
+            match self.children(&node).get(*next) {
+                Some(child) => {
+                    *next += 1;
+                    if on_path.contains(child) {
+                        has_cycle = true;
+                    } else if reachable.insert(*child) {
+                        on_path.insert(*child);
+                        stack.push((*child, 0));
+                    }
+                }
+                None => {
+                    on_path.remove(&node);
+                    stack.pop();
+                }
+            }
+        }
+
+        (reachable, has_cycle)
+    }
+
     /// Get block state
     pub fn block_state(&self, id: &BlockId) -> BlockState {
         if !self.blocks.contains_key(id) {
@@ -691,15 +869,40 @@ impl Document {
     /// Prune unreachable blocks
     pub fn prune_unreachable(&mut self) -> Vec<Block> {
         let orphans = self.find_orphans();
-        let mut pruned = Vec::new();
+        self.delete_many(&orphans)
+    }
 
-        for id in orphans {
-            if let Ok(block) = self.delete_block(&id) {
-                pruned.push(block);
-            }
+    /// Find blocks whose semantic role renders exactly as `role` (e.g. `"heading2"`, `"intro.hook"`).
+    ///
+    /// Canonical roles are looked up through the role-category index and then
+    /// compared structurally, so only blocks sharing the category are visited.
+    pub fn find_by_role(&self, role: &str) -> Vec<BlockId> {
+        // Only trust the parsed form when it round-trips; otherwise fall back to
+        // comparing rendered strings so non-canonical input keeps exact-match semantics.
+        match SemanticRole::parse(role).filter(|r| r.to_string() == role) {
+            Some(wanted) => self
+                .indices
+                .by_role
+                .get(wanted.category.as_str())
+                .into_iter()
+                .flatten()
+                .filter_map(|id| self.blocks.get(id))
+                .filter(|block| block.metadata.semantic_role.as_ref() == Some(&wanted))
+                .map(|block| block.id)
+                .collect(),
+            None => self
+                .blocks
+                .values()
+                .filter(|block| {
+                    block
+                        .metadata
+                        .semantic_role
+                        .as_ref()
+                        .is_some_and(|block_role| block_role.to_string() == role)
+                })
+                .map(|block| block.id)
+                .collect(),
         }
-
-        pruned
     }
 
     /// Get total block count
@@ -719,9 +922,11 @@ impl Document {
     pub fn validate(&self) -> Vec<ValidationIssue> {
         let mut issues = Vec::new();
 
+        // Orphans and cycles both come from the same walk over the structure
+        let (reachable, has_cycle) = self.walk_structure();
+
         // Check for orphans
-        let orphans = self.find_orphans();
-        for orphan in orphans {
+        for orphan in self.orphans_given(&reachable) {
             issues.push(ValidationIssue::warning(
                 ErrorCode::E203OrphanedBlock,
                 format!("Block {} is unreachable from root", orphan),
@@ -729,7 +934,7 @@ impl Document {
         }
 
         // Check for cycles
-        if self.has_cycles() {
+        if has_cycle {
             issues.push(ValidationIssue::error(
                 ErrorCode::E201CycleDetected,
                 "Document structure contains a cycle",
@@ -754,39 +959,6 @@ impl Document {
         issues
     }
 
-    /// Check for cycles in structure
-    fn has_cycles(&self) -> bool {
-        let mut visited = HashSet::new();
-        let mut rec_stack = HashSet::new();
-
-        fn dfs(
-            node: &BlockId,
-            structure: &HashMap<BlockId, Vec<BlockId>>,
-            visited: &mut HashSet<BlockId>,
-            rec_stack: &mut HashSet<BlockId>,
-        ) -> bool {
-            visited.insert(*node);
-            rec_stack.insert(*node);
-
-            if let Some(children) = structure.get(node) {
-                for child in children {
-                    if !visited.contains(child) {
-                        if dfs(child, structure, visited, rec_stack) {
-                            return true;
-                        }
-                    } else if rec_stack.contains(child) {
-                        return true;
-                    }
-                }
-            }
-
-            rec_stack.remove(node);
-            false
-        }
-
-        dfs(&self.root, &self.structure, &mut visited, &mut rec_stack)
-    }
-
     /// Touch document (update modified timestamp and version)
     fn touch(&mut self) {
         self.metadata.touch();
@@ -829,6 +1001,27 @@ mod tests {
         assert!(doc.is_reachable(&id));
     }
 
+    #[test]
+    fn test_add_blocks() {
+        let mut doc = Document::create();
+        let root = doc.root;
+        let first = doc
+            .add_block(Block::new(Content::text("First"), None), &root)
+            .unwrap();
+
+        let blocks = (0..4).map(|i| Block::new(Content::text(format!("Block {i}")), None));
+        let ids = doc.add_blocks(blocks, &root).unwrap();
+
+        assert_eq!(ids.len(), 4);
+        assert_eq!(doc.block_count(), 6);
+        assert_eq!(doc.children(&root)[0], first);
+        assert_eq!(&doc.children(&root)[1..], &ids[..]);
+        assert!(ids.iter().all(|id| doc.is_reachable(id)));
+
+        let missing = BlockId::from_bytes([9u8; 12]);
+        assert!(doc.add_blocks(Vec::new(), &missing).is_err());
+    }
+
     #[test]
     fn test_move_block() {
         let mut doc = Document::create();
@@ -867,6 +1060,38 @@ mod tests {
         // Try to move A under B (would create cycle)
         let result = doc.move_block(&a, &b);
         assert!(result.is_err());
+
+        // Moving a block under itself is also a cycle
+        assert!(doc.move_block(&b, &b).is_err());
+        assert!(doc.is_ancestor(&root, &b));
+        assert!(!doc.is_ancestor(&b, &a));
+
+        // Siblings can still be moved under each other
+        let c = doc
+            .add_block(Block::new(Content::text("C"), None), &root)
+            .unwrap();
+        doc.move_block(&c, &b).unwrap();
+        assert_eq!(doc.ancestors(&c), vec![b, a, root]);
+    }
+
+    #[test]
+    fn test_ancestors() {
+        let mut doc = Document::create();
+        let root = doc.root;
+
+        let a = doc
+            .add_block(Block::new(Content::text("A"), None), &root)
+            .unwrap();
+        let b = doc
+            .add_block(Block::new(Content::text("B"), None), &a)
+            .unwrap();
+        let c = doc
+            .add_block(Block::new(Content::text("C"), None), &b)
+            .unwrap();
+
+        assert_eq!(doc.ancestors(&c), vec![b, a, root]);
+        assert_eq!(doc.ancestors(&a), vec![root]);
+        assert!(doc.ancestors(&root).is_empty());
     }
 
     #[test]
@@ -883,6 +1108,50 @@ mod tests {
         assert_eq!(doc.find_orphans(), vec![id]);
     }
 
+    #[test]
+    fn test_prune_without_orphans_keeps_version() {
+        let mut doc = Document::create();
+        let root = doc.root;
+        doc.add_block(Block::new(Content::text("Test"), None), &root)
+            .unwrap();
+
+        let version = doc.version.counter;
+        assert!(doc.prune_unreachable().is_empty());
+        assert_eq!(doc.version.counter, version);
+
+        let missing = BlockId::from_bytes([7u8; 12]);
+        assert!(doc.delete_cascade(&missing).unwrap().is_empty());
+        assert_eq!(doc.version.counter, version);
+    }
+
+    #[test]
+    fn test_validate_reports_cycles_and_orphans() {
+        let mut doc = Document::create();
+        let root = doc.root;
+
+        let a = doc
+            .add_block(Block::new(Content::text("A"), None), &root)
+            .unwrap();
+        let b = doc
+            .add_block(Block::new(Content::text("B"), None), &a)
+            .unwrap();
+        // A shared child is not a cycle
+        doc.structure.get_mut(&root).unwrap().push(b);
+        assert!(doc.validate().is_empty());
+
+        doc.structure.entry(b).or_default().push(a);
+        let orphan = doc
+            .add_block(Block::new(Content::text("Orphan"), None), &root)
+            .unwrap();
+        doc.remove_from_structure(&orphan);
+
+        let codes: Vec<ErrorCode> = doc.validate().into_iter().map(|i| i.code).collect();
+        assert_eq!(
+            codes,
+            vec![ErrorCode::E203OrphanedBlock, ErrorCode::E201CycleDetected]
+        );
+    }
+
     #[test]
     fn test_cascade_delete() {
         let mut doc = Document::create();
@@ -891,18 +1160,64 @@ mod tests {
         let parent = doc
             .add_block(Block::new(Content::text("Parent"), None), &root)
             .unwrap();
-        let _child1 = doc
+        let child1 = doc
             .add_block(Block::new(Content::text("Child 1"), None), &parent)
             .unwrap();
         let _child2 = doc
             .add_block(Block::new(Content::text("Child 2"), None), &parent)
             .unwrap();
+        let sibling = doc
+            .add_block(Block::new(Content::text("Sibling"), None), &root)
+            .unwrap();
+        doc.add_edge(&sibling, crate::edge::EdgeType::References, child1);
 
-        assert_eq!(doc.block_count(), 4);
+        assert_eq!(doc.block_count(), 5);
 
         let deleted = doc.delete_cascade(&parent).unwrap();
         assert_eq!(deleted.len(), 3); // parent + 2 children
-        assert_eq!(doc.block_count(), 1); // just root
+        assert_eq!(deleted.last().map(|b| b.id), Some(parent));
+        assert_eq!(doc.block_count(), 2); // root + sibling
+        assert_eq!(doc.children(&root), &[sibling]);
+        assert!(!doc.structure.contains_key(&parent));
+        assert!(doc.edge_index.outgoing_from(&sibling).is_empty());
+    }
+
+    #[test]
+    fn test_reserve_keeps_document_intact() {
+        let mut doc = Document::create();
+        let root = doc.root;
+        doc.reserve(64);
+        assert!(doc.blocks.capacity() >= 65);
+
+        let id = doc
+            .add_block(Block::new(Content::text("Reserved"), None), &root)
+            .unwrap();
+        assert_eq!(doc.block_count(), 2);
+        assert!(doc.is_reachable(&id));
+    }
+
+    #[test]
+    fn test_find_by_role() {
+        let mut doc = Document::create();
+        let root = doc.root;
+
+        let heading = doc
+            .add_block(Block::new(Content::text("Title"), Some("heading1")), &root)
+            .unwrap();
+        let hook = doc
+            .add_block(Block::new(Content::text("Hook"), Some("intro.hook")), &root)
+            .unwrap();
+        doc.add_block(Block::new(Content::text("Plain"), None), &root)
+            .unwrap();
+
+        assert_eq!(doc.find_by_role("heading1"), vec![heading]);
+        assert_eq!(doc.find_by_role("intro.hook"), vec![hook]);
+        assert!(doc.find_by_role("intro").is_empty());
+        // Aliases are not canonical renderings, so they do not match.
+        assert!(doc.find_by_role("h1").is_empty());
+
+        doc.delete_block(&heading).unwrap();
+        assert!(doc.find_by_role("heading1").is_empty());
     }
 
     #[test]
@@ -917,5 +1232,21 @@ mod tests {
 
         assert!(doc.indices.find_by_tag("important").contains(&id));
         assert_eq!(doc.indices.find_by_label("My Block"), Some(id));
+
+        // Tag edits go through the document so the tag index follows them
+        assert!(doc.add_tag(&id, "reviewed").unwrap());
+        assert!(!doc.add_tag(&id, "reviewed").unwrap());
+        assert!(doc.indices.find_by_tag("reviewed").contains(&id));
+        assert!(doc.remove_tag(&id, "reviewed").unwrap());
+        assert!(!doc.remove_tag(&id, "reviewed").unwrap());
+        assert!(!doc.indices.by_tag.contains_key("reviewed"));
+        assert!(doc.get_block(&id).unwrap().has_tag("important"));
+
+        // A second block of the same type joins the existing bucket
+        let other = doc
+            .add_block(Block::new(Content::text("Other"), None), &root)
+            .unwrap();
+        let text_blocks = doc.indices.find_by_type("text");
+        assert!(text_blocks.contains(&id) && text_blocks.contains(&other));
     }
 }
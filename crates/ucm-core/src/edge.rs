@@ -6,6 +6,7 @@
 use crate::id::BlockId;
 use chrono::{DateTime, Utc};
 use serde::{Deserialize, Serialize};
+use std::borrow::Cow;
 use std::collections::HashMap;
 use std::error::Error as StdError;
 use std::fmt;
@@ -42,9 +43,9 @@ impl Edge {
         self
     }
 
-    /// Add confidence score
+    /// Add confidence score, clamped to 0.0 - 1.0
     pub fn with_confidence(mut self, confidence: f32) -> Self {
-        self.metadata.confidence = Some(confidence);
+        self.metadata.confidence = Some(confidence.clamp(0.0, 1.0));
         self
     }
 
@@ -161,56 +162,71 @@ impl FromStr for EdgeType {
     type Err = EdgeTypeParseError;
 
     fn from_str(s: &str) -> std::result::Result<Self, Self::Err> {
-        match s.to_lowercase().as_str() {
-            "derived_from" => Ok(EdgeType::DerivedFrom),
-            "supersedes" => Ok(EdgeType::Supersedes),
-            "transformed_from" => Ok(EdgeType::TransformedFrom),
-            "references" => Ok(EdgeType::References),
-            "cited_by" => Ok(EdgeType::CitedBy),
-            "links_to" => Ok(EdgeType::LinksTo),
-            "supports" => Ok(EdgeType::Supports),
-            "contradicts" => Ok(EdgeType::Contradicts),
-            "elaborates" => Ok(EdgeType::Elaborates),
-            "summarizes" => Ok(EdgeType::Summarizes),
-            "parent_of" => Ok(EdgeType::ParentOf),
-            "child_of" => Ok(EdgeType::ChildOf),
-            "sibling_of" => Ok(EdgeType::SiblingOf),
-            "previous_sibling" => Ok(EdgeType::PreviousSibling),
-            "next_sibling" => Ok(EdgeType::NextSibling),
-            "version_of" => Ok(EdgeType::VersionOf),
-            "alternative_of" => Ok(EdgeType::AlternativeOf),
-            "translation_of" => Ok(EdgeType::TranslationOf),
-            s if s.starts_with("custom:") => Ok(EdgeType::Custom(
+        // Names are nearly always given in canonical lowercase already, so
+        // only allocate a lowercased copy when the input needs it
+        let parsed = if s.bytes().all(|b| b.is_ascii() && !b.is_ascii_uppercase()) {
+            EdgeType::parse_lowercase(s)
+        } else {
+            EdgeType::parse_lowercase(&s.to_lowercase())
+        };
+        // Report the name as the caller wrote it, not the lowercased copy
+        parsed.ok_or_else(|| EdgeTypeParseError(s.to_string()))
+    }
+}
+
+impl EdgeType {
+    /// Parse an already lowercased edge type name
+    fn parse_lowercase(s: &str) -> Option<Self> {
+        match s {
+            "derived_from" => Some(EdgeType::DerivedFrom),
+            "supersedes" => Some(EdgeType::Supersedes),
+            "transformed_from" => Some(EdgeType::TransformedFrom),
+            "references" => Some(EdgeType::References),
+            "cited_by" => Some(EdgeType::CitedBy),
+            "links_to" => Some(EdgeType::LinksTo),
+            "supports" => Some(EdgeType::Supports),
+            "contradicts" => Some(EdgeType::Contradicts),
+            "elaborates" => Some(EdgeType::Elaborates),
+            "summarizes" => Some(EdgeType::Summarizes),
+            "parent_of" => Some(EdgeType::ParentOf),
+            "child_of" => Some(EdgeType::ChildOf),
+            "sibling_of" => Some(EdgeType::SiblingOf),
+            "previous_sibling" => Some(EdgeType::PreviousSibling),
+            "next_sibling" => Some(EdgeType::NextSibling),
+            "version_of" => Some(EdgeType::VersionOf),
+            "alternative_of" => Some(EdgeType::AlternativeOf),
+            "translation_of" => Some(EdgeType::TranslationOf),
+            s if s.starts_with("custom:") => Some(EdgeType::Custom(
                 s.strip_prefix("custom:").unwrap().to_string(),
             )),
-            _ => Err(EdgeTypeParseError(s.to_string())),
+            _ => None,
         }
     }
-}
 
-impl EdgeType {
     /// Convert to string
-    pub fn as_str(&self) -> String {
+    ///
+    /// Built-in types borrow a static name; only custom types allocate.
+    pub fn as_str(&self) -> Cow<'static, str> {
         match self {
-            EdgeType::DerivedFrom => "derived_from".to_string(),
-            EdgeType::Supersedes => "supersedes".to_string(),
-            EdgeType::TransformedFrom => "transformed_from".to_string(),
-            EdgeType::References => "references".to_string(),
-            EdgeType::CitedBy => "cited_by".to_string(),
-            EdgeType::LinksTo => "links_to".to_string(),
-            EdgeType::Supports => "supports".to_string(),
-            EdgeType::Contradicts => "contradicts".to_string(),
-            EdgeType::Elaborates => "elaborates".to_string(),
-            EdgeType::Summarizes => "summarizes".to_string(),
-            EdgeType::ParentOf => "parent_of".to_string(),
-            EdgeType::ChildOf => "child_of".to_string(),
-            EdgeType::SiblingOf => "sibling_of".to_string(),
-            EdgeType::PreviousSibling => "previous_sibling".to_string(),
-            EdgeType::NextSibling => "next_sibling".to_string(),
-            EdgeType::VersionOf => "version_of".to_string(),
-            EdgeType::AlternativeOf => "alternative_of".to_string(),
-            EdgeType::TranslationOf => "translation_of".to_string(),
-            EdgeType::Custom(name) => format!("custom:{}", name),
+            EdgeType::DerivedFrom => Cow::Borrowed("derived_from"),
+            EdgeType::Supersedes => Cow::Borrowed("supersedes"),
+            EdgeType::TransformedFrom => Cow::Borrowed("transformed_from"),
+            EdgeType::References => Cow::Borrowed("references"),
+            EdgeType::CitedBy => Cow::Borrowed("cited_by"),
+            EdgeType::LinksTo => Cow::Borrowed("links_to"),
+            EdgeType::Supports => Cow::Borrowed("supports"),
+            EdgeType::Contradicts => Cow::Borrowed("contradicts"),
+            EdgeType::Elaborates => Cow::Borrowed("elaborates"),
+            EdgeType::Summarizes => Cow::Borrowed("summarizes"),
+            EdgeType::ParentOf => Cow::Borrowed("parent_of"),
+            EdgeType::ChildOf => Cow::Borrowed("child_of"),
+            EdgeType::SiblingOf => Cow::Borrowed("sibling_of"),
+            EdgeType::PreviousSibling => Cow::Borrowed("previous_sibling"),
+            EdgeType::NextSibling => Cow::Borrowed("next_sibling"),
+            EdgeType::VersionOf => Cow::Borrowed("version_of"),
+            EdgeType::AlternativeOf => Cow::Borrowed("alternative_of"),
+            EdgeType::TranslationOf => Cow::Borrowed("translation_of"),
+            EdgeType::Custom(name) => Cow::Owned(format!("custom:{}", name)),
         }
     }
 }
@@ -261,6 +277,8 @@ pub struct EdgeIndex {
     outgoing: HashMap<BlockId, Vec<(EdgeType, BlockId)>>,
     /// Incoming edges: target -> [(type, source)]
     incoming: HashMap<BlockId, Vec<(EdgeType, BlockId)>>,
+    /// Edge types by (source, target), for constant-time existence checks
+    pairs: HashMap<(BlockId, BlockId), Vec<EdgeType>>,
 }
 
 impl EdgeIndex {
@@ -270,6 +288,11 @@ impl EdgeIndex {
 
     /// Add an edge to the index
     pub fn add_edge(&mut self, source: &BlockId, edge: &Edge) {
+        self.pairs
+            .entry((*source, edge.target))
+            .or_default()
+            .push(edge.edge_type.clone());
+
         // Add to outgoing
         self.outgoing
             .entry(*source)
@@ -293,6 +316,14 @@ impl EdgeIndex {
 
     /// Remove an edge from the index
     pub fn remove_edge(&mut self, source: &BlockId, target: &BlockId, edge_type: &EdgeType) {
+        let key = (*source, *target);
+        if let Some(types) = self.pairs.get_mut(&key) {
+            types.retain(|t| t != edge_type);
+            if types.is_empty() {
+                self.pairs.remove(&key);
+            }
+        }
+
         if let Some(edges) = self.outgoing.get_mut(source) {
             edges.retain(|(t, tgt)| !(t == edge_type && tgt == target));
             if edges.is_empty() {
@@ -300,9 +331,12 @@ impl EdgeIndex {
             }
         }
 
-        let incoming_type = edge_type.inverse().unwrap_or_else(|| edge_type.clone());
+        // Borrow the edge type when it has no inverse instead of cloning it
+        // (custom edge types carry an owned name).
+        let inverse = edge_type.inverse();
+        let incoming_type = inverse.as_ref().unwrap_or(edge_type);
         if let Some(edges) = self.incoming.get_mut(target) {
-            edges.retain(|(t, src)| !(t == &incoming_type && src == source));
+            edges.retain(|(t, src)| !(t == incoming_type && src == source));
             if edges.is_empty() {
                 self.incoming.remove(target);
             }
@@ -313,10 +347,13 @@ impl EdgeIndex {
     pub fn remove_block(&mut self, block_id: &BlockId) {
         // Remove outgoing edges
         if let Some(edges) = self.outgoing.remove(block_id) {
-            for (edge_type, target) in edges {
-                let _incoming_type = edge_type.inverse().unwrap_or(edge_type);
+            for (_, target) in edges {
+                self.pairs.remove(&(*block_id, target));
                 if let Some(incoming) = self.incoming.get_mut(&target) {
                     incoming.retain(|(_, src)| src != block_id);
+                    if incoming.is_empty() {
+                        self.incoming.remove(&target);
+                    }
                 }
             }
         }
@@ -324,8 +361,12 @@ impl EdgeIndex {
         // Remove incoming edges
         if let Some(edges) = self.incoming.remove(block_id) {
             for (_, source) in edges {
+                self.pairs.remove(&(source, *block_id));
                 if let Some(outgoing) = self.outgoing.get_mut(&source) {
                     outgoing.retain(|(_, tgt)| tgt != block_id);
+                    if outgoing.is_empty() {
+                        self.outgoing.remove(&source);
+                    }
                 }
             }
         }
@@ -376,11 +417,18 @@ impl EdgeIndex {
     }
 
     /// Check if an edge exists
+    ///
+    /// A single hash lookup on the (source, target) pair; only the edge types
+    /// between those two blocks are compared, never the full adjacency list.
     pub fn has_edge(&self, source: &BlockId, target: &BlockId, edge_type: &EdgeType) -> bool {
-        self.outgoing
-            .get(source)
-            .map(|edges| edges.iter().any(|(t, tgt)| t == edge_type && tgt == target))
-            .unwrap_or(false)
+        self.pairs
+            .get(&(*source, *target))
+            .is_some_and(|types| types.contains(edge_type))
+    }
+
+    /// Check if any edge, of any type, goes from `source` to `target`
+    pub fn has_edge_between(&self, source: &BlockId, target: &BlockId) -> bool {
+        self.pairs.contains_key(&(*source, *target))
     }
 
     /// Get total edge count
@@ -392,6 +440,7 @@ impl EdgeIndex {
     pub fn clear(&mut self) {
         self.outgoing.clear();
         self.incoming.clear();
+        self.pairs.clear();
     }
 }
 
@@ -411,13 +460,35 @@ mod tests {
 
         assert_eq!(edge.edge_type, EdgeType::References);
         assert_eq!(edge.metadata.confidence, Some(0.95));
+
+        let clamped = Edge::new(EdgeType::Supports, make_id(3)).with_confidence(1.5);
+        assert_eq!(clamped.metadata.confidence, Some(1.0));
+        let clamped = Edge::new(EdgeType::Supports, make_id(3)).with_confidence(-0.5);
+        assert_eq!(clamped.metadata.confidence, Some(0.0));
     }
 
     #[test]
     fn test_edge_type_inverse() {
-        assert_eq!(EdgeType::References.inverse(), Some(EdgeType::CitedBy));
-        assert_eq!(EdgeType::ParentOf.inverse(), Some(EdgeType::ChildOf));
-        assert_eq!(EdgeType::DerivedFrom.inverse(), None);
+        let pairs = [
+            (EdgeType::References, EdgeType::CitedBy),
+            (EdgeType::ParentOf, EdgeType::ChildOf),
+            (EdgeType::PreviousSibling, EdgeType::NextSibling),
+            (EdgeType::Contradicts, EdgeType::Contradicts),
+            (EdgeType::SiblingOf, EdgeType::SiblingOf),
+        ];
+        for (a, b) in pairs {
+            assert_eq!(a.inverse(), Some(b.clone()), "{a:?}");
+            assert_eq!(b.inverse(), Some(a.clone()), "{b:?}");
+            assert_eq!(a.is_symmetric(), a == b, "{a:?}");
+        }
+        for et in [
+            EdgeType::DerivedFrom,
+            EdgeType::Supports,
+            EdgeType::VersionOf,
+        ] {
+            assert_eq!(et.inverse(), None, "{et:?}");
+            assert!(!et.is_symmetric(), "{et:?}");
+        }
     }
 
     #[test]
@@ -430,6 +501,15 @@ mod tests {
             EdgeType::from_str("custom:my_type").unwrap(),
             EdgeType::Custom("my_type".to_string())
         );
+        assert_eq!(EdgeType::from_str("Cited_By").unwrap(), EdgeType::CitedBy);
+        assert_eq!(
+            EdgeType::from_str("CUSTOM:My_Type").unwrap(),
+            EdgeType::Custom("my_type".to_string())
+        );
+        assert_eq!(
+            EdgeType::from_str("Bogus").unwrap_err(),
+            EdgeTypeParseError("Bogus".to_string())
+        );
     }
 
     #[test]
@@ -447,6 +527,36 @@ mod tests {
         assert!(!index.has_edge(&source, &target, &EdgeType::References));
     }
 
+    #[test]
+    fn test_edge_index_has_edge_lookup() {
+        let mut index = EdgeIndex::new();
+        let hub = make_id(1);
+        let leaf = make_id(2);
+        let other = make_id(3);
+        // hub has many outgoing edges, leaf has a single incoming one
+        index.add_edge(&hub, &Edge::new(EdgeType::References, leaf));
+        for i in 10..20 {
+            index.add_edge(&hub, &Edge::new(EdgeType::Supports, make_id(i)));
+        }
+        index.add_edge(&other, &Edge::new(EdgeType::DerivedFrom, hub));
+
+        assert!(index.has_edge(&hub, &leaf, &EdgeType::References));
+        assert!(!index.has_edge(&hub, &leaf, &EdgeType::CitedBy));
+        assert!(!index.has_edge(&hub, &other, &EdgeType::References));
+        assert!(index.has_edge(&other, &hub, &EdgeType::DerivedFrom));
+        assert!(!index.has_edge(&other, &hub, &EdgeType::References));
+        assert!(!index.has_edge(&leaf, &hub, &EdgeType::CitedBy));
+        assert!(index.has_edge_between(&hub, &leaf));
+        assert!(!index.has_edge_between(&leaf, &hub));
+
+        // Removing one of two edge types keeps the pair
+        index.add_edge(&hub, &Edge::new(EdgeType::Supports, leaf));
+        index.remove_edge(&hub, &leaf, &EdgeType::References);
+        assert!(!index.has_edge(&hub, &leaf, &EdgeType::References));
+        assert!(index.has_edge(&hub, &leaf, &EdgeType::Supports));
+        assert!(index.has_edge_between(&hub, &leaf));
+    }
+
     #[test]
     fn test_edge_index_traversal() {
         let mut index = EdgeIndex::new();
@@ -479,5 +589,24 @@ mod tests {
 
         assert!(!index.has_edge(&a, &b, &EdgeType::References));
         assert!(!index.has_edge(&b, &c, &EdgeType::References));
+        assert!(!index.has_edge_between(&a, &b));
+        // Emptied adjacency lists are dropped rather than left behind.
+        assert!(index.outgoing.is_empty());
+        assert!(index.incoming.is_empty());
+    }
+
+    #[test]
+    fn test_edge_index_remove_custom_edge() {
+        let mut index = EdgeIndex::new();
+        let a = make_id(1);
+        let b = make_id(2);
+        let custom = EdgeType::Custom("depends_on".to_string());
+
+        index.add_edge(&a, &Edge::new(custom.clone(), b));
+        assert_eq!(index.incoming_to(&b).len(), 1);
+
+        index.remove_edge(&a, &b, &custom);
+        assert!(!index.has_edge(&a, &b, &custom));
+        assert!(index.incoming_to(&b).is_empty());
     }
 }
@@ -291,6 +291,17 @@ pub enum ValidationSeverity {
     Info,
 }
 
+impl ValidationSeverity {
+    /// Lowercase name ("error", "warning", "info")
+    pub fn as_str(&self) -> &'static str {
+        match self {
+            Self::Error => "error",
+            Self::Warning => "warning",
+            Self::Info => "info",
+        }
+    }
+}
+
 impl ValidationIssue {
     pub fn error(code: ErrorCode, message: impl Into<String>) -> Self {
         Self {
@@ -344,6 +355,13 @@ mod tests {
             ErrorCode::E001BlockNotFound.description(),
             "Block does not exist"
         );
+        for severity in [
+            ValidationSeverity::Error,
+            ValidationSeverity::Warning,
+            ValidationSeverity::Info,
+        ] {
+            assert_eq!(severity.as_str(), format!("{:?}", severity).to_lowercase());
+        }
     }
 
     #[test]
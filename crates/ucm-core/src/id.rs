@@ -84,7 +84,16 @@ impl fmt::Debug for BlockId {
 
 impl fmt::Display for BlockId {
     fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
-        write!(f, "blk_{}", hex::encode(self.0))
+        // IDs are formatted constantly (maps keyed by string, JSON, prompts), so
+        // render into a fixed stack buffer instead of allocating via hex::encode.
+        const HEX: &[u8; 16] = b"0123456789abcdef";
+        let mut buf = [0u8; 28];
+        buf[..4].copy_from_slice(b"blk_");
+        for (i, byte) in self.0.iter().enumerate() {
+            buf[4 + i * 2] = HEX[(byte >> 4) as usize];
+            buf[5 + i * 2] = HEX[(byte & 0x0f) as usize];
+        }
+        f.write_str(std::str::from_utf8(&buf).map_err(|_| fmt::Error)?)
     }
 }
 
@@ -233,6 +242,37 @@ pub fn generate_block_id(
     content: &Content,
     semantic_role: Option<&str>,
     namespace: Option<&str>,
+) -> BlockId {
+    let normalized = normalize_content(content);
+    block_id_from_normalized(content, &normalized, semantic_role, namespace)
+}
+
+/// Compute the full content hash (SHA256)
+pub fn compute_content_hash(content: &Content) -> ContentHash {
+    content_hash_from_normalized(&normalize_content(content))
+}
+
+/// Generate a block ID and the content hash together.
+///
+/// Same results as calling [`generate_block_id`] and [`compute_content_hash`],
+/// but the content is normalized once instead of twice.
+pub fn generate_block_id_and_hash(
+    content: &Content,
+    semantic_role: Option<&str>,
+    namespace: Option<&str>,
+) -> (BlockId, ContentHash) {
+    let normalized = normalize_content(content);
+    (
+        block_id_from_normalized(content, &normalized, semantic_role, namespace),
+        content_hash_from_normalized(&normalized),
+    )
+}
+
+fn block_id_from_normalized(
+    content: &Content,
+    normalized: &str,
+    semantic_role: Option<&str>,
+    namespace: Option<&str>,
 ) -> BlockId {
     let mut hasher = Sha256::new();
 
@@ -253,7 +293,6 @@ pub fn generate_block_id(
     hasher.update(b":");
 
     // Add normalized content
-    let normalized = normalize_content(content);
     hasher.update(normalized.as_bytes());
 
     // Extract 96 bits (12 bytes) from the 256-bit hash
@@ -264,10 +303,8 @@ pub fn generate_block_id(
     BlockId(id_bytes)
 }
 
-/// Compute the full content hash (SHA256)
-pub fn compute_content_hash(content: &Content) -> ContentHash {
+fn content_hash_from_normalized(normalized: &str) -> ContentHash {
     let mut hasher = Sha256::new();
-    let normalized = normalize_content(content);
     hasher.update(normalized.as_bytes());
     let hash = hasher.finalize();
     let mut hash_bytes = [0u8; 32];
@@ -338,6 +375,19 @@ mod tests {
         assert_eq!(id.to_string(), "blk_0102030405060708090a0b0c");
     }
 
+    #[test]
+    fn test_block_id_display_matches_hex_encoding() {
+        let bytes = [
+            0x00, 0x0f, 0x10, 0x7f, 0x80, 0x9a, 0xab, 0xbc, 0xcd, 0xde, 0xef, 0xff,
+        ];
+        let id = BlockId::from_bytes(bytes);
+        assert_eq!(id.to_string(), format!("blk_{}", hex::encode(bytes)));
+        assert_eq!(
+            format!("{:?}", id),
+            format!("BlockId(blk_{})", hex::encode(bytes))
+        );
+    }
+
     #[test]
     fn test_block_id_parse() {
         let id_str = "blk_0102030405060708090a0b0c";
@@ -397,6 +447,15 @@ mod tests {
         assert_eq!(hash1, hash2);
     }
 
+    #[test]
+    fn test_id_and_hash_match_separate_calls() {
+        let content = Content::code("rust", "fn main() {}\r\n");
+
+        let (id, hash) = generate_block_id_and_hash(&content, Some("example"), Some("ns"));
+        assert_eq!(id, generate_block_id(&content, Some("example"), Some("ns")));
+        assert_eq!(hash, compute_content_hash(&content));
+    }
+
     #[test]
     fn test_id_generator() {
         let gen = IdGenerator::new(IdGeneratorConfig::new().with_namespace("test"));
@@ -1,6 +1,6 @@
 //! Block metadata for search, display, and LLM optimization.
 
-use crate::content::Content;
+use crate::content::{count_lines, Content};
 use crate::id::ContentHash;
 use crate::normalize::is_cjk_character;
 use chrono::{DateTime, Utc};
@@ -306,6 +306,32 @@ impl RoleCategory {
             Self::Custom => "custom",
         }
     }
+
+    /// Heading level (1-6) for the `HeadingN` categories, `None` otherwise.
+    pub fn heading_level(&self) -> Option<usize> {
+        match self {
+            Self::Heading1 => Some(1),
+            Self::Heading2 => Some(2),
+            Self::Heading3 => Some(3),
+            Self::Heading4 => Some(4),
+            Self::Heading5 => Some(5),
+            Self::Heading6 => Some(6),
+            _ => None,
+        }
+    }
+
+    /// Heading category for a level, the inverse of `heading_level`.
+    pub fn heading(level: usize) -> Option<Self> {
+        match level {
+            1 => Some(Self::Heading1),
+            2 => Some(Self::Heading2),
+            3 => Some(Self::Heading3),
+            4 => Some(Self::Heading4),
+            5 => Some(Self::Heading5),
+            6 => Some(Self::Heading6),
+            _ => None,
+        }
+    }
 }
 
 impl FromStr for RoleCategory {
@@ -408,11 +434,7 @@ impl TokenEstimate {
     }
 
     fn estimate_text(text: &str) -> Self {
-        let char_count = text.chars().count();
-        let word_count = text.split_whitespace().count();
-
-        // Detect script type for better estimation
-        let cjk_count = text.chars().filter(|c| is_cjk_character(*c)).count();
+        let (char_count, word_count, cjk_count) = count_text(text);
         let cjk_ratio = cjk_count as f32 / char_count.max(1) as f32;
 
         // CJK characters are ~1-2 tokens each, Latin ~4 chars per token
@@ -431,7 +453,7 @@ impl TokenEstimate {
     }
 
     fn estimate_code(source: &str, language: &str) -> Self {
-        let line_count = source.lines().count();
+        let line_count = count_lines(source);
         let char_count = source.len();
 
         // Code typically has more tokens due to punctuation
@@ -488,6 +510,35 @@ impl TokenEstimate {
     }
 }
 
+/// Count characters, whitespace-separated words and CJK characters in one pass.
+///
+/// ASCII text (the common case) is scanned byte by byte without UTF-8
+/// decoding; it cannot contain CJK characters and its char count is its length.
+fn count_text(text: &str) -> (usize, usize, usize) {
+    if text.is_ascii() {
+        let mut words = 0;
+        let mut in_word = false;
+        for &b in text.as_bytes() {
+            // Same set as char::is_whitespace restricted to ASCII
+            let ws = matches!(b, b'\t'..=b'\r' | b' ');
+            words += (!ws && !in_word) as usize;
+            in_word = !ws;
+        }
+        return (text.len(), words, 0);
+    }
+
+    let (mut chars, mut words, mut cjk) = (0, 0, 0);
+    let mut in_word = false;
+    for c in text.chars() {
+        chars += 1;
+        cjk += is_cjk_character(c) as usize;
+        let ws = c.is_whitespace();
+        words += (!ws && !in_word) as usize;
+        in_word = !ws;
+    }
+    (chars, words, cjk)
+}
+
 impl Default for TokenEstimate {
     fn default() -> Self {
         Self::default_estimate()
@@ -524,10 +575,33 @@ mod tests {
 
     #[test]
     fn test_role_category_roundtrip() {
-        let category = RoleCategory::BodyEvidence;
-        let s = category.as_str();
-        let parsed = RoleCategory::from_str(s).unwrap();
-        assert_eq!(parsed, category);
+        let cases = [
+            (RoleCategory::Title, "title"),
+            (RoleCategory::TableOfContents, "toc"),
+            (RoleCategory::Heading3, "heading3"),
+            (RoleCategory::Paragraph, "paragraph"),
+            (RoleCategory::IntroHook, "intro_hook"),
+            (RoleCategory::BodyEvidence, "body_evidence"),
+            (RoleCategory::ConclusionCallToAction, "conclusion_cta"),
+            (RoleCategory::Warning, "warning"),
+            (RoleCategory::Footnote, "footnote"),
+        ];
+        for (category, expected) in cases {
+            assert_eq!(category.as_str(), expected);
+            assert_eq!(RoleCategory::from_str(expected).unwrap(), category);
+        }
+    }
+
+    #[test]
+    fn test_heading_level_roundtrip() {
+        for level in 1..=6 {
+            let category = RoleCategory::heading(level).unwrap();
+            assert_eq!(category.heading_level(), Some(level));
+            assert_eq!(category.as_str(), format!("heading{}", level));
+        }
+        assert_eq!(RoleCategory::heading(0), None);
+        assert_eq!(RoleCategory::heading(7), None);
+        assert_eq!(RoleCategory::Paragraph.heading_level(), None);
     }
 
     #[test]
@@ -537,6 +611,24 @@ mod tests {
         assert!(estimate.claude > 0);
     }
 
+    #[test]
+    fn test_count_text_matches_std_counts() {
+        for text in [
+            "",
+            "   ",
+            "Hello, world! This is a test.",
+            "  leading\tand\x0btrailing \r\n",
+            "你好 世界 mixed\u{3000}text",
+        ] {
+            let expected = (
+                text.chars().count(),
+                text.split_whitespace().count(),
+                text.chars().filter(|c| is_cjk_character(*c)).count(),
+            );
+            assert_eq!(count_text(text), expected, "{:?}", text);
+        }
+    }
+
     #[test]
     fn test_token_estimate_cjk() {
         let estimate = TokenEstimate::estimate_text("你好世界");
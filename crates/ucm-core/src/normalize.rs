@@ -5,6 +5,7 @@
 //! or Unicode representation.
 
 use crate::content::{Cell, Code, Column, Content, Math, Media, MediaSource, Row, Table, Text};
+use std::fmt::Write;
 use unicode_normalization::UnicodeNormalization;
 
 /// Normalization configuration
@@ -262,21 +263,31 @@ pub fn canonical_json(value: &serde_json::Value) -> String {
 }
 
 /// Escape a string for JSON output
+///
+/// Runs of characters that need no escaping are copied as whole slices.
 fn escape_json_string(s: &str) -> String {
     let mut result = String::with_capacity(s.len());
-    for c in s.chars() {
-        match c {
-            '"' => result.push_str("\\\""),
-            '\\' => result.push_str("\\\\"),
-            '\n' => result.push_str("\\n"),
-            '\r' => result.push_str("\\r"),
-            '\t' => result.push_str("\\t"),
-            c if c.is_control() => {
-                result.push_str(&format!("\\u{:04x}", c as u32));
+    let mut start = 0;
+    for (i, c) in s.char_indices() {
+        let escaped = match c {
+            '"' => Some("\\\""),
+            '\\' => Some("\\\\"),
+            '\n' => Some("\\n"),
+            '\r' => Some("\\r"),
+            '\t' => Some("\\t"),
+            c if c.is_control() => None,
+            _ => continue,
+        };
+        result.push_str(&s[start..i]);
+        match escaped {
+            Some(escaped) => result.push_str(escaped),
+            None => {
+                let _ = write!(result, "\\u{:04x}", c as u32);
             }
-            c => result.push(c),
         }
+        start = i + c.len_utf8();
     }
+    result.push_str(&s[start..]);
     result
 }
 
@@ -342,6 +353,15 @@ mod tests {
         assert_eq!(canonical, "{\"a\":2,\"b\":1}");
     }
 
+    #[test]
+    fn test_escape_json_string() {
+        assert_eq!(escape_json_string("plain"), "plain");
+        assert_eq!(
+            escape_json_string("say \"hi\"\\\n\té\u{1}\u{85}end"),
+            "say \\\"hi\\\"\\\\\\n\\té\\u0001\\u0085end"
+        );
+    }
+
     #[test]
     fn test_canonical_json_nested() {
         let json = serde_json::json!({"outer": {"b": 1, "a": 2}});
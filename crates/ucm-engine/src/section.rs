@@ -8,6 +8,7 @@
 
 use serde::{Deserialize, Serialize};
 use std::collections::{HashMap, VecDeque};
+use ucm_core::metadata::{RoleCategory, SemanticRole};
 use ucm_core::{Block, BlockId, Content, Document};
 
 use crate::error::{Error, Result};
@@ -53,8 +54,33 @@ impl DeletedContent {
     pub fn block_ids(&self) -> Vec<BlockId> {
         self.blocks.keys().copied().collect()
     }
+
+    /// Stream the JSON encoding of this content into `writer`.
+    pub fn write_json<W: std::io::Write>(&self, writer: W) -> serde_json::Result<()> {
+        serde_json::to_writer(writer, self)
+    }
+
+    /// Serialize to a JSON string.
+    ///
+    /// The output buffer is sized from the preserved content up front so large
+    /// cleared sections are written without repeated reallocation.
+    pub fn to_json(&self) -> serde_json::Result<String> {
+        let estimate = self
+            .blocks
+            .values()
+            .map(|block| block.size_bytes() + JSON_BYTES_PER_BLOCK)
+            .sum::<usize>()
+            + self.structure.len() * JSON_BYTES_PER_BLOCK;
+        let mut buf = Vec::with_capacity(estimate);
+        self.write_json(&mut buf)?;
+        // serde_json only emits valid UTF-8.
+        Ok(String::from_utf8(buf).expect("serde_json produced invalid UTF-8"))
+    }
 }
 
+/// Rough per-block JSON overhead (ID, metadata, timestamps) used to presize buffers.
+const JSON_BYTES_PER_BLOCK: usize = 384;
+
 /// Result of a section clear operation with undo support
 #[derive(Debug, Clone)]
 pub struct ClearResult {
@@ -77,8 +103,34 @@ pub struct ClearResult {
 /// * `Ok(Vec<BlockId>)` - List of removed block IDs
 /// * `Err(Error)` - If the section doesn't exist
 pub fn clear_section_content(doc: &mut Document, section_id: &BlockId) -> Result<Vec<BlockId>> {
-    let result = clear_section_content_with_undo(doc, section_id)?;
-    Ok(result.removed_ids)
+    // Verify section exists
+    if !doc.blocks.contains_key(section_id) {
+        return Err(Error::BlockNotFound(section_id.to_string()));
+    }
+
+    // Same breadth-first walk as the undo variant, but blocks are dropped
+    // instead of being moved into a snapshot nobody will read
+    let mut removed = Vec::new();
+    let mut queue: VecDeque<BlockId> = doc
+        .structure
+        .get_mut(section_id)
+        .map(std::mem::take)
+        .unwrap_or_default()
+        .into();
+
+    while let Some(block_id) = queue.pop_front() {
+        removed.push(block_id);
+
+        if let Some(block) = doc.blocks.remove(&block_id) {
+            doc.indices.remove_block(&block);
+        }
+
+        if let Some(children) = doc.structure.remove(&block_id) {
+            queue.extend(children);
+        }
+    }
+
+    Ok(removed)
 }
 
 /// Clear all children of a section with undo support.
@@ -91,7 +143,8 @@ pub fn clear_section_content(doc: &mut Document, section_id: &BlockId) -> Result
 /// * `section_id` - The block ID of the section to clear
 ///
 /// # Returns
-/// * `Ok(ClearResult)` - Contains removed IDs and preserved content
+/// * `Ok(ClearResult)` - Contains removed IDs (in breadth-first order) and
+///   preserved content
 /// * `Err(Error)` - If the section doesn't exist
 pub fn clear_section_content_with_undo(
     doc: &mut Document,
@@ -106,43 +159,30 @@ pub fn clear_section_content_with_undo(
     let mut to_remove = Vec::new();
     let mut queue = VecDeque::new();
 
-    // Get immediate children and store structure
-    if let Some(children) = doc.structure.get(section_id) {
-        deleted.structure.insert(*section_id, children.clone());
-        for child in children.clone() {
-            queue.push_back(child);
-        }
+    // Detach the immediate children, leaving the section with an empty list
+    if let Some(children) = doc.structure.get_mut(section_id) {
+        queue.extend(children.iter().copied());
+        deleted
+            .structure
+            .insert(*section_id, std::mem::take(children));
     }
 
-    // BFS to collect all descendants and preserve them
+    // BFS over the descendants, moving blocks and their child lists out of
+    // the document rather than cloning them and deleting the originals
     while let Some(block_id) = queue.pop_front() {
         to_remove.push(block_id);
 
-        // Preserve block content
-        if let Some(block) = doc.blocks.get(&block_id) {
-            deleted.blocks.insert(block_id, block.clone());
+        if let Some(block) = doc.blocks.remove(&block_id) {
+            doc.indices.remove_block(&block);
+            deleted.blocks.insert(block_id, block);
         }
 
-        // Preserve and traverse structure
-        if let Some(children) = doc.structure.get(&block_id) {
-            deleted.structure.insert(block_id, children.clone());
-            for child in children.clone() {
-                queue.push_back(child);
-            }
+        if let Some(children) = doc.structure.remove(&block_id) {
+            queue.extend(children.iter().copied());
+            deleted.structure.insert(block_id, children);
         }
     }
 
-    // Remove blocks from document
-    for block_id in &to_remove {
-        doc.blocks.remove(block_id);
-        doc.structure.remove(block_id);
-    }
-
-    // Clear section's children list
-    if let Some(children) = doc.structure.get_mut(section_id) {
-        children.clear();
-    }
-
     Ok(ClearResult {
         removed_ids: to_remove,
         deleted_content: deleted,
@@ -165,64 +205,83 @@ pub fn restore_deleted_content(
     doc: &mut Document,
     deleted: &DeletedContent,
 ) -> Result<Vec<BlockId>> {
-    // Verify parent exists
+    // Verify before cloning so a bad parent costs nothing
     if !doc.blocks.contains_key(&deleted.parent_id) {
         return Err(Error::BlockNotFound(deleted.parent_id.to_string()));
     }
+    restore_deleted_content_owned(doc, deleted.clone())
+}
+
+/// Restore deleted content, consuming the snapshot.
+///
+/// Same as `restore_deleted_content`, but the snapshot's blocks and child
+/// lists are moved into the document instead of cloned. Use this when the
+/// `DeletedContent` is not needed afterwards, e.g. when rolling back a
+/// failed write.
+pub fn restore_deleted_content_owned(
+    doc: &mut Document,
+    deleted: DeletedContent,
+) -> Result<Vec<BlockId>> {
+    let DeletedContent {
+        blocks,
+        mut structure,
+        parent_id,
+        ..
+    } = deleted;
 
-    // Remove current content under the parent section
-    if let Some(existing_children) = doc.structure.get(&deleted.parent_id).cloned() {
+    // Verify parent exists
+    if !doc.blocks.contains_key(&parent_id) {
+        return Err(Error::BlockNotFound(parent_id.to_string()));
+    }
+
+    // Remove current content under the parent section. The whole child list
+    // is detached at once, so the subtrees need no per-child parent fix-up.
+    if let Some(children) = doc.structure.get_mut(&parent_id) {
+        let existing_children = std::mem::take(children);
         for child in existing_children {
-            remove_subtree(doc, &child);
-        }
-        if let Some(children) = doc.structure.get_mut(&deleted.parent_id) {
-            children.clear();
+            drop_subtree(doc, child);
         }
     }
 
-    let mut restored = Vec::new();
+    let mut restored = Vec::with_capacity(blocks.len());
 
     // Restore all blocks
-    for (block_id, block) in &deleted.blocks {
-        doc.blocks.insert(*block_id, block.clone());
-        restored.push(*block_id);
-    }
-
-    // Restore structure for deleted blocks
-    for (block_id, children) in &deleted.structure {
-        if *block_id != deleted.parent_id {
-            doc.structure.insert(*block_id, children.clone());
-        }
+    doc.blocks.reserve(blocks.len());
+    for (block_id, block) in blocks {
+        doc.indices.index_block(&block);
+        doc.blocks.insert(block_id, block);
+        restored.push(block_id);
     }
 
     // Restore children of parent section
-    if let Some(parent_children) = deleted.structure.get(&deleted.parent_id) {
-        if let Some(children) = doc.structure.get_mut(&deleted.parent_id) {
-            children.extend(parent_children.clone());
-        } else {
-            doc.structure
-                .insert(deleted.parent_id, parent_children.clone());
+    if let Some(parent_children) = structure.remove(&parent_id) {
+        match doc.structure.get_mut(&parent_id) {
+            Some(children) => children.extend(parent_children),
+            None => {
+                doc.structure.insert(parent_id, parent_children);
+            }
         }
     }
 
+    // Restore structure for deleted blocks
+    doc.structure.extend(structure);
+
     Ok(restored)
 }
 
-fn remove_subtree(doc: &mut Document, block_id: &BlockId) {
-    if let Some(children) = doc.structure.get(block_id).cloned() {
-        for child in children {
-            remove_subtree(doc, &child);
+/// Drop a subtree's blocks and child lists without touching its parent's
+/// child list; callers must already have detached `block_id`.
+fn drop_subtree(doc: &mut Document, block_id: BlockId) {
+    // Explicit stack instead of recursion so deep trees cannot overflow
+    let mut stack = vec![block_id];
+    while let Some(id) = stack.pop() {
+        if let Some(children) = doc.structure.remove(&id) {
+            stack.extend(children);
         }
-    }
-
-    if let Some(parent) = doc.parent(block_id).cloned() {
-        if let Some(children) = doc.structure.get_mut(&parent) {
-            children.retain(|c| c != block_id);
+        if let Some(block) = doc.blocks.remove(&id) {
+            doc.indices.remove_block(&block);
         }
     }
-
-    doc.blocks.remove(block_id);
-    doc.structure.remove(block_id);
 }
 
 /// Integrate blocks from a source document into a target section.
@@ -250,32 +309,27 @@ pub fn integrate_section_blocks(
         return Err(Error::BlockNotFound(target_section.to_string()));
     }
 
-    let mut added_blocks = Vec::new();
-
-    // Get root children from source document
-    let root_children = source_doc
-        .structure
-        .get(&source_doc.root)
-        .cloned()
-        .unwrap_or_default();
+    let mut added_blocks = Vec::with_capacity(source_doc.block_count().saturating_sub(1));
 
-    // Process each root child and its subtree
-    for child_id in root_children {
-        let integrated = integrate_subtree(
+    // Process each root child and its subtree. The source document is only
+    // borrowed, so its child lists are walked in place rather than copied.
+    for child_id in source_doc.children(&source_doc.root) {
+        integrate_subtree(
             doc,
             target_section,
             source_doc,
-            &child_id,
+            child_id,
             base_heading_level,
             0,
+            &mut added_blocks,
         )?;
-        added_blocks.extend(integrated);
     }
 
     Ok(added_blocks)
 }
 
-/// Recursively integrate a subtree from source to target document.
+/// Recursively integrate a subtree from source to target document,
+/// appending the new block IDs to `added_blocks`.
 fn integrate_subtree(
     doc: &mut Document,
     parent_id: &BlockId,
@@ -283,9 +337,8 @@ fn integrate_subtree(
     source_block_id: &BlockId,
     base_heading_level: Option<usize>,
     depth: usize,
-) -> Result<Vec<BlockId>> {
-    let mut added_blocks = Vec::new();
-
+    added_blocks: &mut Vec<BlockId>,
+) -> Result<()> {
     // Get the source block
     let source_block = source_doc
         .get_block(source_block_id)
@@ -303,6 +356,7 @@ fn integrate_subtree(
     new_block.id = new_id;
 
     // Add block to target document
+    doc.indices.index_block(&new_block);
     doc.blocks.insert(new_id, new_block);
     added_blocks.push(new_id);
 
@@ -314,40 +368,32 @@ fn integrate_subtree(
     doc.structure.entry(new_id).or_default();
 
     // Process children recursively
-    if let Some(children) = source_doc.structure.get(source_block_id) {
-        for child_id in children.clone() {
-            let child_added = integrate_subtree(
-                doc,
-                &new_id,
-                source_doc,
-                &child_id,
-                base_heading_level,
-                depth + 1,
-            )?;
-            added_blocks.extend(child_added);
-        }
+    for child_id in source_doc.children(source_block_id) {
+        integrate_subtree(
+            doc,
+            &new_id,
+            source_doc,
+            child_id,
+            base_heading_level,
+            depth + 1,
+            added_blocks,
+        )?;
     }
 
-    Ok(added_blocks)
+    Ok(())
 }
 
 /// Adjust heading level based on base level and depth.
 fn adjust_heading_level(block: &mut Block, base_level: usize, _depth: usize) {
     if let Some(ref mut role) = block.metadata.semantic_role {
-        let role_str = role.category.as_str();
-
         // Check if this is a heading
-        if let Some(level_str) = role_str.strip_prefix("heading") {
-            if let Ok(current_level) = level_str.parse::<usize>() {
-                // Adjust level: new_level = base_level + current_level - 1
-                let new_level = (base_level + current_level - 1).clamp(1, 6);
-
-                // Update the semantic role
-                if let Some(new_role) =
-                    ucm_core::metadata::SemanticRole::parse(&format!("heading{}", new_level))
-                {
-                    *role = new_role;
-                }
+        if let Some(current_level) = role.category.heading_level() {
+            // Adjust level: new_level = base_level + current_level - 1
+            let new_level = (base_level + current_level - 1).clamp(1, 6);
+
+            // Update the semantic role
+            if let Some(category) = RoleCategory::heading(new_level) {
+                *role = SemanticRole::new(category);
             }
         }
     }
@@ -382,15 +428,9 @@ fn regenerate_block_id(block: &Block) -> BlockId {
 /// * `Some(BlockId)` - The block ID of the found section
 /// * `None` - If the path doesn't match any section
 pub fn find_section_by_path(doc: &Document, path: &str) -> Option<BlockId> {
-    let parts: Vec<&str> = path.split(" > ").map(|s| s.trim()).collect();
-
-    if parts.is_empty() {
-        return None;
-    }
-
     let mut current_id = doc.root;
 
-    for part in parts {
+    for part in path.split(" > ").map(|s| s.trim()) {
         let children = doc.structure.get(&current_id)?;
 
         let found = children.iter().find(|child_id| {
@@ -400,7 +440,7 @@ pub fn find_section_by_path(doc: &Document, path: &str) -> Option<BlockId> {
                     .metadata
                     .semantic_role
                     .as_ref()
-                    .map(|r| r.category.as_str().starts_with("heading"))
+                    .map(|r| r.category.heading_level().is_some())
                     .unwrap_or(false);
 
                 if is_heading {
@@ -461,15 +501,19 @@ pub fn get_section_depth(doc: &Document, section_id: &BlockId) -> Option<usize>
 /// # Returns
 /// * `Vec<(BlockId, usize)>` - List of (section_id, heading_level) tuples
 pub fn get_all_sections(doc: &Document) -> Vec<(BlockId, usize)> {
+    // Walk the role index rather than every block; only heading roles match
     let mut sections = Vec::new();
 
-    for (block_id, block) in &doc.blocks {
-        if let Some(ref role) = block.metadata.semantic_role {
-            if let Some(level_str) = role.category.as_str().strip_prefix("heading") {
-                if let Ok(level) = level_str.parse::<usize>() {
-                    sections.push((*block_id, level));
-                }
-            }
+    for (role, ids) in &doc.indices.by_role {
+        if let Some(level) = role
+            .strip_prefix("heading")
+            .and_then(|level| level.parse::<usize>().ok())
+        {
+            sections.extend(
+                ids.iter()
+                    .filter(|id| doc.blocks.contains_key(id))
+                    .map(|id| (*id, level)),
+            );
         }
     }
 
@@ -510,6 +554,7 @@ mod tests {
 
         // Should have removed H2 and paragraph
         assert_eq!(removed.len(), 2);
+        assert!(removed.iter().all(|id| !doc.blocks.contains_key(id)));
 
         // H1 should have no children now
         let children = doc.structure.get(&h1_id).unwrap();
@@ -533,6 +578,40 @@ mod tests {
         assert!(missing.is_none());
     }
 
+    #[test]
+    fn test_integrate_section_blocks_preserves_order_and_levels() {
+        let mut doc = create_test_document();
+        let h1_id = find_section_by_path(&doc, "Introduction").unwrap();
+
+        let mut source = Document::create();
+        let source_root = source.root;
+        let heading = source
+            .add_block(
+                Block::new(Content::text("New"), Some("heading1")),
+                &source_root,
+            )
+            .unwrap();
+        source
+            .add_block(
+                Block::new(Content::text("Body"), Some("paragraph")),
+                &heading,
+            )
+            .unwrap();
+
+        let added = integrate_section_blocks(&mut doc, &h1_id, &source, Some(2)).unwrap();
+
+        assert_eq!(added.len(), 2);
+        assert_eq!(doc.children(&h1_id).last(), Some(&added[0]));
+        assert_eq!(doc.children(&added[0]), &[added[1]]);
+        let role = doc
+            .get_block(&added[0])
+            .unwrap()
+            .metadata
+            .semantic_role
+            .as_ref();
+        assert_eq!(role.map(|r| r.category), Some(RoleCategory::Heading2));
+    }
+
     #[test]
     fn test_get_all_sections() {
         let doc = create_test_document();
@@ -548,6 +627,18 @@ mod tests {
         assert!(levels.contains(&2));
     }
 
+    #[test]
+    fn test_get_all_sections_tracks_clear_and_restore() {
+        let mut doc = create_test_document();
+        let h1_id = find_section_by_path(&doc, "Introduction").unwrap();
+
+        let result = clear_section_content_with_undo(&mut doc, &h1_id).unwrap();
+        assert_eq!(get_all_sections(&doc), vec![(h1_id, 1)]);
+
+        restore_deleted_content(&mut doc, &result.deleted_content).unwrap();
+        assert_eq!(get_all_sections(&doc).len(), 2);
+    }
+
     #[test]
     fn test_get_section_depth() {
         let doc = create_test_document();
@@ -588,4 +679,93 @@ mod tests {
         let children = doc.structure.get(&h1_id).unwrap();
         assert!(!children.is_empty());
     }
+
+    #[test]
+    fn test_owned_restore_matches_borrowed() {
+        let mut borrowed = create_test_document();
+        let mut owned = borrowed.clone();
+        let h1_id = find_section_by_path(&borrowed, "Introduction").unwrap();
+
+        let result = clear_section_content_with_undo(&mut borrowed, &h1_id).unwrap();
+        restore_deleted_content(&mut borrowed, &result.deleted_content).unwrap();
+
+        let result = clear_section_content_with_undo(&mut owned, &h1_id).unwrap();
+        let mut restored =
+            restore_deleted_content_owned(&mut owned, result.deleted_content).unwrap();
+        restored.sort_by_key(|id| id.0);
+
+        let mut expected = result.removed_ids;
+        expected.sort_by_key(|id| id.0);
+        assert_eq!(restored, expected);
+        assert_eq!(owned.structure, borrowed.structure);
+        assert_eq!(owned.block_count(), borrowed.block_count());
+        assert_eq!(
+            find_section_by_path(&owned, "Introduction > Getting Started"),
+            find_section_by_path(&borrowed, "Introduction > Getting Started")
+        );
+    }
+
+    #[test]
+    fn test_clear_with_undo_removes_breadth_first() {
+        let mut doc = Document::create();
+        let root = doc.root;
+        let section = doc
+            .add_block(
+                Block::new(Content::text("Section"), Some("heading1")),
+                &root,
+            )
+            .unwrap();
+        let a = doc
+            .add_block(Block::new(Content::text("a"), None), &section)
+            .unwrap();
+        let b = doc
+            .add_block(Block::new(Content::text("b"), None), &section)
+            .unwrap();
+        let a1 = doc
+            .add_block(Block::new(Content::text("a1"), None), &a)
+            .unwrap();
+        let b1 = doc
+            .add_block(Block::new(Content::text("b1"), None), &b)
+            .unwrap();
+
+        let result = clear_section_content_with_undo(&mut doc, &section).unwrap();
+
+        assert_eq!(result.removed_ids, vec![a, b, a1, b1]);
+    }
+
+    #[test]
+    fn test_drop_subtree_deep_chain() {
+        let mut doc = Document::create();
+        let root = doc.root;
+        let top = doc
+            .add_block(Block::new(Content::text("top"), None), &root)
+            .unwrap();
+        let mut parent = top;
+        for i in 0..10_000 {
+            parent = doc
+                .add_block(Block::new(Content::text(format!("n{}", i)), None), &parent)
+                .unwrap();
+        }
+
+        doc.structure.get_mut(&root).unwrap().clear();
+        drop_subtree(&mut doc, top);
+
+        assert_eq!(doc.block_count(), 1);
+        assert!(doc.children(&root).is_empty());
+        assert!(!doc.structure.contains_key(&top));
+    }
+
+    #[test]
+    fn test_deleted_content_json_roundtrip() {
+        let mut doc = create_test_document();
+        let h1_id = find_section_by_path(&doc, "Introduction").unwrap();
+        let result = clear_section_content_with_undo(&mut doc, &h1_id).unwrap();
+
+        let json = result.deleted_content.to_json().unwrap();
+        let parsed: DeletedContent = serde_json::from_str(&json).unwrap();
+
+        assert_eq!(parsed.parent_id, h1_id);
+        assert_eq!(parsed.block_count(), 2);
+        assert_eq!(parsed.structure, result.deleted_content.structure);
+    }
 }
@@ -5,6 +5,7 @@
 //! and semantic traversal.
 
 use serde::{Deserialize, Serialize};
+use std::borrow::Cow;
 use std::collections::{HashMap, HashSet, VecDeque};
 use ucm_core::{Block, BlockId, Content, Document, EdgeType};
 
@@ -56,6 +57,43 @@ pub struct TraversalFilter {
     pub edge_types: Vec<EdgeType>,
 }
 
+/// A `TraversalFilter` prepared once per traversal, so per-block checks
+/// do not redo work that depends only on the filter.
+struct CompiledFilter<'a> {
+    include_roles: HashSet<&'a str>,
+    exclude_roles: HashSet<&'a str>,
+    include_tags: HashSet<&'a str>,
+    exclude_tags: HashSet<&'a str>,
+    /// `content_pattern`, lowercased once
+    content_pattern: Option<String>,
+    edge_types: HashSet<&'a EdgeType>,
+    /// True when no criterion can reject a block (edge types only affect edges)
+    accepts_all: bool,
+}
+
+impl<'a> CompiledFilter<'a> {
+    fn new(filter: &'a TraversalFilter) -> Self {
+        let set = |items: &'a [String]| items.iter().map(String::as_str).collect::<HashSet<_>>();
+        Self {
+            include_roles: set(&filter.include_roles),
+            exclude_roles: set(&filter.exclude_roles),
+            include_tags: set(&filter.include_tags),
+            exclude_tags: set(&filter.exclude_tags),
+            content_pattern: filter.content_pattern.as_ref().map(|p| p.to_lowercase()),
+            edge_types: filter.edge_types.iter().collect(),
+            accepts_all: filter.include_roles.is_empty()
+                && filter.exclude_roles.is_empty()
+                && filter.include_tags.is_empty()
+                && filter.exclude_tags.is_empty()
+                && filter.content_pattern.is_none(),
+        }
+    }
+
+    fn follows_edge(&self, edge_type: &EdgeType) -> bool {
+        self.edge_types.is_empty() || self.edge_types.contains(edge_type)
+    }
+}
+
 /// A node in the traversal result
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct TraversalNode {
@@ -173,20 +211,21 @@ impl TraversalEngine {
             .unwrap_or(self.config.max_depth)
             .min(self.config.max_depth);
         let filter = filter.unwrap_or_default();
+        let compiled = CompiledFilter::new(&filter);
 
         #[cfg(not(target_arch = "wasm32"))]
         let start_time = std::time::Instant::now();
 
         let result = match direction {
-            NavigateDirection::Down => self.traverse_down(doc, start, max_depth, &filter, output),
-            NavigateDirection::Up => self.traverse_up(doc, start, max_depth, &filter, output),
-            NavigateDirection::Both => self.traverse_both(doc, start, max_depth, &filter, output),
-            NavigateDirection::Siblings => self.traverse_siblings(doc, start, &filter, output),
+            NavigateDirection::Down => self.traverse_down(doc, start, max_depth, &compiled, output),
+            NavigateDirection::Up => self.traverse_up(doc, start, max_depth, &compiled, output),
+            NavigateDirection::Both => self.traverse_both(doc, start, max_depth, &compiled, output),
+            NavigateDirection::Siblings => self.traverse_siblings(doc, start, &compiled, output),
             NavigateDirection::BreadthFirst => {
-                self.traverse_bfs(doc, start, max_depth, &filter, output)
+                self.traverse_bfs(doc, start, max_depth, &compiled, output)
             }
             NavigateDirection::DepthFirst => {
-                self.traverse_dfs(doc, start, max_depth, &filter, output)
+                self.traverse_dfs(doc, start, max_depth, &compiled, output)
             }
         }?;
 
@@ -222,15 +261,15 @@ impl TraversalEngine {
 
     /// Get the path from a node to the root
     pub fn path_to_root(&self, doc: &Document, node_id: &BlockId) -> Result<Vec<BlockId>> {
-        let mut path = vec![*node_id];
-        let mut current = *node_id;
-
-        while let Some(parent) = doc.parent(&current) {
-            path.push(*parent);
-            if *parent == doc.root {
+        // One parent-map pass instead of a `parent()` scan per level
+        let ancestors = doc.ancestors(node_id);
+        let mut path = Vec::with_capacity(ancestors.len() + 1);
+        path.push(*node_id);
+        for parent in ancestors {
+            path.push(parent);
+            if parent == doc.root {
                 break;
             }
-            current = *parent;
         }
 
         path.reverse();
@@ -246,82 +285,159 @@ impl TraversalEngine {
         max_paths: usize,
     ) -> Result<Vec<Vec<BlockId>>> {
         let mut paths = Vec::new();
-        let mut visited = HashSet::new();
+        if max_paths == 0 {
+            return Ok(paths);
+        }
+        if from == to {
+            paths.push(vec![*from]);
+            return Ok(paths);
+        }
+
+        // Iterative DFS over simple paths: each stack frame is a node and the
+        // index of the next neighbor to try; `current_path` mirrors the stack
+        let mut visited = HashSet::from([*from]);
         let mut current_path = vec![*from];
+        let mut stack = vec![(*from, 0usize)];
 
-        self.find_paths_recursive(
-            doc,
-            from,
-            to,
-            &mut visited,
-            &mut current_path,
-            &mut paths,
-            max_paths,
-        )?;
+        while paths.len() < max_paths {
+            let Some((node, next)) = stack.last_mut() else {
+                break;
+            };
+            let node = *node;
+            let neighbor = Self::path_neighbor(doc, &node, *next);
+            *next += 1;
+
+            match neighbor {
+                None => {
+                    visited.remove(&node);
+                    stack.pop();
+                    current_path.pop();
+                }
+                Some(id) if visited.contains(&id) => {}
+                Some(id) if id == *to => {
+                    let mut path = Vec::with_capacity(current_path.len() + 1);
+                    path.extend_from_slice(&current_path);
+                    path.push(id);
+                    paths.push(path);
+                }
+                Some(id) => {
+                    visited.insert(id);
+                    current_path.push(id);
+                    stack.push((id, 0));
+                }
+            }
+        }
 
         Ok(paths)
     }
 
-    #[allow(clippy::too_many_arguments)]
-    fn find_paths_recursive(
-        &self,
-        doc: &Document,
-        current: &BlockId,
-        target: &BlockId,
-        visited: &mut HashSet<BlockId>,
-        current_path: &mut Vec<BlockId>,
-        paths: &mut Vec<Vec<BlockId>>,
-        max_paths: usize,
-    ) -> Result<()> {
-        if paths.len() >= max_paths {
-            return Ok(());
+    /// The `index`-th neighbor of `node` for path finding: its children
+    /// first, then the targets of its edges.
+    fn path_neighbor(doc: &Document, node: &BlockId, index: usize) -> Option<BlockId> {
+        let children = doc.children(node);
+        match children.get(index) {
+            Some(child) => Some(*child),
+            None => doc
+                .get_block(node)
+                .and_then(|block| block.edges.get(index - children.len()))
+                .map(|edge| edge.target),
         }
+    }
 
-        if current == target {
-            paths.push(current_path.clone());
-            return Ok(());
+    /// Find a shortest path between two nodes, following children and edge
+    /// targets like `find_paths`.
+    ///
+    /// Runs a bidirectional BFS that always grows the smaller frontier by one
+    /// level, so a path of length d costs roughly O(b^(d/2)) expansions
+    /// instead of the O(b^d) of enumerating paths forward.
+    pub fn shortest_path(
+        &self,
+        doc: &Document,
+        from: &BlockId,
+        to: &BlockId,
+    ) -> Result<Option<Vec<BlockId>>> {
+        if from == to {
+            return Ok(Some(vec![*from]));
         }
 
-        visited.insert(*current);
-
-        // Check children
-        for child in doc.children(current) {
-            if !visited.contains(child) {
-                current_path.push(*child);
-                self.find_paths_recursive(
-                    doc,
-                    child,
-                    target,
-                    visited,
-                    current_path,
-                    paths,
-                    max_paths,
-                )?;
-                current_path.pop();
+        // Predecessors of a node are its structural parent and the sources of
+        // edges pointing at it; the parent side needs one pass over `structure`
+        let parents: HashMap<&BlockId, &BlockId> = doc
+            .structure
+            .iter()
+            .flat_map(|(parent, children)| children.iter().map(move |child| (child, parent)))
+            .collect();
+
+        // Each side maps a reached node to its neighbor one step closer to
+        // that side's endpoint
+        let mut forward: HashMap<BlockId, Option<BlockId>> = HashMap::from([(*from, None)]);
+        let mut backward: HashMap<BlockId, Option<BlockId>> = HashMap::from([(*to, None)]);
+        let mut forward_frontier = vec![*from];
+        let mut backward_frontier = vec![*to];
+
+        let meeting = 'search: loop {
+            if forward_frontier.is_empty() || backward_frontier.is_empty() {
+                return Ok(None);
             }
-        }
 
-        // Check edges
-        if let Some(block) = doc.get_block(current) {
-            for edge in &block.edges {
-                if !visited.contains(&edge.target) {
-                    current_path.push(edge.target);
-                    self.find_paths_recursive(
-                        doc,
-                        &edge.target,
-                        target,
-                        visited,
-                        current_path,
-                        paths,
-                        max_paths,
-                    )?;
-                    current_path.pop();
+            let mut next = Vec::new();
+            if forward_frontier.len() <= backward_frontier.len() {
+                for node in &forward_frontier {
+                    let block = doc.get_block(node);
+                    let successors = doc.children(node).iter().copied().chain(
+                        block
+                            .into_iter()
+                            .flat_map(|block| block.edges.iter().map(|edge| edge.target)),
+                    );
+                    for id in successors {
+                        if forward.contains_key(&id) {
+                            continue;
+                        }
+                        forward.insert(id, Some(*node));
+                        if backward.contains_key(&id) {
+                            break 'search id;
+                        }
+                        next.push(id);
+                    }
                 }
+                forward_frontier = next;
+            } else {
+                for node in &backward_frontier {
+                    let predecessors = parents.get(node).map(|parent| **parent).into_iter().chain(
+                        doc.edge_index
+                            .incoming_to(node)
+                            .iter()
+                            .map(|(_, source)| *source),
+                    );
+                    for id in predecessors {
+                        if backward.contains_key(&id) {
+                            continue;
+                        }
+                        backward.insert(id, Some(*node));
+                        if forward.contains_key(&id) {
+                            break 'search id;
+                        }
+                        next.push(id);
+                    }
+                }
+                backward_frontier = next;
             }
+        };
+
+        let mut path = vec![meeting];
+        let mut current = meeting;
+        while let Some(Some(prev)) = forward.get(&current) {
+            path.push(*prev);
+            current = *prev;
+        }
+        path.reverse();
+        current = meeting;
+        while let Some(Some(next)) = backward.get(&current) {
+            path.push(*next);
+            current = *next;
         }
 
-        visited.remove(current);
-        Ok(())
+        Ok(Some(path))
     }
 
     /// Traverse downward from a starting node
@@ -330,7 +446,7 @@ impl TraversalEngine {
         doc: &Document,
         start: BlockId,
         max_depth: usize,
-        filter: &TraversalFilter,
+        filter: &CompiledFilter,
         output: TraversalOutput,
     ) -> Result<TraversalResult> {
         self.traverse_bfs(doc, start, max_depth, filter, output)
@@ -342,31 +458,32 @@ impl TraversalEngine {
         doc: &Document,
         start: BlockId,
         max_depth: usize,
-        filter: &TraversalFilter,
+        filter: &CompiledFilter,
         output: TraversalOutput,
     ) -> Result<TraversalResult> {
         let mut nodes = Vec::new();
-        let mut current = start;
-        let mut depth = 0;
+        let ancestors = doc.ancestors(&start);
+        let chain = std::iter::once(start).chain(ancestors.iter().copied());
 
-        while depth <= max_depth {
+        for (depth, current) in chain.enumerate().take(max_depth.saturating_add(1)) {
             if let Some(block) = doc.get_block(&current) {
                 if self.matches_filter(block, filter) {
-                    nodes.push(self.create_traversal_node(doc, &current, depth, None, output));
+                    let child_count = doc.children(&current).len();
+                    nodes.push(self.create_traversal_node(
+                        &current,
+                        block,
+                        depth,
+                        None,
+                        child_count,
+                        output,
+                    ));
                 }
             }
-
-            if let Some(parent) = doc.parent(&current) {
-                current = *parent;
-                depth += 1;
-            } else {
-                break;
-            }
         }
 
         let summary = TraversalSummary {
             total_nodes: nodes.len(),
-            max_depth: depth,
+            max_depth: ancestors.len().min(max_depth.saturating_add(1)),
             ..Default::default()
         };
 
@@ -385,27 +502,31 @@ impl TraversalEngine {
         doc: &Document,
         start: BlockId,
         max_depth: usize,
-        filter: &TraversalFilter,
+        filter: &CompiledFilter,
         output: TraversalOutput,
     ) -> Result<TraversalResult> {
         let up_result = self.traverse_up(doc, start, max_depth, filter, output)?;
         let down_result = self.traverse_down(doc, start, max_depth, filter, output)?;
 
-        // Merge results, avoiding duplicates
-        let mut seen = HashSet::new();
-        let mut nodes = Vec::new();
+        // Merge results, avoiding duplicates. The downward BFS never repeats a
+        // node, so only the (short) upward chain needs to go in the seen set.
+        let mut nodes = up_result.nodes;
+        let mut seen = HashSet::with_capacity(nodes.len());
+        // Only the start node can appear on both sides (at depth 0), so the
+        // downward summary already holds the deepest downward node
+        let mut max_depth = down_result.summary.max_depth;
+        nodes.retain(|node| {
+            max_depth = max_depth.max(node.depth);
+            seen.insert(node.id)
+        });
+        nodes.reserve(down_result.nodes.len());
+        nodes.extend(
+            down_result
+                .nodes
+                .into_iter()
+                .filter(|node| !seen.contains(&node.id)),
+        );
 
-        for node in up_result
-            .nodes
-            .into_iter()
-            .chain(down_result.nodes.into_iter())
-        {
-            if seen.insert(node.id) {
-                nodes.push(node);
-            }
-        }
-
-        let max_depth = nodes.iter().map(|n| n.depth).max().unwrap_or(0);
         let summary = TraversalSummary {
             total_nodes: nodes.len(),
             max_depth,
@@ -426,7 +547,7 @@ impl TraversalEngine {
         &self,
         doc: &Document,
         start: BlockId,
-        filter: &TraversalFilter,
+        filter: &CompiledFilter,
         output: TraversalOutput,
     ) -> Result<TraversalResult> {
         let mut nodes = Vec::new();
@@ -436,10 +557,11 @@ impl TraversalEngine {
                 if let Some(block) = doc.get_block(sibling) {
                     if self.matches_filter(block, filter) {
                         nodes.push(self.create_traversal_node(
-                            doc,
                             sibling,
+                            block,
                             0,
                             Some(*parent),
+                            doc.children(sibling).len(),
                             output,
                         ));
                     }
@@ -468,42 +590,63 @@ impl TraversalEngine {
         doc: &Document,
         start: BlockId,
         max_depth: usize,
-        filter: &TraversalFilter,
+        filter: &CompiledFilter,
         output: TraversalOutput,
     ) -> Result<TraversalResult> {
-        let mut nodes = Vec::new();
+        // Expanding a single node (or just looking at it) is the hottest
+        // call shape and needs neither a queue nor a visited set
+        if max_depth <= 1 {
+            return self.traverse_shallow(doc, start, max_depth, filter, output);
+        }
+
+        // Sized up front so the hot loop never regrows the node list
+        let max_nodes = self.config.max_nodes;
+        let mut nodes = Vec::with_capacity(max_nodes.min(doc.block_count()));
         let mut edges = Vec::new();
         let mut visited = HashSet::new();
         let mut queue = VecDeque::new();
-        let mut nodes_by_role: HashMap<String, usize> = HashMap::new();
+        // Keyed by the static category name; converted to owned keys once at the end
+        let mut role_counts: HashMap<&'static str, usize> = HashMap::new();
+        let mut max_depth_found = 0;
 
+        // Without a node filter every queued block becomes a node, so the
+        // queue never needs to outgrow the remaining node budget
+        let bound_queue = filter.accepts_all;
+
+        // Nodes are marked visited when enqueued, so each is queued at most
+        // once and nothing needs re-checking on dequeue
+        visited.insert(start);
         queue.push_back((start, None::<BlockId>, 0usize));
 
         while let Some((node_id, parent_id, depth)) = queue.pop_front() {
-            if depth > max_depth || nodes.len() >= self.config.max_nodes {
+            if depth > max_depth || nodes.len() >= max_nodes {
                 break;
             }
 
-            if visited.contains(&node_id) {
-                continue;
-            }
-            visited.insert(node_id);
-
             if let Some(block) = doc.get_block(&node_id) {
-                if self.matches_filter(block, filter) {
-                    let node = self.create_traversal_node(doc, &node_id, depth, parent_id, output);
+                // Looked up once for both the node's child count and the queue
+                let children = doc.children(&node_id);
 
-                    if let Some(role) = &node.semantic_role {
-                        *nodes_by_role.entry(role.clone()).or_insert(0) += 1;
+                if self.matches_filter(block, filter) {
+                    let node = self.create_traversal_node(
+                        &node_id,
+                        block,
+                        depth,
+                        parent_id,
+                        children.len(),
+                        output,
+                    );
+
+                    if let Some(role) = &block.metadata.semantic_role {
+                        *role_counts.entry(role.category.as_str()).or_insert(0) += 1;
                     }
 
+                    max_depth_found = max_depth_found.max(depth);
                     nodes.push(node);
 
                     // Collect edges
                     for edge in &block.edges {
-                        if filter.edge_types.is_empty()
-                            || filter.edge_types.contains(&edge.edge_type)
-                        {
+                        if filter.follows_edge(&edge.edge_type) {
                             edges.push(TraversalEdge {
                                 source: node_id,
                                 target: edge.target,
@@ -513,29 +656,30 @@ impl TraversalEngine {
                     }
                 }
 
-                // Add children to queue
-                for child in doc.children(&node_id) {
-                    if !visited.contains(child) {
-                        queue.push_back((*child, Some(node_id), depth + 1));
+                // Add children to queue; nothing below max_depth is emitted
+                if depth < max_depth {
+                    for child in children {
+                        if bound_queue && nodes.len() + queue.len() >= max_nodes {
+                            break;
+                        }
+                        if visited.insert(*child) {
+                            queue.push_back((*child, Some(node_id), depth + 1));
+                        }
                     }
                 }
             }
         }
 
-        let max_depth_found = nodes.iter().map(|n| n.depth).max().unwrap_or(0);
-        let truncated = nodes.len() >= self.config.max_nodes;
+        let truncated = nodes.len() >= max_nodes;
 
         let summary = TraversalSummary {
             total_nodes: nodes.len(),
             total_edges: edges.len(),
             max_depth: max_depth_found,
-            nodes_by_role,
+            nodes_by_role: owned_role_counts(role_counts),
             truncated,
             truncation_reason: if truncated {
-                Some(format!(
-                    "Max nodes limit ({}) reached",
-                    self.config.max_nodes
-                ))
+                Some(format!("Max nodes limit ({}) reached", max_nodes))
             } else {
                 None
             },
@@ -550,48 +694,86 @@ impl TraversalEngine {
         })
     }
 
-    /// Depth-first traversal
-    fn traverse_dfs(
+    /// Breadth-first traversal limited to the start node and, when
+    /// `max_depth` is 1, its direct children
+    fn traverse_shallow(
         &self,
         doc: &Document,
         start: BlockId,
         max_depth: usize,
-        filter: &TraversalFilter,
+        filter: &CompiledFilter,
         output: TraversalOutput,
     ) -> Result<TraversalResult> {
-        let mut nodes = Vec::new();
         let mut edges = Vec::new();
-        let mut visited = HashSet::new();
-        let mut nodes_by_role: HashMap<String, usize> = HashMap::new();
+        let mut role_counts: HashMap<&'static str, usize> = HashMap::new();
+        let mut max_depth_found = 0;
+
+        let children = doc.children(&start);
+        let expanded: &[BlockId] = if max_depth > 0 && doc.get_block(&start).is_some() {
+            children
+        } else {
+            &[]
+        };
+        let entries = std::iter::once((start, None, 0)).chain(
+            expanded
+                .iter()
+                .filter(|child| **child != start)
+                .map(|child| (*child, Some(start), 1)),
+        );
+        let max_nodes = self.config.max_nodes;
+        let mut nodes = Vec::with_capacity(max_nodes.min(expanded.len() + 1));
+
+        for (node_id, parent_id, depth) in entries {
+            if nodes.len() >= max_nodes {
+                break;
+            }
+            let Some(block) = doc.get_block(&node_id) else {
+                continue;
+            };
+            if !self.matches_filter(block, filter) {
+                continue;
+            }
 
-        self.dfs_recursive(
-            doc,
-            start,
-            None,
-            0,
-            max_depth,
-            filter,
-            output,
-            &mut visited,
-            &mut nodes,
-            &mut edges,
-            &mut nodes_by_role,
-        )?;
+            let child_count = if depth == 0 {
+                children.len()
+            } else {
+                doc.children(&node_id).len()
+            };
+            max_depth_found = max_depth_found.max(depth);
+            nodes.push(self.create_traversal_node(
+                &node_id,
+                block,
+                depth,
+                parent_id,
+                child_count,
+                output,
+            ));
+
+            if let Some(role) = &block.metadata.semantic_role {
+                *role_counts.entry(role.category.as_str()).or_insert(0) += 1;
+            }
+
+            for edge in &block.edges {
+                if filter.follows_edge(&edge.edge_type) {
+                    edges.push(TraversalEdge {
+                        source: node_id,
+                        target: edge.target,
+                        edge_type: edge.edge_type.clone(),
+                    });
+                }
+            }
+        }
 
-        let max_depth_found = nodes.iter().map(|n| n.depth).max().unwrap_or(0);
-        let truncated = nodes.len() >= self.config.max_nodes;
+        let truncated = nodes.len() >= max_nodes;
 
         let summary = TraversalSummary {
             total_nodes: nodes.len(),
             total_edges: edges.len(),
             max_depth: max_depth_found,
-            nodes_by_role,
+            nodes_by_role: owned_role_counts(role_counts),
             truncated,
             truncation_reason: if truncated {
-                Some(format!(
-                    "Max nodes limit ({}) reached",
-                    self.config.max_nodes
-                ))
+                Some(format!("Max nodes limit ({}) reached", max_nodes))
             } else {
                 None
             },
@@ -606,107 +788,122 @@ impl TraversalEngine {
         })
     }
 
-    #[allow(clippy::too_many_arguments)]
-    fn dfs_recursive(
+    /// Depth-first traversal
+    fn traverse_dfs(
         &self,
         doc: &Document,
-        node_id: BlockId,
-        parent_id: Option<BlockId>,
-        depth: usize,
+        start: BlockId,
         max_depth: usize,
-        filter: &TraversalFilter,
+        filter: &CompiledFilter,
         output: TraversalOutput,
-        visited: &mut HashSet<BlockId>,
-        nodes: &mut Vec<TraversalNode>,
-        edges: &mut Vec<TraversalEdge>,
-        nodes_by_role: &mut HashMap<String, usize>,
-    ) -> Result<()> {
-        if depth > max_depth || nodes.len() >= self.config.max_nodes {
-            return Ok(());
-        }
+    ) -> Result<TraversalResult> {
+        let max_nodes = self.config.max_nodes;
+        let mut nodes = Vec::with_capacity(max_nodes.min(doc.block_count()));
+        let mut edges = Vec::new();
+        let mut visited = HashSet::new();
+        // Keyed by the static category name; converted to owned keys once at the end
+        let mut role_counts: HashMap<&'static str, usize> = HashMap::new();
+        let mut max_depth_found = 0;
 
-        if visited.contains(&node_id) {
-            return Ok(());
-        }
-        visited.insert(node_id);
+        // Explicit stack instead of recursion so deep documents cannot
+        // overflow; children are pushed in reverse to keep pre-order
+        let mut stack = vec![(start, None::<BlockId>, 0usize)];
 
-        if let Some(block) = doc.get_block(&node_id) {
-            if self.matches_filter(block, filter) {
-                let node = self.create_traversal_node(doc, &node_id, depth, parent_id, output);
+        while let Some((node_id, parent_id, depth)) = stack.pop() {
+            if nodes.len() >= max_nodes {
+                break;
+            }
+            if depth > max_depth || !visited.insert(node_id) {
+                continue;
+            }
 
-                if let Some(role) = &node.semantic_role {
-                    *nodes_by_role.entry(role.clone()).or_insert(0) += 1;
-                }
+            if let Some(block) = doc.get_block(&node_id) {
+                let children = doc.children(&node_id);
 
-                nodes.push(node);
+                if self.matches_filter(block, filter) {
+                    let node = self.create_traversal_node(
+                        &node_id,
+                        block,
+                        depth,
+                        parent_id,
+                        children.len(),
+                        output,
+                    );
+
+                    if let Some(role) = &block.metadata.semantic_role {
+                        *role_counts.entry(role.category.as_str()).or_insert(0) += 1;
+                    }
 
-                // Collect edges
-                for edge in &block.edges {
-                    if filter.edge_types.is_empty() || filter.edge_types.contains(&edge.edge_type) {
-                        edges.push(TraversalEdge {
-                            source: node_id,
-                            target: edge.target,
-                            edge_type: edge.edge_type.clone(),
-                        });
+                    max_depth_found = max_depth_found.max(depth);
+                    nodes.push(node);
+
+                    // Collect edges
+                    for edge in &block.edges {
+                        if filter.follows_edge(&edge.edge_type) {
+                            edges.push(TraversalEdge {
+                                source: node_id,
+                                target: edge.target,
+                                edge_type: edge.edge_type.clone(),
+                            });
+                        }
                     }
                 }
-            }
 
-            // Recurse to children
-            for child in doc.children(&node_id) {
-                self.dfs_recursive(
-                    doc,
-                    *child,
-                    Some(node_id),
-                    depth + 1,
-                    max_depth,
-                    filter,
-                    output,
-                    visited,
-                    nodes,
-                    edges,
-                    nodes_by_role,
-                )?;
+                for child in children.iter().rev() {
+                    stack.push((*child, Some(node_id), depth + 1));
+                }
             }
         }
 
-        Ok(())
+        let truncated = nodes.len() >= max_nodes;
+
+        let summary = TraversalSummary {
+            total_nodes: nodes.len(),
+            total_edges: edges.len(),
+            max_depth: max_depth_found,
+            nodes_by_role: owned_role_counts(role_counts),
+            truncated,
+            truncation_reason: if truncated {
+                Some(format!("Max nodes limit ({}) reached", max_nodes))
+            } else {
+                None
+            },
+        };
+
+        Ok(TraversalResult {
+            nodes,
+            edges,
+            paths: Vec::new(),
+            summary,
+            metadata: TraversalMetadata::default(),
+        })
     }
 
     /// Check if a block matches the filter criteria
-    fn matches_filter(&self, block: &Block, filter: &TraversalFilter) -> bool {
-        // Check role inclusion
-        if !filter.include_roles.is_empty() {
-            let role = block
-                .metadata
+    fn matches_filter(&self, block: &Block, filter: &CompiledFilter) -> bool {
+        let metadata = &block.metadata;
+
+        // Check role inclusion/exclusion; a block without a role counts as ""
+        if !filter.include_roles.is_empty() || !filter.exclude_roles.is_empty() {
+            let role = metadata
                 .semantic_role
                 .as_ref()
-                .map(|r| r.category.as_str().to_string())
+                .map(|r| r.category.as_str())
                 .unwrap_or_default();
-            if !filter.include_roles.contains(&role) {
+            if !filter.include_roles.is_empty() && !filter.include_roles.contains(role) {
                 return false;
             }
-        }
-
-        // Check role exclusion
-        if !filter.exclude_roles.is_empty() {
-            let role = block
-                .metadata
-                .semantic_role
-                .as_ref()
-                .map(|r| r.category.as_str().to_string())
-                .unwrap_or_default();
-            if filter.exclude_roles.contains(&role) {
+            if filter.exclude_roles.contains(role) {
                 return false;
             }
         }
 
         // Check tag inclusion
         if !filter.include_tags.is_empty() {
-            let has_tag = filter
-                .include_tags
+            let has_tag = metadata
+                .tags
                 .iter()
-                .any(|t| block.metadata.tags.contains(t));
+                .any(|t| filter.include_tags.contains(t.as_str()));
             if !has_tag {
                 return false;
             }
@@ -714,10 +911,10 @@ impl TraversalEngine {
 
         // Check tag exclusion
         if !filter.exclude_tags.is_empty() {
-            let has_excluded = filter
-                .exclude_tags
+            let has_excluded = metadata
+                .tags
                 .iter()
-                .any(|t| block.metadata.tags.contains(t));
+                .any(|t| filter.exclude_tags.contains(t.as_str()));
             if has_excluded {
                 return false;
             }
@@ -726,10 +923,7 @@ impl TraversalEngine {
         // Check content pattern
         if let Some(ref pattern) = filter.content_pattern {
             let content_text = self.extract_content_text(&block.content);
-            if !content_text
-                .to_lowercase()
-                .contains(&pattern.to_lowercase())
-            {
+            if !content_text.to_lowercase().contains(pattern.as_str()) {
                 return false;
             }
         }
@@ -737,65 +931,81 @@ impl TraversalEngine {
         true
     }
 
-    /// Create a traversal node from a block
+    /// Create a traversal node from a block the caller has already looked up
     fn create_traversal_node(
         &self,
-        doc: &Document,
         block_id: &BlockId,
+        block: &Block,
         depth: usize,
         parent_id: Option<BlockId>,
+        child_count: usize,
         output: TraversalOutput,
     ) -> TraversalNode {
-        let block = doc.get_block(block_id);
-        let children = doc.children(block_id);
-
         let content_preview = match output {
             TraversalOutput::StructureOnly => None,
-            TraversalOutput::StructureWithPreviews | TraversalOutput::StructureAndBlocks => block
-                .map(|b| {
-                    let text = self.extract_content_text(&b.content);
-                    if text.len() > self.config.default_preview_length {
-                        format!("{}...", &text[..self.config.default_preview_length])
-                    } else {
-                        text
+            TraversalOutput::StructureWithPreviews | TraversalOutput::StructureAndBlocks => {
+                let text = self.extract_content_text(&block.content);
+                let limit = self.config.default_preview_length;
+                if text.len() > limit {
+                    // Cut on a char boundary so multi-byte text cannot panic
+                    let mut end = limit;
+                    while !text.is_char_boundary(end) {
+                        end -= 1;
                     }
-                }),
+                    let mut preview = String::with_capacity(end + 3);
+                    preview.push_str(&text[..end]);
+                    preview.push_str("...");
+                    Some(preview)
+                } else {
+                    Some(text.into_owned())
+                }
+            }
         };
 
         let semantic_role = block
-            .and_then(|b| b.metadata.semantic_role.as_ref())
+            .metadata
+            .semantic_role
+            .as_ref()
             .map(|r| r.category.as_str().to_string());
 
-        let edge_count = block.map(|b| b.edges.len()).unwrap_or(0);
-
         TraversalNode {
             id: *block_id,
             depth,
             parent_id,
             content_preview,
             semantic_role,
-            child_count: children.len(),
-            edge_count,
+            child_count,
+            edge_count: block.edges.len(),
         }
     }
 
-    /// Extract text content from a Content enum
-    fn extract_content_text(&self, content: &Content) -> String {
+    /// Extract text content from a Content enum, borrowing it where the
+    /// content already holds the text
+    fn extract_content_text<'c>(&self, content: &'c Content) -> Cow<'c, str> {
         match content {
-            Content::Text(t) => t.text.clone(),
-            Content::Code(c) => c.source.clone(),
-            Content::Table(t) => format!("Table: {} rows", t.rows.len()),
-            Content::Math(m) => m.expression.clone(),
-            Content::Media(m) => m.alt_text.clone().unwrap_or_else(|| "Media".to_string()),
-            Content::Json { .. } => "JSON data".to_string(),
-            Content::Binary { .. } => "Binary data".to_string(),
+            Content::Text(t) => Cow::Borrowed(&t.text),
+            Content::Code(c) => Cow::Borrowed(&c.source),
+            Content::Table(t) => Cow::Owned(format!("Table: {} rows", t.rows.len())),
+            Content::Math(m) => Cow::Borrowed(&m.expression),
+            Content::Media(m) => Cow::Borrowed(m.alt_text.as_deref().unwrap_or("Media")),
+            Content::Json { .. } => Cow::Borrowed("JSON data"),
+            Content::Binary { .. } => Cow::Borrowed("Binary data"),
             Content::Composite { children, .. } => {
-                format!("Composite: {} children", children.len())
+                Cow::Owned(format!("Composite: {} children", children.len()))
             }
         }
     }
 }
 
+/// Convert per-role counts keyed by static category names into the owned
+/// keys `TraversalSummary` exposes, allocating once per distinct role.
+fn owned_role_counts(counts: HashMap<&'static str, usize>) -> HashMap<String, usize> {
+    counts
+        .into_iter()
+        .map(|(role, count)| (role.to_string(), count))
+        .collect()
+}
+
 impl Default for TraversalEngine {
     fn default() -> Self {
         Self::new()
@@ -866,6 +1076,199 @@ mod tests {
         assert!(!result.nodes.is_empty());
     }
 
+    #[test]
+    fn test_bfs_visits_shared_child_once() {
+        let mut doc = create_test_document();
+        let h1_id = doc.children(&doc.root)[0];
+        let h2_id = doc.children(&h1_id)[1];
+        let p2_id = doc.children(&h2_id)[0];
+        // Malformed structure: p2 listed under both h1 and h2
+        doc.structure.get_mut(&h1_id).unwrap().push(p2_id);
+        let engine = TraversalEngine::new();
+
+        let result = engine
+            .navigate(
+                &doc,
+                None,
+                NavigateDirection::BreadthFirst,
+                Some(10),
+                None,
+                TraversalOutput::StructureOnly,
+            )
+            .unwrap();
+
+        assert_eq!(result.nodes.len(), 5);
+        let p2 = result.nodes.iter().find(|n| n.id == p2_id).unwrap();
+        assert_eq!(p2.parent_id, Some(h1_id));
+        assert_eq!(p2.depth, 2);
+    }
+
+    #[test]
+    fn test_traverse_both_merges_without_duplicates() {
+        let doc = create_test_document();
+        let h1_id = doc.children(&doc.root)[0];
+        let h2_id = doc.children(&h1_id)[1];
+        let p2_id = doc.children(&h2_id)[0];
+        let engine = TraversalEngine::new();
+
+        let result = engine
+            .navigate(
+                &doc,
+                Some(h2_id),
+                NavigateDirection::Both,
+                Some(10),
+                None,
+                TraversalOutput::StructureOnly,
+            )
+            .unwrap();
+
+        let order: Vec<BlockId> = result.nodes.iter().map(|n| n.id).collect();
+        assert_eq!(order, vec![h2_id, h1_id, doc.root, p2_id]);
+        assert_eq!(result.summary.total_nodes, 4);
+        assert_eq!(result.summary.max_depth, 2);
+    }
+
+    #[test]
+    fn test_bfs_max_nodes_truncates() {
+        let mut doc = Document::new(DocumentId::new("wide"));
+        let root = doc.root;
+        for i in 0..50 {
+            let block = Block::new(Content::text(format!("Item {i}")), None);
+            doc.add_block(block, &root).unwrap();
+        }
+        let engine = TraversalEngine::with_config(TraversalConfig {
+            max_nodes: 10,
+            ..Default::default()
+        });
+
+        let result = engine
+            .navigate(
+                &doc,
+                None,
+                NavigateDirection::BreadthFirst,
+                None,
+                None,
+                TraversalOutput::StructureOnly,
+            )
+            .unwrap();
+
+        assert_eq!(result.nodes.len(), 10);
+        assert!(result.summary.truncated);
+        let emitted: Vec<BlockId> = result.nodes[1..].iter().map(|n| n.id).collect();
+        assert_eq!(emitted, doc.children(&root)[..9]);
+    }
+
+    #[test]
+    fn test_dfs_preorder() {
+        let doc = create_test_document();
+        let engine = TraversalEngine::new();
+        let h1_id = doc.children(&doc.root)[0];
+        let p1_id = doc.children(&h1_id)[0];
+        let h2_id = doc.children(&h1_id)[1];
+        let p2_id = doc.children(&h2_id)[0];
+
+        let result = engine
+            .navigate(
+                &doc,
+                None,
+                NavigateDirection::DepthFirst,
+                Some(10),
+                None,
+                TraversalOutput::StructureOnly,
+            )
+            .unwrap();
+
+        let order: Vec<BlockId> = result.nodes.iter().map(|n| n.id).collect();
+        assert_eq!(order, vec![doc.root, h1_id, p1_id, h2_id, p2_id]);
+        assert_eq!(result.nodes[4].parent_id, Some(h2_id));
+        assert_eq!(result.nodes[1].child_count, 2);
+        assert_eq!(result.nodes[4].child_count, 0);
+        assert_eq!(result.summary.max_depth, 3);
+        assert_eq!(result.summary.nodes_by_role.get("paragraph"), Some(&2));
+        assert_eq!(result.summary.nodes_by_role.get("heading1"), Some(&1));
+    }
+
+    #[test]
+    fn test_dfs_deep_chain() {
+        let mut doc = Document::new(DocumentId::new("deep"));
+        let mut parent = doc.root;
+        for i in 0..20_000 {
+            let block = Block::new(Content::text(format!("Level {i}")), None);
+            parent = doc.add_block(block, &parent).unwrap();
+        }
+
+        let engine = TraversalEngine::with_config(TraversalConfig {
+            max_depth: usize::MAX,
+            max_nodes: usize::MAX,
+            ..Default::default()
+        });
+        let result = engine
+            .navigate(
+                &doc,
+                None,
+                NavigateDirection::DepthFirst,
+                None,
+                None,
+                TraversalOutput::StructureOnly,
+            )
+            .unwrap();
+
+        assert_eq!(result.nodes.len(), 20_001);
+        assert_eq!(result.summary.max_depth, 20_000);
+    }
+
+    #[test]
+    fn test_find_paths_through_children_and_edges() {
+        let mut doc = create_test_document();
+        let h1_id = doc.children(&doc.root)[0];
+        let h2_id = doc.children(&h1_id)[1];
+        let p2_id = doc.children(&h2_id)[0];
+        doc.blocks
+            .get_mut(&h1_id)
+            .unwrap()
+            .add_edge(ucm_core::Edge::new(EdgeType::References, p2_id));
+        let engine = TraversalEngine::new();
+
+        let paths = engine.find_paths(&doc, &doc.root, &p2_id, 10).unwrap();
+        assert_eq!(
+            paths,
+            vec![
+                vec![doc.root, h1_id, h2_id, p2_id],
+                vec![doc.root, h1_id, p2_id],
+            ]
+        );
+
+        let paths = engine.find_paths(&doc, &doc.root, &p2_id, 1).unwrap();
+        assert_eq!(paths.len(), 1);
+        assert!(engine
+            .find_paths(&doc, &p2_id, &h1_id, 10)
+            .unwrap()
+            .is_empty());
+    }
+
+    #[test]
+    fn test_shortest_path_prefers_edge_shortcut() {
+        let mut doc = create_test_document();
+        let h1_id = doc.children(&doc.root)[0];
+        let h2_id = doc.children(&h1_id)[1];
+        let p2_id = doc.children(&h2_id)[0];
+        let engine = TraversalEngine::new();
+
+        let path = engine.shortest_path(&doc, &doc.root, &p2_id).unwrap();
+        assert_eq!(path, Some(vec![doc.root, h1_id, h2_id, p2_id]));
+
+        doc.add_edge(&h1_id, EdgeType::References, p2_id);
+        let path = engine.shortest_path(&doc, &doc.root, &p2_id).unwrap();
+        assert_eq!(path, Some(vec![doc.root, h1_id, p2_id]));
+
+        // Children and edges point away from the root, so nothing leads back
+        assert_eq!(engine.shortest_path(&doc, &p2_id, &doc.root).unwrap(), None);
+        assert_eq!(
+            engine.shortest_path(&doc, &h2_id, &h2_id).unwrap(),
+            Some(vec![h2_id])
+        );
+    }
+
     #[test]
     fn test_path_to_root() {
         let doc = create_test_document();
@@ -882,8 +1285,7 @@ mod tests {
                     .unwrap_or(false)
             }) {
                 let path = engine.path_to_root(&doc, h2_id).unwrap();
-                assert!(path.len() >= 2);
-                assert_eq!(path[0], doc.root);
+                assert_eq!(path, vec![doc.root, *h1_id, *h2_id]);
             }
         }
     }
@@ -917,6 +1319,91 @@ mod tests {
         }
     }
 
+    #[test]
+    fn test_filter_by_tags_and_excluded_roles() {
+        let mut doc = create_test_document();
+        let h1_id = doc.children(&doc.root)[0];
+        let p1_id = doc.children(&h1_id)[0];
+        let h2_id = doc.children(&h1_id)[1];
+        for id in [h1_id, p1_id, h2_id] {
+            doc.blocks
+                .get_mut(&id)
+                .unwrap()
+                .metadata
+                .tags
+                .push("draft".to_string());
+        }
+        let engine = TraversalEngine::new();
+
+        let filter = TraversalFilter {
+            include_tags: vec!["draft".to_string(), "unused".to_string()],
+            exclude_roles: vec!["paragraph".to_string()],
+            ..Default::default()
+        };
+
+        let result = engine
+            .navigate(
+                &doc,
+                None,
+                NavigateDirection::BreadthFirst,
+                Some(10),
+                Some(filter),
+                TraversalOutput::StructureOnly,
+            )
+            .unwrap();
+
+        let ids: Vec<BlockId> = result.nodes.iter().map(|n| n.id).collect();
+        assert_eq!(ids, vec![h1_id, h2_id]);
+    }
+
+    #[test]
+    fn test_filter_by_content_pattern_ignores_case() {
+        let doc = create_test_document();
+        let engine = TraversalEngine::new();
+
+        let filter = TraversalFilter {
+            content_pattern: Some("SECTION".to_string()),
+            ..Default::default()
+        };
+
+        let result = engine
+            .navigate(
+                &doc,
+                None,
+                NavigateDirection::BreadthFirst,
+                Some(10),
+                Some(filter),
+                TraversalOutput::StructureWithPreviews,
+            )
+            .unwrap();
+
+        let previews: Vec<&str> = result
+            .nodes
+            .iter()
+            .filter_map(|n| n.content_preview.as_deref())
+            .collect();
+        assert_eq!(previews, vec!["Section 1.1", "Section content"]);
+    }
+
+    #[test]
+    fn test_preview_truncates_on_char_boundary() {
+        let mut doc = Document::new(DocumentId::new("previews"));
+        let root = doc.root;
+        // Each 'é' is two bytes, so byte 5 falls inside a character
+        let block = Block::new(Content::text("éééééééé"), None);
+        let id = doc.add_block(block, &root).unwrap();
+        let engine = TraversalEngine::with_config(TraversalConfig {
+            default_preview_length: 5,
+            ..Default::default()
+        });
+
+        let result = engine
+            .expand(&doc, &root, TraversalOutput::StructureWithPreviews)
+            .unwrap();
+        let node = result.nodes.iter().find(|n| n.id == id).unwrap();
+        assert_eq!(node.content_preview.as_deref(), Some("éé..."));
+    }
+
     #[test]
     fn test_expand_node() {
         let doc = create_test_document();
@@ -930,6 +1417,40 @@ mod tests {
         assert!(!result.nodes.is_empty());
     }
 
+    #[test]
+    fn test_shallow_traversal_skips_queue() {
+        let doc = create_test_document();
+        let h1_id = doc.children(&doc.root)[0];
+        let engine = TraversalEngine::new();
+
+        let result = engine
+            .navigate(
+                &doc,
+                Some(h1_id),
+                NavigateDirection::BreadthFirst,
+                Some(0),
+                None,
+                TraversalOutput::StructureOnly,
+            )
+            .unwrap();
+        assert_eq!(result.nodes.len(), 1);
+        assert_eq!(result.nodes[0].id, h1_id);
+        assert_eq!(result.nodes[0].child_count, 2);
+
+        let result = engine
+            .expand(&doc, &h1_id, TraversalOutput::StructureOnly)
+            .unwrap();
+        let order: Vec<BlockId> = result.nodes.iter().map(|n| n.id).collect();
+        let mut expected = vec![h1_id];
+        expected.extend_from_slice(doc.children(&h1_id));
+        assert_eq!(order, expected);
+        assert!(result.nodes[1..]
+            .iter()
+            .all(|n| n.depth == 1 && n.parent_id == Some(h1_id)));
+        assert_eq!(result.summary.max_depth, 1);
+        assert_eq!(result.summary.nodes_by_role.get("paragraph"), Some(&1));
+    }
+
     #[test]
     fn test_max_depth_limit() {
         let doc = create_test_document();
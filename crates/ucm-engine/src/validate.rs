@@ -44,8 +44,16 @@ impl ValidationResult {
     }
 
     pub fn merge(&mut self, other: ValidationResult) {
-        self.issues.extend(other.issues);
         self.valid = self.valid && other.valid;
+        // Most per-block results are clean; when one side is empty, move instead of copying
+        if other.issues.is_empty() {
+            return;
+        }
+        if self.issues.is_empty() {
+            self.issues = other.issues;
+        } else {
+            self.issues.extend(other.issues);
+        }
     }
 }
 
@@ -302,6 +310,30 @@ mod tests {
         assert!(result.valid);
     }
 
+    #[test]
+    fn test_merge() {
+        let error = || ValidationIssue::error(ErrorCode::E001BlockNotFound, "missing");
+        let warning = || ValidationIssue::warning(ErrorCode::E203OrphanedBlock, "orphan");
+
+        let mut result = ValidationResult::valid();
+        result.merge(ValidationResult::valid());
+        assert!(result.valid && result.issues.is_empty());
+
+        result.merge(ValidationResult::invalid(vec![warning()]));
+        assert!(result.valid);
+        result.merge(ValidationResult::invalid(vec![error()]));
+        assert!(!result.valid);
+        assert_eq!(result.issues.len(), 2);
+
+        // An empty but invalid result still invalidates the merge target
+        let mut result = ValidationResult::valid();
+        result.merge(ValidationResult {
+            valid: false,
+            issues: Vec::new(),
+        });
+        assert!(!result.valid);
+    }
+
     #[test]
     fn test_orphan_detection() {
         let validator = ValidationPipeline::new();
@@ -194,6 +194,8 @@ pub struct AgentTraversal {
     circuit_breaker: CircuitBreaker,
     /// Depth guard for recursion protection.
     depth_guard: DepthGuard,
+    /// Traversal engine shared by all expansions.
+    traversal_engine: TraversalEngine,
 }
 
 impl AgentTraversal {
@@ -206,6 +208,7 @@ impl AgentTraversal {
             global_limits: GlobalLimits::default(),
             circuit_breaker: CircuitBreaker::new(5, std::time::Duration::from_secs(30)),
             depth_guard: DepthGuard::new(100),
+            traversal_engine: TraversalEngine::new(),
         }
     }
 
@@ -1200,8 +1203,8 @@ impl AgentTraversal {
         depth: usize,
         filter: &TraversalFilter,
     ) -> Result<Vec<Vec<BlockId>>> {
-        let engine = TraversalEngine::new();
-        let result = engine
+        let result = self
+            .traversal_engine
             .navigate(
                 doc,
                 Some(*block_id),
@@ -5,7 +5,11 @@
 //! the knowledge graph, and curate context windows while preserving UCM invariants.
 
 use serde::{Deserialize, Serialize};
-use std::collections::{HashMap, HashSet, VecDeque};
+use std::borrow::Cow;
+use std::cmp::Ordering;
+use std::collections::{BTreeSet, BinaryHeap, HashMap, HashSet, VecDeque};
+use std::fmt::Write as _;
+use std::hash::{Hash, Hasher};
 use ucm_core::{BlockId, Content, Document};
 
 #[cfg(test)]
@@ -28,6 +32,20 @@ pub enum InclusionReason {
     RequiredContext,
 }
 
+impl InclusionReason {
+    /// Variant name, as used for the `blocks_by_reason` statistics keys
+    pub fn as_str(&self) -> &'static str {
+        match self {
+            InclusionReason::DirectReference => "DirectReference",
+            InclusionReason::NavigationPath => "NavigationPath",
+            InclusionReason::StructuralContext => "StructuralContext",
+            InclusionReason::SemanticRelevance => "SemanticRelevance",
+            InclusionReason::ExternalDecision => "ExternalDecision",
+            InclusionReason::RequiredContext => "RequiredContext",
+        }
+    }
+}
+
 /// A block in the context window with metadata
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct ContextBlock {
@@ -37,6 +55,9 @@ pub struct ContextBlock {
     pub token_estimate: usize,
     pub access_count: usize,
     pub last_accessed: chrono::DateTime<chrono::Utc>,
+    /// Access before `last_accessed`, if the block has been touched twice
+    #[serde(default)]
+    pub previous_access: Option<chrono::DateTime<chrono::Utc>>,
     pub compressed: bool,
     pub original_content: Option<String>,
 }
@@ -113,7 +134,8 @@ pub enum PruningPolicy {
     /// Remove lowest relevance first
     #[default]
     RelevanceFirst,
-    /// Remove least recently accessed
+    /// Remove least recently accessed, ranked on the second-most-recent
+    /// access (LRU-2) so one-off additions go before the working set
     RecencyFirst,
     /// Remove redundant content
     RedundancyFirst,
@@ -210,6 +232,146 @@ impl ContextWindow {
     }
 }
 
+/// Bytes reserved per rendered prompt line for the `[blk_...] role: ` prefix.
+const PROMPT_LINE_OVERHEAD: usize = 48;
+
+/// Maximum number of blocks compressed by a single `compress` call.
+const COMPRESS_BATCH: usize = 10;
+
+/// Eviction priority of a context block; lower ranks are pruned first.
+#[derive(Debug, Clone, Copy)]
+enum PruneRank {
+    Relevance(f32),
+    /// Second-most-recent access (`None` sorts first), then last access
+    Recency(
+        Option<chrono::DateTime<chrono::Utc>>,
+        chrono::DateTime<chrono::Utc>,
+    ),
+}
+
+impl PruneRank {
+    fn cmp_rank(&self, other: &Self) -> Ordering {
+        match (self, other) {
+            (PruneRank::Relevance(a), PruneRank::Relevance(b)) => a.total_cmp(b),
+            (PruneRank::Recency(a, a_last), PruneRank::Recency(b, b_last)) => {
+                a.cmp(b).then_with(|| a_last.cmp(b_last))
+            }
+            (PruneRank::Relevance(_), PruneRank::Recency(..)) => Ordering::Less,
+            (PruneRank::Recency(..), PruneRank::Relevance(_)) => Ordering::Greater,
+        }
+    }
+}
+
+/// Heap entry for pruning. Ordered in reverse so `BinaryHeap` pops the
+/// lowest rank first.
+struct PruneCandidate {
+    rank: PruneRank,
+    block_id: BlockId,
+}
+
+impl PartialEq for PruneCandidate {
+    fn eq(&self, other: &Self) -> bool {
+        self.cmp(other) == Ordering::Equal
+    }
+}
+
+impl Eq for PruneCandidate {}
+
+impl PartialOrd for PruneCandidate {
+    fn partial_cmp(&self, other: &Self) -> Option<Ordering> {
+        Some(self.cmp(other))
+    }
+}
+
+impl Ord for PruneCandidate {
+    fn cmp(&self, other: &Self) -> Ordering {
+        other.rank.cmp_rank(&self.rank)
+    }
+}
+
+/// Render-order key: highest relevance first, ties broken by block ID.
+#[derive(Debug, Clone, Copy)]
+struct RelevanceKey {
+    relevance: f32,
+    block_id: BlockId,
+}
+
+impl PartialEq for RelevanceKey {
+    fn eq(&self, other: &Self) -> bool {
+        self.cmp(other) == Ordering::Equal
+    }
+}
+
+impl Eq for RelevanceKey {}
+
+impl PartialOrd for RelevanceKey {
+    fn partial_cmp(&self, other: &Self) -> Option<Ordering> {
+        Some(self.cmp(other))
+    }
+}
+
+impl Ord for RelevanceKey {
+    fn cmp(&self, other: &Self) -> Ordering {
+        other
+            .relevance
+            .total_cmp(&self.relevance)
+            .then_with(|| self.block_id.0.cmp(&other.block_id.0))
+    }
+}
+
+/// Count-min sketch of block access frequency, used as a TinyLFU-style
+/// admission filter when the window is full.
+///
+/// Counters saturate at `u8::MAX` and are halved every `SAMPLE_SIZE`
+/// increments so old popularity fades.
+struct FrequencySketch {
+    counters: Vec<u8>,
+    increments: usize,
+}
+
+impl FrequencySketch {
+    const WIDTH: usize = 1024;
+    const DEPTH: usize = 4;
+    const SAMPLE_SIZE: usize = 10 * Self::WIDTH;
+
+    fn new() -> Self {
+        Self {
+            counters: vec![0; Self::WIDTH * Self::DEPTH],
+            increments: 0,
+        }
+    }
+
+    /// Counter slot for each row, derived from one hash by double hashing.
+    fn slots(block_id: &BlockId) -> impl Iterator<Item = usize> {
+        let mut hasher = std::collections::hash_map::DefaultHasher::new();
+        block_id.hash(&mut hasher);
+        let hash = hasher.finish();
+        let (h1, h2) = (hash as u32 as usize, (hash >> 32) as usize | 1);
+        (0..Self::DEPTH)
+            .map(move |row| row * Self::WIDTH + h1.wrapping_add(row.wrapping_mul(h2)) % Self::WIDTH)
+    }
+
+    fn increment(&mut self, block_id: &BlockId) {
+        for slot in Self::slots(block_id) {
+            self.counters[slot] = self.counters[slot].saturating_add(1);
+        }
+        self.increments += 1;
+        if self.increments >= Self::SAMPLE_SIZE {
+            for counter in &mut self.counters {
+                *counter /= 2;
+            }
+            self.increments /= 2;
+        }
+    }
+
+    fn estimate(&self, block_id: &BlockId) -> u8 {
+        Self::slots(block_id)
+            .map(|slot| self.counters[slot])
+            .min()
+            .unwrap_or(0)
+    }
+}
+
 /// Context Management Infrastructure
 ///
 /// Provides APIs for external orchestration layers to manage context windows.
@@ -217,6 +379,17 @@ pub struct ContextManager {
     window: ContextWindow,
     expansion_policy: ExpansionPolicy,
     pruning_policy: PruningPolicy,
+    /// Running sum of `token_estimate` over the window's blocks, kept in step
+    /// with every insert, removal and compression so capacity checks are O(1)
+    total_tokens: usize,
+    /// Access frequency of every block added, for admission on a full window
+    frequency: FrequencySketch,
+    /// Window blocks in prompt order. Relevance is fixed once a block is in
+    /// the window, so this only changes on insert and removal.
+    by_relevance: BTreeSet<RelevanceKey>,
+    /// Access time stamped on every block touched by the current operation.
+    /// Read from the clock once per public call rather than once per block.
+    access_time: chrono::DateTime<chrono::Utc>,
 }
 
 impl ContextManager {
@@ -226,6 +399,10 @@ impl ContextManager {
             window: ContextWindow::new(id, ContextConstraints::default()),
             expansion_policy: ExpansionPolicy::default(),
             pruning_policy: PruningPolicy::default(),
+            total_tokens: 0,
+            frequency: FrequencySketch::new(),
+            by_relevance: BTreeSet::new(),
+            access_time: chrono::Utc::now(),
         }
     }
 
@@ -235,6 +412,10 @@ impl ContextManager {
             window: ContextWindow::new(id, constraints),
             expansion_policy: ExpansionPolicy::default(),
             pruning_policy: PruningPolicy::default(),
+            total_tokens: 0,
+            frequency: FrequencySketch::new(),
+            by_relevance: BTreeSet::new(),
+            access_time: chrono::Utc::now(),
         }
     }
 
@@ -264,7 +445,7 @@ impl ContextManager {
     ) -> ContextUpdateResult {
         self.window.metadata.focus_area = Some(focus_id);
         self.window.metadata.task_description = Some(task_description.to_string());
-        self.window.metadata.last_modified = Some(chrono::Utc::now());
+        self.window.metadata.last_modified = Some(self.start_operation());
 
         let mut result = ContextUpdateResult::default();
 
@@ -275,24 +456,20 @@ impl ContextManager {
         }
 
         // Add structural context (ancestors)
-        let mut current = focus_id;
-        let mut depth = 0;
-        while let Some(parent) = doc.parent(&current) {
-            if *parent == doc.root || depth >= 3 {
+        for (depth, parent) in doc.ancestors(&focus_id).into_iter().enumerate() {
+            if parent == doc.root || depth >= 3 {
                 break;
             }
             self.add_block_internal(
                 doc,
-                *parent,
+                parent,
                 InclusionReason::StructuralContext,
                 0.8 - depth as f32 * 0.1,
             );
-            result.blocks_added.push(*parent);
-            current = *parent;
-            depth += 1;
+            result.blocks_added.push(parent);
         }
 
-        result.total_tokens = self.window.total_tokens();
+        result.total_tokens = self.total_tokens;
         result.total_blocks = self.window.block_count();
         result
     }
@@ -306,7 +483,7 @@ impl ContextManager {
     ) -> ContextUpdateResult {
         self.window.metadata.focus_area = Some(target_id);
         self.window.metadata.task_description = Some(task_description.to_string());
-        self.window.metadata.last_modified = Some(chrono::Utc::now());
+        self.window.metadata.last_modified = Some(self.start_operation());
 
         let mut result = ContextUpdateResult::default();
 
@@ -320,12 +497,16 @@ impl ContextManager {
         let pruned = self.prune_if_needed();
         result.blocks_removed = pruned;
 
-        result.total_tokens = self.window.total_tokens();
+        result.total_tokens = self.total_tokens;
         result.total_blocks = self.window.block_count();
         result
     }
 
     /// Add a block to the context
+    ///
+    /// When the window is already full, the block is only admitted if it has
+    /// been requested at least as often as the block that would be evicted
+    /// for it; otherwise the window is left unchanged and a warning is returned.
     pub fn add_block(
         &mut self,
         doc: &Document,
@@ -333,17 +514,24 @@ impl ContextManager {
         reason: InclusionReason,
     ) -> ContextUpdateResult {
         let mut result = ContextUpdateResult::default();
+        self.start_operation();
 
         if doc.get_block(&block_id).is_some() {
-            self.add_block_internal(doc, block_id, reason, 0.7);
-            result.blocks_added.push(block_id);
+            if !self.admits(&block_id) {
+                result
+                    .warnings
+                    .push(format!("Block {} not admitted: window is full", block_id));
+            } else {
+                self.add_block_internal(doc, block_id, reason, 0.7);
+                result.blocks_added.push(block_id);
+            }
         }
 
         // Prune if needed
         let pruned = self.prune_if_needed();
         result.blocks_removed = pruned;
 
-        result.total_tokens = self.window.total_tokens();
+        result.total_tokens = self.total_tokens;
         result.total_blocks = self.window.block_count();
         result
     }
@@ -352,12 +540,12 @@ impl ContextManager {
     pub fn remove_block(&mut self, block_id: BlockId) -> ContextUpdateResult {
         let mut result = ContextUpdateResult::default();
 
-        if self.window.blocks.remove(&block_id).is_some() {
+        if self.remove_from_window(&block_id).is_some() {
             result.blocks_removed.push(block_id);
         }
 
         self.window.metadata.last_modified = Some(chrono::Utc::now());
-        result.total_tokens = self.window.total_tokens();
+        result.total_tokens = self.total_tokens;
         result.total_blocks = self.window.block_count();
         result
     }
@@ -370,6 +558,7 @@ impl ContextManager {
         depth: usize,
     ) -> ContextUpdateResult {
         let mut result = ContextUpdateResult::default();
+        self.start_operation();
 
         let focus_id = match self.window.metadata.focus_area {
             Some(id) => id,
@@ -401,8 +590,8 @@ impl ContextManager {
         let pruned = self.prune_if_needed();
         result.blocks_removed = pruned;
 
-        self.window.metadata.last_modified = Some(chrono::Utc::now());
-        result.total_tokens = self.window.total_tokens();
+        self.window.metadata.last_modified = Some(self.access_time);
+        result.total_tokens = self.total_tokens;
         result.total_blocks = self.window.block_count();
         result
     }
@@ -427,18 +616,27 @@ impl ContextManager {
             .map(|(id, cb)| (*id, cb.relevance_score))
             .collect();
 
-        blocks_to_compress
-            .sort_by(|a, b| a.1.partial_cmp(&b.1).unwrap_or(std::cmp::Ordering::Equal));
+        // Only the lowest COMPRESS_BATCH are used, so partition them out
+        // before sorting instead of sorting the whole window
+        let by_relevance = |a: &(BlockId, f32), b: &(BlockId, f32)| {
+            a.1.partial_cmp(&b.1).unwrap_or(Ordering::Equal)
+        };
+        if blocks_to_compress.len() > COMPRESS_BATCH {
+            blocks_to_compress.select_nth_unstable_by(COMPRESS_BATCH, by_relevance);
+            blocks_to_compress.truncate(COMPRESS_BATCH);
+        }
+        blocks_to_compress.sort_unstable_by(by_relevance);
 
-        for (block_id, _) in blocks_to_compress.iter().take(10) {
+        for (block_id, _) in &blocks_to_compress {
             // Extract content text before mutable borrow
             let original = doc
                 .get_block(block_id)
-                .map(|block| self.extract_content_text(&block.content));
+                .map(|block| self.extract_content_text(&block.content).into_owned());
 
             if let Some(context_block) = self.window.blocks.get_mut(block_id) {
                 if let Some(original_text) = original {
                     context_block.original_content = Some(original_text);
+                    let before = context_block.token_estimate;
 
                     match method {
                         CompressionMethod::Truncate => {
@@ -455,37 +653,46 @@ impl ContextManager {
                         }
                     }
 
+                    // StructureOnly can raise tiny estimates, so apply both sides
+                    self.total_tokens = self.total_tokens - before + context_block.token_estimate;
                     context_block.compressed = true;
                     result.blocks_compressed.push(*block_id);
                 }
             }
 
             // Check if we're within constraints
-            if self.window.total_tokens() <= self.window.constraints.max_tokens {
+            if self.total_tokens <= self.window.constraints.max_tokens {
                 break;
             }
         }
 
-        result.total_tokens = self.window.total_tokens();
+        result.total_tokens = self.total_tokens;
         result.total_blocks = self.window.block_count();
         result
     }
 
     /// Get statistics about the context
     pub fn get_statistics(&self) -> ContextStatistics {
-        let mut blocks_by_reason: HashMap<String, usize> = HashMap::new();
+        // Count under static keys and only allocate one String per reason seen
+        let mut reason_counts: HashMap<&'static str, usize> = HashMap::new();
         let mut total_relevance = 0.0;
         let mut compressed_count = 0;
 
         for cb in self.window.blocks.values() {
-            let reason = format!("{:?}", cb.inclusion_reason);
-            *blocks_by_reason.entry(reason).or_insert(0) += 1;
+            *reason_counts
+                .entry(cb.inclusion_reason.as_str())
+                .or_insert(0) += 1;
             total_relevance += cb.relevance_score;
             if cb.compressed {
                 compressed_count += 1;
             }
         }
 
+        let blocks_by_reason = reason_counts
+            .into_iter()
+            .map(|(reason, count)| (reason.to_string(), count))
+            .collect();
+
         let average_relevance = if self.window.blocks.is_empty() {
             0.0
         } else {
@@ -493,7 +700,7 @@ impl ContextManager {
         };
 
         ContextStatistics {
-            total_tokens: self.window.total_tokens(),
+            total_tokens: self.total_tokens,
             total_blocks: self.window.block_count(),
             blocks_by_reason,
             average_relevance,
@@ -504,28 +711,18 @@ impl ContextManager {
 
     /// Render context to a format suitable for LLM prompts
     pub fn render_for_prompt(&self, doc: &Document) -> String {
-        let mut output = String::new();
-
-        // Sort blocks by relevance for output
-        let mut blocks: Vec<(&BlockId, &ContextBlock)> = self.window.blocks.iter().collect();
-        blocks.sort_by(|a, b| {
-            b.1.relevance_score
-                .partial_cmp(&a.1.relevance_score)
-                .unwrap_or(std::cmp::Ordering::Equal)
-        });
+        // Token estimates are ~4 bytes each; add room for the per-line prefix
+        let mut output = String::with_capacity(
+            self.total_tokens * 4 + self.window.blocks.len() * PROMPT_LINE_OVERHEAD,
+        );
 
-        for (block_id, context_block) in blocks {
+        // Blocks are kept in relevance order, so no sort is needed here
+        for key in &self.by_relevance {
+            let block_id = &key.block_id;
+            let Some(context_block) = self.window.blocks.get(block_id) else {
+                continue;
+            };
             if let Some(block) = doc.get_block(block_id) {
-                let content = if context_block.compressed {
-                    if let Some(ref original) = context_block.original_content {
-                        format!("[compressed] {}...", &original[..original.len().min(50)])
-                    } else {
-                        "[compressed]".to_string()
-                    }
-                } else {
-                    self.extract_content_text(&block.content)
-                };
-
                 let role = block
                     .metadata
                     .semantic_role
@@ -533,7 +730,24 @@ impl ContextManager {
                     .map(|r| r.category.as_str())
                     .unwrap_or("block");
 
-                output.push_str(&format!("[{}] {}: {}\n", block_id, role, content));
+                // Written straight into the output rather than formatted
+                // into a temporary line first
+                let _ = write!(output, "[{}] {}: ", block_id, role);
+                if context_block.compressed {
+                    if let Some(ref original) = context_block.original_content {
+                        // Cut on a char boundary so multi-byte text cannot panic
+                        let mut end = original.len().min(50);
+                        while !original.is_char_boundary(end) {
+                            end -= 1;
+                        }
+                        let _ = write!(output, "[compressed] {}...", &original[..end]);
+                    } else {
+                        output.push_str("[compressed]");
+                    }
+                } else {
+                    output.push_str(&self.extract_content_text(&block.content));
+                }
+                output.push('\n');
             }
         }
 
@@ -549,11 +763,14 @@ impl ContextManager {
         reason: InclusionReason,
         relevance: f32,
     ) {
+        self.frequency.increment(&block_id);
+
         if self.window.blocks.contains_key(&block_id) {
             // Update access count
             if let Some(cb) = self.window.blocks.get_mut(&block_id) {
                 cb.access_count += 1;
-                cb.last_accessed = chrono::Utc::now();
+                cb.previous_access = Some(cb.last_accessed);
+                cb.last_accessed = self.access_time;
             }
             return;
         }
@@ -567,27 +784,63 @@ impl ContextManager {
                 relevance_score: relevance,
                 token_estimate,
                 access_count: 1,
-                last_accessed: chrono::Utc::now(),
+                last_accessed: self.access_time,
+                previous_access: None,
                 compressed: false,
                 original_content: None,
             };
 
             self.window.blocks.insert(block_id, context_block);
+            self.by_relevance.insert(RelevanceKey {
+                relevance,
+                block_id,
+            });
+            self.total_tokens += token_estimate;
         }
     }
 
+    /// Read the clock once for an operation; every block it touches shares
+    /// this access time.
+    fn start_operation(&mut self) -> chrono::DateTime<chrono::Utc> {
+        self.access_time = chrono::Utc::now();
+        self.access_time
+    }
+
+    /// Remove a block from the window, keeping the token total in step.
+    fn remove_from_window(&mut self, block_id: &BlockId) -> Option<ContextBlock> {
+        let removed = self.window.blocks.remove(block_id)?;
+        self.by_relevance.remove(&RelevanceKey {
+            relevance: removed.relevance_score,
+            block_id: *block_id,
+        });
+        self.total_tokens -= removed.token_estimate;
+        Some(removed)
+    }
+
+    /// Block and token limits, read once before an expansion loop.
+    fn capacity_limits(&self) -> (usize, usize) {
+        (
+            self.window.constraints.max_blocks,
+            self.window.constraints.max_tokens,
+        )
+    }
+
     fn expand_downward(
         &mut self,
         doc: &Document,
         start: BlockId,
         max_depth: usize,
     ) -> Vec<BlockId> {
+        let (max_blocks, max_tokens) = self.capacity_limits();
         let mut added = Vec::new();
         let mut queue = VecDeque::new();
         queue.push_back((start, 0usize));
 
         while let Some((node_id, depth)) = queue.pop_front() {
-            if depth > max_depth || !self.window.has_capacity() {
+            if depth > max_depth
+                || self.window.blocks.len() >= max_blocks
+                || self.total_tokens >= max_tokens
+            {
                 break;
             }
 
@@ -610,28 +863,28 @@ impl ContextManager {
     }
 
     fn expand_upward(&mut self, doc: &Document, start: BlockId, max_depth: usize) -> Vec<BlockId> {
+        let (max_blocks, max_tokens) = self.capacity_limits();
         let mut added = Vec::new();
-        let mut current = start;
-        let mut depth = 0;
 
-        while let Some(parent) = doc.parent(&current) {
-            if *parent == doc.root || depth >= max_depth || !self.window.has_capacity() {
+        for (depth, parent) in doc.ancestors(&start).into_iter().enumerate() {
+            if parent == doc.root
+                || depth >= max_depth
+                || self.window.blocks.len() >= max_blocks
+                || self.total_tokens >= max_tokens
+            {
                 break;
             }
 
-            if !self.window.contains(parent) {
+            if !self.window.contains(&parent) {
                 let relevance = 0.7 - depth as f32 * 0.1;
                 self.add_block_internal(
                     doc,
-                    *parent,
+                    parent,
                     InclusionReason::StructuralContext,
                     relevance.max(0.1),
                 );
-                added.push(*parent);
+                added.push(parent);
             }
-
-            current = *parent;
-            depth += 1;
         }
 
         added
@@ -643,21 +896,25 @@ impl ContextManager {
         start: BlockId,
         max_depth: usize,
     ) -> Vec<BlockId> {
+        let (max_blocks, max_tokens) = self.capacity_limits();
         let mut added = Vec::new();
         let mut visited = HashSet::new();
         let mut queue = VecDeque::new();
         queue.push_back((start, 0usize));
 
         while let Some((node_id, depth)) = queue.pop_front() {
-            if depth > max_depth || !self.window.has_capacity() {
+            if depth > max_depth
+                || self.window.blocks.len() >= max_blocks
+                || self.total_tokens >= max_tokens
+            {
                 break;
             }
 
-            if visited.contains(&node_id) {
+            if !visited.insert(node_id) {
                 continue;
             }
-            visited.insert(node_id);
 
+            // Block edges are already the adjacency list; read them in place
             if let Some(block) = doc.get_block(&node_id) {
                 for edge in &block.edges {
                     if !self.window.contains(&edge.target) && !visited.contains(&edge.target) {
@@ -680,67 +937,103 @@ impl ContextManager {
 
     fn prune_if_needed(&mut self) -> Vec<BlockId> {
         let mut removed = Vec::new();
+        if !self.over_limits() {
+            return removed;
+        }
 
-        while self.window.block_count() > self.window.constraints.max_blocks
-            || self.window.total_tokens() > self.window.constraints.max_tokens
-        {
-            // Find block to remove based on policy
-            let to_remove = match self.pruning_policy {
-                PruningPolicy::RelevanceFirst => self.find_lowest_relevance(),
-                PruningPolicy::RecencyFirst => self.find_least_recent(),
-                PruningPolicy::RedundancyFirst => self.find_lowest_relevance(), // Simplified
-            };
+        // Rank every candidate once, then pop in eviction order instead of
+        // rescanning the whole window for each block removed
+        let focus = self.window.metadata.focus_area;
+        let mut candidates: BinaryHeap<PruneCandidate> = self
+            .window
+            .blocks
+            .iter()
+            .filter(|(id, _)| Some(**id) != focus)
+            .map(|(id, cb)| PruneCandidate {
+                rank: self.prune_rank(cb),
+                block_id: *id,
+            })
+            .collect();
 
-            if let Some(block_id) = to_remove {
-                self.window.blocks.remove(&block_id);
-                removed.push(block_id);
-            } else {
-                break;
+        while self.over_limits() {
+            match candidates.pop() {
+                Some(candidate) => {
+                    self.remove_from_window(&candidate.block_id);
+                    removed.push(candidate.block_id);
+                }
+                None => break,
             }
         }
 
         removed
     }
 
-    fn find_lowest_relevance(&self) -> Option<BlockId> {
-        self.window
+    /// TinyLFU admission: with the window full, a new block must be at least
+    /// as frequently requested as the prune victim it would displace.
+    ///
+    /// A rejected request is still counted, so a block that keeps being asked
+    /// for is eventually admitted.
+    fn admits(&mut self, block_id: &BlockId) -> bool {
+        if self.window.blocks.contains_key(block_id)
+            || self.window.blocks.len() < self.window.constraints.max_blocks
+        {
+            return true;
+        }
+
+        let focus = self.window.metadata.focus_area;
+        let victim = self
+            .window
             .blocks
             .iter()
-            .filter(|(id, _)| Some(**id) != self.window.metadata.focus_area)
-            .min_by(|a, b| {
-                a.1.relevance_score
-                    .partial_cmp(&b.1.relevance_score)
-                    .unwrap_or(std::cmp::Ordering::Equal)
-            })
-            .map(|(id, _)| *id)
+            .filter(|(id, _)| Some(**id) != focus)
+            .min_by(|(_, a), (_, b)| self.prune_rank(a).cmp_rank(&self.prune_rank(b)))
+            .map(|(id, _)| *id);
+
+        // The current request counts toward the candidate's frequency
+        let admitted = match victim {
+            Some(victim) => {
+                self.frequency.estimate(block_id).saturating_add(1)
+                    >= self.frequency.estimate(&victim)
+            }
+            None => true,
+        };
+        if !admitted {
+            self.frequency.increment(block_id);
+        }
+        admitted
     }
 
-    fn find_least_recent(&self) -> Option<BlockId> {
-        self.window
-            .blocks
-            .iter()
-            .filter(|(id, _)| Some(**id) != self.window.metadata.focus_area)
-            .min_by(|a, b| a.1.last_accessed.cmp(&b.1.last_accessed))
-            .map(|(id, _)| *id)
+    fn over_limits(&self) -> bool {
+        self.window.block_count() > self.window.constraints.max_blocks
+            || self.total_tokens > self.window.constraints.max_tokens
+    }
+
+    fn prune_rank(&self, cb: &ContextBlock) -> PruneRank {
+        match self.pruning_policy {
+            PruningPolicy::RelevanceFirst => PruneRank::Relevance(cb.relevance_score),
+            PruningPolicy::RecencyFirst => PruneRank::Recency(cb.previous_access, cb.last_accessed),
+            PruningPolicy::RedundancyFirst => PruneRank::Relevance(cb.relevance_score), // Simplified
+        }
     }
 
     fn estimate_tokens(&self, content: &Content) -> usize {
+        // Text-bearing content is borrowed, so this only measures its length
         let text = self.extract_content_text(content);
         // Rough estimate: ~4 characters per token
         (text.len() / 4).max(1)
     }
 
-    fn extract_content_text(&self, content: &Content) -> String {
+    fn extract_content_text<'a>(&self, content: &'a Content) -> Cow<'a, str> {
         match content {
-            Content::Text(t) => t.text.clone(),
-            Content::Code(c) => c.source.clone(),
-            Content::Table(t) => format!("Table: {} rows", t.rows.len()),
-            Content::Math(m) => m.expression.clone(),
-            Content::Media(m) => m.alt_text.clone().unwrap_or_else(|| "Media".to_string()),
-            Content::Json { .. } => "JSON data".to_string(),
-            Content::Binary { .. } => "Binary data".to_string(),
+            Content::Text(t) => Cow::Borrowed(&t.text),
+            Content::Code(c) => Cow::Borrowed(&c.source),
+            Content::Table(t) => Cow::Owned(format!("Table: {} rows", t.rows.len())),
+            Content::Math(m) => Cow::Borrowed(&m.expression),
+            Content::Media(m) => Cow::Borrowed(m.alt_text.as_deref().unwrap_or("Media")),
+            Content::Json { .. } => Cow::Borrowed("JSON data"),
+            Content::Binary { .. } => Cow::Borrowed("Binary data"),
             Content::Composite { children, .. } => {
-                format!("Composite: {} children", children.len())
+                Cow::Owned(format!("Composite: {} children", children.len()))
             }
         }
     }
@@ -847,6 +1140,135 @@ mod tests {
         assert!(manager.window().block_count() <= 5);
     }
 
+    #[test]
+    fn test_running_token_total_matches_window() {
+        let constraints = ContextConstraints {
+            max_blocks: 3,
+            ..Default::default()
+        };
+        let doc = create_test_document();
+        let mut manager = ContextManager::with_constraints("test-context", constraints);
+        let h1_id = doc.children(&doc.root)[0];
+
+        let result = manager.initialize_focus(&doc, h1_id, "Test task");
+        assert_eq!(result.total_tokens, manager.window().total_tokens());
+
+        let result = manager.expand_context(&doc, ExpandDirection::Down, 10);
+        assert_eq!(result.total_tokens, manager.window().total_tokens());
+
+        let result = manager.compress(&doc, CompressionMethod::StructureOnly);
+        assert_eq!(result.total_tokens, manager.window().total_tokens());
+
+        let result = manager.remove_block(h1_id);
+        assert_eq!(result.total_tokens, manager.window().total_tokens());
+        assert_eq!(manager.by_relevance.len(), manager.window().block_count());
+    }
+
+    #[test]
+    fn test_prune_removes_lowest_relevance_first() {
+        let constraints = ContextConstraints {
+            max_blocks: 3,
+            ..Default::default()
+        };
+        let doc = create_test_document();
+        let mut manager = ContextManager::with_constraints("test-context", constraints);
+        let h1_id = doc.children(&doc.root)[0];
+        let p1_id = doc.children(&h1_id)[0];
+        let h2_id = doc.children(&h1_id)[1];
+        let p2_id = doc.children(&h2_id)[0];
+
+        // Focus 1.0, H2 0.8, H1 0.7
+        manager.initialize_focus(&doc, p2_id, "Test task");
+        assert_eq!(manager.window().block_count(), 3);
+
+        // P1 comes in at 0.7, so one of the 0.7 blocks must go
+        let result = manager.add_block(&doc, p1_id, InclusionReason::DirectReference);
+        assert_eq!(result.blocks_removed.len(), 1);
+        assert!(result.blocks_removed[0] == h1_id || result.blocks_removed[0] == p1_id);
+        assert!(manager.window().contains(&p2_id));
+        assert!(manager.window().contains(&h2_id));
+    }
+
+    #[test]
+    fn test_recency_pruning_keeps_reaccessed_blocks() {
+        let constraints = ContextConstraints {
+            max_blocks: 3,
+            ..Default::default()
+        };
+        let doc = create_test_document();
+        let mut manager = ContextManager::with_constraints("test-context", constraints)
+            .with_pruning_policy(PruningPolicy::RecencyFirst);
+        let h1_id = doc.children(&doc.root)[0];
+        let p1_id = doc.children(&h1_id)[0];
+        let h2_id = doc.children(&h1_id)[1];
+        let p2_id = doc.children(&h2_id)[0];
+
+        // H1 is touched twice before the others are added once each; plain
+        // LRU would evict it first, LRU-2 evicts a single-access block
+        manager.add_block(&doc, h1_id, InclusionReason::DirectReference);
+        manager.add_block(&doc, h1_id, InclusionReason::DirectReference);
+        manager.add_block(&doc, p1_id, InclusionReason::DirectReference);
+        manager.add_block(&doc, h2_id, InclusionReason::DirectReference);
+        let result = manager.add_block(&doc, p2_id, InclusionReason::DirectReference);
+
+        assert_eq!(result.blocks_removed.len(), 1);
+        assert_ne!(result.blocks_removed[0], h1_id);
+        assert!(manager.window().contains(&h1_id));
+    }
+
+    #[test]
+    fn test_full_window_admits_only_frequent_blocks() {
+        let constraints = ContextConstraints {
+            max_blocks: 3,
+            ..Default::default()
+        };
+        let doc = create_test_document();
+        let mut manager = ContextManager::with_constraints("test-context", constraints);
+        let h1_id = doc.children(&doc.root)[0];
+        let p1_id = doc.children(&h1_id)[0];
+        let h2_id = doc.children(&h1_id)[1];
+        let p2_id = doc.children(&h2_id)[0];
+
+        for id in [h1_id, h2_id, p2_id, h1_id, h2_id, p2_id] {
+            manager.add_block(&doc, id, InclusionReason::DirectReference);
+        }
+
+        // A one-off request cannot displace blocks requested twice
+        let result = manager.add_block(&doc, p1_id, InclusionReason::ExternalDecision);
+        assert!(result.blocks_added.is_empty());
+        assert!(result.blocks_removed.is_empty());
+        assert_eq!(result.warnings.len(), 1);
+        assert!(!manager.window().contains(&p1_id));
+
+        // Asked for again, it has caught up and is admitted
+        let result = manager.add_block(&doc, p1_id, InclusionReason::ExternalDecision);
+        assert_eq!(result.blocks_added, vec![p1_id]);
+        assert_eq!(result.blocks_removed.len(), 1);
+        assert_eq!(manager.window().block_count(), 3);
+    }
+
+    #[test]
+    fn test_compress_picks_lowest_relevance_batch() {
+        let mut doc = Document::new(DocumentId::new("test"));
+        let root = doc.root;
+        let constraints = ContextConstraints {
+            max_tokens: 0,
+            ..Default::default()
+        };
+        let mut manager = ContextManager::with_constraints("test-context", constraints);
+
+        let mut ids = Vec::new();
+        for i in 0..15 {
+            let block = Block::new(Content::text(format!("Paragraph {i}")), Some("paragraph"));
+            let id = doc.add_block(block, &root).unwrap();
+            manager.add_block_internal(&doc, id, InclusionReason::DirectReference, i as f32 / 20.0);
+            ids.push(id);
+        }
+
+        let result = manager.compress(&doc, CompressionMethod::Truncate);
+        assert_eq!(result.blocks_compressed, ids[..COMPRESS_BATCH]);
+    }
+
     #[test]
     fn test_statistics() {
         let doc = create_test_document();
@@ -860,6 +1282,11 @@ mod tests {
         let stats = manager.get_statistics();
         assert!(stats.total_blocks > 0);
         assert!(stats.total_tokens > 0);
+        assert_eq!(stats.blocks_by_reason.get("DirectReference"), Some(&1));
+        assert_eq!(
+            InclusionReason::StructuralContext.as_str(),
+            format!("{:?}", InclusionReason::StructuralContext)
+        );
     }
 
     #[test]
@@ -875,5 +1302,39 @@ mod tests {
         let prompt = manager.render_for_prompt(&doc);
         assert!(!prompt.is_empty());
         assert!(prompt.contains("Chapter 1"));
+        assert!(prompt.starts_with(&format!("[{}] heading1: Chapter 1\n", h1_id)));
+
+        manager.compress(&doc, CompressionMethod::Truncate);
+        let prompt = manager.render_for_prompt(&doc);
+        assert!(prompt.contains(&format!(
+            "[{}] heading1: [compressed] Chapter 1...\n",
+            h1_id
+        )));
+
+        // Expanded children have lower relevance and render after the focus
+        manager.expand_context(&doc, ExpandDirection::Down, 2);
+        let prompt = manager.render_for_prompt(&doc);
+        assert!(prompt.starts_with(&format!("[{}] heading1: [compressed]", h1_id)));
+        assert_eq!(prompt.lines().count(), manager.window().block_count());
+    }
+
+    #[test]
+    fn test_render_compressed_multibyte() {
+        let mut doc = Document::new(DocumentId::new("multibyte"));
+        let root = doc.root;
+        let id = doc
+            .add_block(
+                Block::new(Content::text(format!("a{}", "é".repeat(40))), None),
+                &root,
+            )
+            .unwrap();
+
+        let mut manager = ContextManager::new("test-context");
+        manager.initialize_focus(&doc, id, "Test task");
+        manager.compress(&doc, CompressionMethod::Truncate);
+
+        let prompt = manager.render_for_prompt(&doc);
+        // Byte 50 falls inside an "é", so the preview stops one char short
+        assert!(prompt.contains(&format!("[compressed] a{}...\n", "é".repeat(24))));
     }
 }
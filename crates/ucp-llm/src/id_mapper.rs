@@ -15,10 +15,58 @@
 //! - `shorten_ucl()`: Convert UCL with long IDs to short IDs
 //! - `expand_ucl()`: Convert UCL with short IDs back to long IDs
 
-use regex::Regex;
+use regex::{Captures, Regex};
 use std::collections::HashMap;
+use std::fmt::Write;
+use std::sync::OnceLock;
 use ucm_core::{BlockId, Content, Document};
 
+/// Full block IDs as rendered by `BlockId`'s `Display`: `blk_` + 24 lowercase hex digits
+fn block_id_pattern() -> &'static Regex {
+    static PATTERN: OnceLock<Regex> = OnceLock::new();
+    PATTERN.get_or_init(|| Regex::new(r"blk_[0-9a-f]{24}").unwrap())
+}
+
+/// Short IDs in prose: `block 1`, `id 1`, `#1` or `[1]`
+fn short_ref_pattern() -> &'static Regex {
+    static PATTERN: OnceLock<Regex> = OnceLock::new();
+    PATTERN.get_or_init(|| {
+        Regex::new(r"(?P<prefix>block |id |#)(?P<id>\d+)|\[(?P<bracketed>\d+)\]").unwrap()
+    })
+}
+
+/// Short IDs in UCL command positions: EDIT 1, APPEND 1, MOVE 1, TO 1, ...
+fn ucl_id_pattern() -> &'static Regex {
+    static PATTERN: OnceLock<Regex> = OnceLock::new();
+    PATTERN.get_or_init(|| {
+        Regex::new(
+            r"(?x)
+            (?P<prefix>
+                \b(?:EDIT|APPEND|MOVE|DELETE|LINK|UNLINK|TO|BEFORE|AFTER)\s+
+            )
+            (?P<id>\d+)
+            ",
+        )
+        .unwrap()
+    })
+}
+
+/// Short IDs following an edge type (second ID in LINK commands)
+fn link_target_pattern() -> &'static Regex {
+    static PATTERN: OnceLock<Regex> = OnceLock::new();
+    PATTERN.get_or_init(|| {
+        Regex::new(
+            r"(?x)
+            (?P<prefix>
+                \b(?:references|elaborates|summarizes|contradicts|supports|requires|parent_of)\s+
+            )
+            (?P<id>\d+)
+            ",
+        )
+        .unwrap()
+    })
+}
+
 /// Get the full string representation of content
 fn content_to_string(content: &Content) -> String {
     match content {
@@ -101,48 +149,46 @@ impl IdMapper {
 
     /// Convert a string containing block IDs to use short IDs
     /// Replaces patterns like "blk_abc123..." with "1", "2", etc.
+    ///
+    /// One scan for block IDs, each looked up in the map, rather than one
+    /// full-text replace per registered block.
     pub fn shorten_text(&self, text: &str) -> String {
-        let mut result = text.to_string();
-        for (block_id, short_id) in &self.to_short {
-            let long_str = block_id.to_string();
-            let short_str = short_id.to_string();
-            result = result.replace(&long_str, &short_str);
-        }
-        result
+        block_id_pattern()
+            .replace_all(text, |caps: &Captures| {
+                let long = &caps[0];
+                match long
+                    .parse::<BlockId>()
+                    .ok()
+                    .and_then(|id| self.to_short.get(&id))
+                {
+                    Some(short_id) => short_id.to_string(),
+                    None => long.to_string(),
+                }
+            })
+            .into_owned()
     }
 
     /// Convert a string containing short IDs back to block IDs
     /// Replaces patterns like "1", "2" back to "blk_abc123..."
-    /// Note: This is context-sensitive - only replaces standalone numbers
+    /// Note: This is context-sensitive - only whole numbers in `block N`,
+    /// `id N`, `#N` and `[N]` references are replaced, in a single scan
     pub fn expand_text(&self, text: &str) -> String {
-        let mut result = text.to_string();
-
-        // Sort by ID descending to avoid replacing "1" in "10"
-        let mut ids: Vec<_> = self.to_long.iter().collect();
-        ids.sort_by(|a, b| b.0.cmp(a.0));
-
-        for (short_id, block_id) in ids {
-            // Use word boundary matching to avoid partial replacements
-            let short_str = short_id.to_string();
-            let long_str = block_id.to_string();
-
-            // Replace patterns like "block 1" or "id: 1" or "1," etc.
-            let patterns = [
-                (
-                    format!("block {}", short_str),
-                    format!("block {}", long_str),
-                ),
-                (format!("id {}", short_str), format!("id {}", long_str)),
-                (format!("#{}", short_str), format!("#{}", long_str)),
-                (format!("[{}]", short_str), format!("[{}]", long_str)),
-            ];
-
-            for (from, to) in patterns {
-                result = result.replace(&from, &to);
-            }
-        }
-
-        result
+        short_ref_pattern()
+            .replace_all(text, |caps: &Captures| {
+                let (prefix, digits, suffix) = match caps.name("id") {
+                    Some(id) => (&caps["prefix"], id.as_str(), ""),
+                    None => ("[", &caps["bracketed"], "]"),
+                };
+                match digits
+                    .parse::<u32>()
+                    .ok()
+                    .and_then(|short_id| self.to_long.get(&short_id))
+                {
+                    Some(block_id) => format!("{}{}{}", prefix, block_id, suffix),
+                    None => caps[0].to_string(),
+                }
+            })
+            .into_owned()
     }
 
     /// Convert UCL commands from long BlockIds to short numeric IDs
@@ -151,41 +197,20 @@ impl IdMapper {
     /// The LLM receives prompts with short IDs and generates UCL with short IDs,
     /// which is then expanded back to full BlockIds before execution.
     pub fn shorten_ucl(&self, ucl: &str) -> String {
-        let mut result = ucl.to_string();
-
-        // Replace all block IDs with their short versions
-        // Process longer IDs first to avoid partial matches
-        let mut entries: Vec<_> = self.to_short.iter().collect();
-        entries.sort_by(|a, b| b.0.to_string().len().cmp(&a.0.to_string().len()));
-
-        for (block_id, short_id) in entries {
-            result = result.replace(&block_id.to_string(), &short_id.to_string());
-        }
-
-        result
+        // Block IDs are fixed-width, so no ID can be a prefix of another
+        self.shorten_text(ucl)
     }
 
     /// Convert UCL commands from short numeric IDs back to full BlockIds
     ///
     /// This expands short IDs in UCL commands back to full BlockIds.
     /// Uses regex to match UCL command patterns and replace IDs contextually.
+    /// The patterns are compiled once per process, not on every call.
     pub fn expand_ucl(&self, ucl: &str) -> String {
-        // Pattern to match short IDs in UCL command contexts
-        // Matches: EDIT 1, APPEND 1, MOVE 1, DELETE 1, LINK 1, TO 1, BEFORE 1, AFTER 1, etc.
-        let ucl_id_pattern = Regex::new(
-            r"(?x)
-            (?P<prefix>
-                \b(?:EDIT|APPEND|MOVE|DELETE|LINK|UNLINK|TO|BEFORE|AFTER)\s+
-            )
-            (?P<id>\d+)
-            ",
-        )
-        .unwrap();
-
         let mut result = ucl.to_string();
 
         // Find all matches and collect replacements
-        let replacements: Vec<_> = ucl_id_pattern
+        let replacements: Vec<_> = ucl_id_pattern()
             .captures_iter(&result.clone())
             .filter_map(|cap| {
                 let id_str = cap.name("id")?.as_str();
@@ -206,17 +231,7 @@ impl IdMapper {
         }
 
         // Also handle edge type targets (second ID in LINK commands)
-        let link_target_pattern = Regex::new(
-            r"(?x)
-            (?P<prefix>
-                \b(?:references|elaborates|summarizes|contradicts|supports|requires|parent_of)\s+
-            )
-            (?P<id>\d+)
-            ",
-        )
-        .unwrap();
-
-        let replacements: Vec<_> = link_target_pattern
+        let replacements: Vec<_> = link_target_pattern()
             .captures_iter(&result.clone())
             .filter_map(|cap| {
                 let id_str = cap.name("id")?.as_str();
@@ -254,10 +269,7 @@ impl IdMapper {
 
     /// Generate a normalized document representation for LLM prompts
     pub fn document_to_prompt(&self, doc: &Document) -> String {
-        let mut lines = Vec::new();
-
-        // Header
-        lines.push("Document structure:".to_string());
+        let mut out = String::from("Document structure:");
 
         // Collect all block IDs in BFS order
         let mut all_blocks = Vec::new();
@@ -274,70 +286,60 @@ impl IdMapper {
 
         // Document structure section: parent: child1 child2 ...
         for block_id in &all_blocks {
-            let short_id = self
-                .to_short
-                .get(block_id)
-                .map(|id| id.to_string())
-                .unwrap_or_else(|| "?".to_string());
-
-            let children = doc.children(block_id);
-            if children.is_empty() {
-                lines.push(format!("{}:", short_id));
-            } else {
-                let child_ids: Vec<String> = children
-                    .iter()
-                    .map(|c| {
-                        self.to_short
-                            .get(c)
-                            .map(|id| id.to_string())
-                            .unwrap_or_else(|| "?".to_string())
-                    })
-                    .collect();
-                lines.push(format!("{}: {}", short_id, child_ids.join(" ")));
+            out.push('\n');
+            self.write_short_id(&mut out, block_id);
+            out.push(':');
+            for child in doc.children(block_id) {
+                out.push(' ');
+                self.write_short_id(&mut out, child);
             }
         }
 
         // Blocks section
-        lines.push(String::new());
-        lines.push("Blocks:".to_string());
+        out.push_str("\n\nBlocks:");
         for block_id in &all_blocks {
             if let Some(block) = doc.get_block(block_id) {
-                let short_id = self
-                    .to_short
-                    .get(block_id)
-                    .map(|id| id.to_string())
-                    .unwrap_or_else(|| "?".to_string());
-
-                let content_type = block.content.type_tag();
-                let content_str = content_to_string(&block.content);
+                out.push('\n');
+                self.write_short_id(&mut out, block_id);
+                let _ = write!(out, " type={} content=\"", block.content.type_tag());
                 // Escape content for display
-                let escaped_content = content_str
-                    .replace('\\', "\\\\")
-                    .replace('"', "\\\"")
-                    .replace('\n', "\\n");
-                lines.push(format!(
-                    "{} type={} content=\"{}\"",
-                    short_id, content_type, escaped_content
-                ));
+                for c in content_to_string(&block.content).chars() {
+                    match c {
+                        '\\' => out.push_str("\\\\"),
+                        '"' => out.push_str("\\\""),
+                        '\n' => out.push_str("\\n"),
+                        _ => out.push(c),
+                    }
+                }
+                out.push('"');
             }
         }
 
-        lines.join("\n")
+        out
+    }
+
+    /// Append the short ID for `block_id`, or `?` if it is unmapped
+    fn write_short_id(&self, out: &mut String, block_id: &BlockId) {
+        match self.to_short.get(block_id) {
+            Some(id) => {
+                let _ = write!(out, "{}", id);
+            }
+            None => out.push('?'),
+        }
     }
 
     /// Get the mapping table as a string (useful for debugging)
     pub fn mapping_table(&self) -> String {
-        let mut lines = Vec::new();
-        lines.push("ID Mapping:".to_string());
+        let mut out = String::from("ID Mapping:");
 
         let mut entries: Vec<_> = self.to_short.iter().collect();
         entries.sort_by_key(|(_, &id)| id);
 
         for (block_id, short_id) in entries {
-            lines.push(format!("  {} = {}", short_id, block_id));
+            let _ = write!(out, "\n  {} = {}", short_id, block_id);
         }
 
-        lines.join("\n")
+        out
     }
 
     /// Total number of mappings
@@ -397,6 +399,26 @@ mod tests {
         assert_eq!(shortened, "Edit block 1");
     }
 
+    #[test]
+    fn test_expand_text() {
+        let mut mapper = IdMapper::new();
+        let block1 = BlockId::from_hex("aabbccdd11223344").unwrap();
+        mapper.register(&block1);
+
+        let expanded = mapper.expand_text("See block 1, [1] and #1; block 12 is unknown");
+        assert_eq!(
+            expanded,
+            format!(
+                "See block {b}, [{b}] and #{b}; block 12 is unknown",
+                b = block1
+            )
+        );
+        assert_eq!(
+            mapper.shorten_text(&expanded),
+            "See block 1, [1] and #1; block 12 is unknown"
+        );
+    }
+
     #[test]
     fn test_shorten_ucl() {
         let mut mapper = IdMapper::new();
@@ -491,4 +513,27 @@ mod tests {
         assert!(prompt.contains("type="));
         assert!(prompt.contains("content=\""));
     }
+
+    #[test]
+    fn test_document_to_prompt_exact() {
+        let mut doc = Document::create();
+        let root = doc.root;
+
+        let block1 = Block::new(Content::text("Say \"hi\"\nnow"), Some("heading1"));
+        let id1 = doc.add_block(block1, &root).unwrap();
+        let block2 = Block::new(Content::text("a\\b"), Some("paragraph"));
+        let id2 = doc.add_block(block2, &id1).unwrap();
+
+        let mapper = IdMapper::from_document(&doc);
+        let [r, a, b] = [root, id1, id2].map(|id| mapper.to_short_id(&id).unwrap());
+        assert_eq!(
+            mapper.document_to_prompt(&doc),
+            format!(
+                "Document structure:\n{r}: {a}\n{a}: {b}\n{b}:\n\nBlocks:\n\
+                 {r} type=text content=\"\"\n\
+                 {a} type=text content=\"Say \\\"hi\\\"\\nnow\"\n\
+                 {b} type=text content=\"a\\\\b\""
+            )
+        );
+    }
 }
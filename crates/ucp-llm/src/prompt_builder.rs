@@ -3,6 +3,7 @@
 //! Builds prompts based on specified capabilities so LLMs generate valid UCL.
 
 use std::collections::HashSet;
+use std::fmt::Write;
 
 /// UCL command capabilities that can be enabled for an agent
 #[derive(Debug, Clone, Copy, PartialEq, Eq, Hash)]
@@ -196,63 +197,60 @@ impl PromptBuilder {
 
     /// Build the system prompt
     pub fn build_system_prompt(&self) -> String {
-        let mut parts = Vec::new();
-
         // System context
-        if let Some(ref ctx) = self.system_context {
-            parts.push(ctx.clone());
-        } else {
-            parts.push(self.default_system_context());
-        }
+        let mut out = match self.system_context {
+            Some(ref ctx) => ctx.clone(),
+            None => self.default_system_context(),
+        };
 
         // Command reference header
-        parts.push("\n## UCL Command Reference\n".to_string());
+        out.push_str("\n\n## UCL Command Reference\n");
 
         // Add documentation for each enabled capability
         for cap in &self.capabilities {
-            parts.push(cap.documentation().to_string());
-            parts.push(String::new());
+            out.push('\n');
+            out.push_str(cap.documentation());
+            out.push('\n');
         }
 
         // Rules section
-        parts.push("## Rules".to_string());
+        out.push_str("\n## Rules");
 
-        // Default rules
+        // Default rules, then custom rules, numbered continuously
         let default_rules = self.default_rules();
-        for (i, rule) in default_rules.iter().enumerate() {
-            parts.push(format!("{}. {}", i + 1, rule));
-        }
-
-        // Custom rules
-        let offset = default_rules.len();
-        for (i, rule) in self.rules.iter().enumerate() {
-            parts.push(format!("{}. {}", offset + i + 1, rule));
+        let rules = default_rules
+            .iter()
+            .copied()
+            .chain(self.rules.iter().map(String::as_str));
+        for (i, rule) in rules.enumerate() {
+            let _ = write!(out, "\n{}. {}", i + 1, rule);
         }
 
-        parts.join("\n")
+        out
     }
 
     /// Build a complete prompt with document context
     pub fn build_prompt(&self, document_description: &str, task: &str) -> String {
-        let mut parts = Vec::new();
+        let mut out = String::new();
 
         // Task context if provided
         if let Some(ref ctx) = self.task_context {
-            parts.push(ctx.clone());
+            out.push_str(ctx);
+            out.push('\n');
         }
 
         // Document structure
-        parts.push("## Document Structure".to_string());
-        parts.push(document_description.to_string());
+        out.push_str("## Document Structure\n");
+        out.push_str(document_description);
 
         // Task
-        parts.push("\n## Task".to_string());
-        parts.push(task.to_string());
+        out.push_str("\n\n## Task\n");
+        out.push_str(task);
 
         // Instruction
-        parts.push("\nGenerate the UCL command:".to_string());
+        out.push_str("\n\nGenerate the UCL command:");
 
-        parts.join("\n")
+        out
     }
 
     fn default_system_context(&self) -> String {
@@ -367,13 +365,11 @@ mod tests {
         let builder = PromptBuilder::with_all_capabilities();
         let prompt = builder.build_system_prompt();
 
-        assert!(prompt.contains("EDIT"));
-        assert!(prompt.contains("APPEND"));
-        assert!(prompt.contains("MOVE"));
-        assert!(prompt.contains("DELETE"));
-        assert!(prompt.contains("LINK"));
-        assert!(prompt.contains("SNAPSHOT"));
-        assert!(prompt.contains("ATOMIC"));
+        for cap in UclCapability::all() {
+            for name in cap.command_names() {
+                assert!(prompt.contains(name), "{name} missing from prompt");
+            }
+        }
     }
 
     #[test]
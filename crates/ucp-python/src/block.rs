@@ -1,14 +1,15 @@
 //! Block type wrapper for Python.
 
 use pyo3::prelude::*;
+use pyo3::types::PyString;
 use ucm_core::Block;
 
-use crate::content::PyContent;
+use crate::content::{type_tag_str, PyContent};
 use crate::edge::{PyEdge, PyEdgeType};
-use crate::types::PyBlockId;
+use crate::types::{block_id_hash, PyBlockId};
 
 /// A block is the fundamental unit of content in UCM.
-#[pyclass(name = "Block")]
+#[pyclass(name = "Block", frozen)]
 #[derive(Clone)]
 pub struct PyBlock(pub(crate) Block);
 
@@ -50,18 +51,21 @@ impl PyBlock {
 
     /// Get the content type tag.
     #[getter]
-    fn content_type(&self) -> &'static str {
-        self.0.content_type()
+    fn content_type<'py>(&self, py: Python<'py>) -> Bound<'py, PyString> {
+        type_tag_str(py, &self.0.content)
     }
 
     /// Get the semantic role if set.
     #[getter]
-    fn role(&self) -> Option<String> {
-        self.0
-            .metadata
-            .semantic_role
-            .as_ref()
-            .map(|r| r.to_string())
+    fn role<'py>(&self, py: Python<'py>) -> Option<Bound<'py, PyString>> {
+        let role = self.0.metadata.semantic_role.as_ref()?;
+        if role.subcategory.is_none() && role.qualifier.is_none() {
+            // Bare categories are a fixed set, so hand out interned strings
+            // like content_type does; role filters then compare by identity.
+            Some(PyString::intern_bound(py, role.category.as_str()))
+        } else {
+            Some(PyString::new_bound(py, &role.to_string()))
+        }
     }
 
     /// Get the label if set.
@@ -88,6 +92,12 @@ impl PyBlock {
         self.0.edges.iter().map(PyEdge::from).collect()
     }
 
+    /// Get the number of edges without materializing them as Python objects.
+    #[getter]
+    fn edge_count(&self) -> usize {
+        self.0.edges.len()
+    }
+
     /// Check if this is the root block.
     fn is_root(&self) -> bool {
         self.0.is_root()
@@ -101,11 +111,14 @@ impl PyBlock {
     /// Get edges of a specific type.
     fn edges_of_type(&self, edge_type: PyEdgeType) -> Vec<PyEdge> {
         let et: ucm_core::EdgeType = edge_type.into();
-        self.0
-            .edges_of_type(&et)
-            .into_iter()
-            .map(PyEdge::from)
-            .collect()
+        self.0.iter_edges_of_type(&et).map(PyEdge::from).collect()
+    }
+
+    /// Check if the block has an edge to a target, optionally of a specific type.
+    #[pyo3(signature = (target, edge_type=None))]
+    fn has_edge_to(&self, target: &PyBlockId, edge_type: Option<PyEdgeType>) -> bool {
+        let et: Option<ucm_core::EdgeType> = edge_type.map(Into::into);
+        self.0.has_edge_to(target.inner(), et.as_ref())
     }
 
     /// Get the estimated token count.
@@ -145,6 +158,16 @@ impl PyBlock {
         }
     }
 
+    /// Blocks hash by their content-derived ID.
+    fn __hash__(&self) -> isize {
+        block_id_hash(&self.0.id)
+    }
+
+    /// Two blocks are equal when ID, content, metadata, edges and version match.
+    fn __eq__(&self, other: &Self) -> bool {
+        self.0 == other.0
+    }
+
     fn __repr__(&self) -> String {
         let content_preview = match &self.0.content {
             ucm_core::Content::Text(t) => {
@@ -1,19 +1,40 @@
 //! Content type wrapper for Python.
 
+use pyo3::intern;
 use pyo3::prelude::*;
-use pyo3::types::{PyBytes, PyDict};
+use pyo3::types::{PyBytes, PyDict, PyString};
 use ucm_core::content::{
     BinaryEncoding, CompositeLayout, Math, MathFormat, Media, MediaSource, MediaType,
 };
 use ucm_core::{BlockId, Content};
 
+use crate::json::{json_value_to_py, py_to_json_value};
+
+/// Interned Python string for a content type tag.
+///
+/// Tags are a small fixed set that Python code compares constantly, so each
+/// one is created once per interpreter instead of once per getter call.
+pub(crate) fn type_tag_str<'py>(py: Python<'py>, content: &Content) -> Bound<'py, PyString> {
+    let tag = match content {
+        Content::Text(_) => intern!(py, "text"),
+        Content::Table(_) => intern!(py, "table"),
+        Content::Code(_) => intern!(py, "code"),
+        Content::Math(_) => intern!(py, "math"),
+        Content::Media(_) => intern!(py, "media"),
+        Content::Json { .. } => intern!(py, "json"),
+        Content::Binary { .. } => intern!(py, "binary"),
+        Content::Composite { .. } => intern!(py, "composite"),
+    };
+    tag.clone()
+}
+
 // Helper for creating a new dict (PyO3 0.22 API)
 fn new_dict(py: Python<'_>) -> Bound<'_, PyDict> {
     PyDict::new_bound(py)
 }
 
 /// Block content with typed payload.
-#[pyclass(name = "Content")]
+#[pyclass(name = "Content", frozen)]
 #[derive(Clone)]
 pub struct PyContent(pub(crate) Content);
 
@@ -51,15 +72,8 @@ impl PyContent {
 
     /// Create JSON content.
     #[staticmethod]
-    fn json(py: Python<'_>, value: &Bound<'_, PyAny>) -> PyResult<Self> {
-        // Convert Python object to serde_json::Value via JSON string
-        let json_str: String = py
-            .import_bound("json")?
-            .call_method1("dumps", (value,))?
-            .extract()?;
-        let json_value: serde_json::Value = serde_json::from_str(&json_str)
-            .map_err(|e| pyo3::exceptions::PyValueError::new_err(format!("Invalid JSON: {}", e)))?;
-        Ok(PyContent(Content::json(json_value)))
+    fn json(value: &Bound<'_, PyAny>) -> PyResult<Self> {
+        Ok(PyContent(Content::json(py_to_json_value(value)?)))
     }
 
     /// Create table content from rows.
@@ -184,8 +198,8 @@ impl PyContent {
 
     /// Get the content type tag (e.g., "text", "code", "table").
     #[getter]
-    fn type_tag(&self) -> &'static str {
-        self.0.type_tag()
+    fn type_tag<'py>(&self, py: Python<'py>) -> Bound<'py, PyString> {
+        type_tag_str(py, &self.0)
     }
 
     /// Check if the content is empty.
@@ -216,20 +230,22 @@ impl PyContent {
         }
     }
 
+    /// Get the language hint if this is a code block.
+    ///
+    /// Cheaper than `as_code()` when only the language is needed, since the
+    /// source is not copied.
+    #[getter]
+    fn language(&self) -> Option<String> {
+        match &self.0 {
+            Content::Code(c) => Some(c.language.clone()),
+            _ => None,
+        }
+    }
+
     /// Get the JSON value if this is a JSON block.
     fn as_json(&self, py: Python<'_>) -> PyResult<Option<PyObject>> {
         match &self.0 {
-            Content::Json { value, .. } => {
-                let json_str = serde_json::to_string(value).map_err(|e| {
-                    pyo3::exceptions::PyValueError::new_err(format!(
-                        "JSON serialization error: {}",
-                        e
-                    ))
-                })?;
-                let json_module = py.import_bound("json")?;
-                let obj = json_module.call_method1("loads", (json_str,))?;
-                Ok(Some(obj.into()))
-            }
+            Content::Json { value, .. } => Ok(Some(json_value_to_py(py, value)?)),
             _ => Ok(None),
         }
     }
@@ -313,7 +329,7 @@ impl PyContent {
     /// Convert content to a Python dict representation.
     fn to_dict(&self, py: Python<'_>) -> PyResult<PyObject> {
         let dict = new_dict(py);
-        dict.set_item("type", self.type_tag())?;
+        dict.set_item("type", type_tag_str(py, &self.0))?;
 
         match &self.0 {
             Content::Text(t) => {
@@ -340,10 +356,7 @@ impl PyContent {
                 }
             }
             Content::Json { value, .. } => {
-                let json_str = serde_json::to_string(value).unwrap_or_default();
-                let json_module = py.import_bound("json")?;
-                let obj = json_module.call_method1("loads", (json_str,))?;
-                dict.set_item("value", obj)?;
+                dict.set_item("value", json_value_to_py(py, value)?)?;
             }
             Content::Binary {
                 mime_type, data, ..
@@ -376,7 +389,7 @@ impl PyContent {
                 t.columns.len(),
                 t.rows.len()
             ),
-            _ => format!("Content(type={:?})", self.type_tag()),
+            _ => format!("Content(type={:?})", self.0.type_tag()),
         }
     }
 }
@@ -1,6 +1,8 @@
 //! Document type wrapper for Python.
 
 use pyo3::prelude::*;
+use serde::Serialize;
+use std::collections::HashMap;
 use ucm_core::{Block, Content, Document, Edge, EdgeType};
 
 use crate::block::PyBlock;
@@ -30,6 +32,48 @@ impl PyDocument {
     }
 }
 
+/// Borrowed view of a document in the `to_json` layout, serialized directly
+/// without first building an intermediate `serde_json::Value` tree.
+#[derive(Serialize)]
+struct DocumentJson<'a> {
+    id: &'a str,
+    root: String,
+    structure: HashMap<String, Vec<String>>,
+    blocks: Vec<&'a Block>,
+    metadata: MetadataJson<'a>,
+}
+
+#[derive(Serialize)]
+struct MetadataJson<'a> {
+    title: &'a Option<String>,
+    description: &'a Option<String>,
+    authors: &'a [String],
+    created_at: String,
+    modified_at: String,
+}
+
+impl<'a> DocumentJson<'a> {
+    fn new(doc: &'a Document) -> Self {
+        Self {
+            id: &doc.id.0,
+            root: doc.root.to_string(),
+            structure: doc
+                .structure
+                .iter()
+                .map(|(k, v)| (k.to_string(), v.iter().map(|id| id.to_string()).collect()))
+                .collect(),
+            blocks: doc.blocks.values().collect(),
+            metadata: MetadataJson {
+                title: &doc.metadata.title,
+                description: &doc.metadata.description,
+                authors: &doc.metadata.authors,
+                created_at: doc.metadata.created_at.to_rfc3339(),
+                modified_at: doc.metadata.modified_at.to_rfc3339(),
+            },
+        }
+    }
+}
+
 #[pymethods]
 impl PyDocument {
     /// Create a new empty document.
@@ -108,13 +152,11 @@ impl PyDocument {
 
     /// Get all ancestors of a block (from parent to root).
     fn ancestors(&self, id: &PyBlockId) -> Vec<PyBlockId> {
-        let mut result = Vec::new();
-        let mut current = self.inner.parent(id.inner()).cloned();
-        while let Some(parent_id) = current {
-            result.push(PyBlockId::from(parent_id));
-            current = self.inner.parent(&parent_id).cloned();
-        }
-        result
+        self.inner
+            .ancestors(id.inner())
+            .into_iter()
+            .map(PyBlockId::from)
+            .collect()
     }
 
     /// Get all descendants of a block.
@@ -161,6 +203,24 @@ impl PyDocument {
         Ok(PyBlockId::from(id))
     }
 
+    /// Add several text blocks under the same parent, in order.
+    #[pyo3(signature = (parent_id, contents, role=None))]
+    fn add_blocks(
+        &mut self,
+        parent_id: &PyBlockId,
+        contents: Vec<String>,
+        role: Option<&str>,
+    ) -> PyResult<Vec<PyBlockId>> {
+        let blocks = contents
+            .into_iter()
+            .map(|content| Block::new(Content::text(content), role));
+        let ids = self
+            .inner
+            .add_blocks(blocks, parent_id.inner())
+            .into_py_result()?;
+        Ok(ids.into_iter().map(PyBlockId::from).collect())
+    }
+
     /// Add a new block with specific content type.
     #[pyo3(signature = (parent_id, content, role=None, label=None, index=None))]
     fn add_block_with_content(
@@ -267,25 +327,13 @@ impl PyDocument {
 
     /// Add a tag to a block.
     fn add_tag(&mut self, id: &PyBlockId, tag: &str) -> PyResult<()> {
-        let block = self
-            .inner
-            .get_block_mut(id.inner())
-            .ok_or_else(|| crate::errors::PyBlockNotFoundError::new_err(id.to_string_repr()))?;
-        if !block.metadata.tags.contains(&tag.to_string()) {
-            block.metadata.tags.push(tag.to_string());
-        }
+        self.inner.add_tag(id.inner(), tag).into_py_result()?;
         Ok(())
     }
 
     /// Remove a tag from a block.
     fn remove_tag(&mut self, id: &PyBlockId, tag: &str) -> PyResult<bool> {
-        let block = self
-            .inner
-            .get_block_mut(id.inner())
-            .ok_or_else(|| crate::errors::PyBlockNotFoundError::new_err(id.to_string_repr()))?;
-        let len_before = block.metadata.tags.len();
-        block.metadata.tags.retain(|t| t != tag);
-        Ok(block.metadata.tags.len() < len_before)
+        self.inner.remove_tag(id.inner(), tag).into_py_result()
     }
 
     /// Set a block's label.
@@ -309,13 +357,17 @@ impl PyDocument {
         let et: EdgeType = edge_type.into();
         let edge = Edge::new(et, *target_id.inner());
 
-        let block = self.inner.get_block_mut(source_id.inner()).ok_or_else(|| {
-            crate::errors::PyBlockNotFoundError::new_err(source_id.to_string_repr())
-        })?;
-        block.add_edge(edge.clone());
+        let block = self
+            .inner
+            .blocks
+            .get_mut(source_id.inner())
+            .ok_or_else(|| {
+                crate::errors::PyBlockNotFoundError::new_err(source_id.to_string_repr())
+            })?;
 
-        // Also update edge index
+        // Update the edge index first so the edge can be moved into the block
         self.inner.edge_index.add_edge(source_id.inner(), &edge);
+        block.add_edge(edge);
         Ok(())
     }
 
@@ -376,6 +428,23 @@ impl PyDocument {
             .collect()
     }
 
+    /// Check if an edge exists, optionally restricted to one edge type.
+    ///
+    /// Answered from the document's edge index without copying the block.
+    #[pyo3(signature = (source_id, target_id, edge_type=None))]
+    fn has_edge(
+        &self,
+        source_id: &PyBlockId,
+        target_id: &PyBlockId,
+        edge_type: Option<PyEdgeType>,
+    ) -> bool {
+        let index = &self.inner.edge_index;
+        match edge_type {
+            Some(et) => index.has_edge(source_id.inner(), target_id.inner(), &et.into()),
+            None => index.has_edge_between(source_id.inner(), target_id.inner()),
+        }
+    }
+
     /// Get incoming edges to a block.
     fn incoming_edges(&self, id: &PyBlockId) -> Vec<(PyEdgeType, PyBlockId)> {
         self.inner
@@ -436,24 +505,8 @@ impl PyDocument {
 
     /// Serialize to JSON string.
     fn to_json(&self) -> PyResult<String> {
-        // Create a serializable representation
-        let blocks: Vec<_> = self.inner.blocks.values().collect();
-        serde_json::to_string_pretty(&serde_json::json!({
-            "id": self.inner.id.0,
-            "root": self.inner.root.to_string(),
-            "structure": self.inner.structure.iter()
-                .map(|(k, v)| (k.to_string(), v.iter().map(|id| id.to_string()).collect::<Vec<_>>()))
-                .collect::<std::collections::HashMap<_, _>>(),
-            "blocks": blocks,
-            "metadata": {
-                "title": self.inner.metadata.title,
-                "description": self.inner.metadata.description,
-                "authors": self.inner.metadata.authors,
-                "created_at": self.inner.metadata.created_at.to_rfc3339(),
-                "modified_at": self.inner.metadata.modified_at.to_rfc3339(),
-            }
-        }))
-        .map_err(|e| crate::errors::PyUcpError::new_err(format!("Serialization error: {}", e)))
+        serde_json::to_string_pretty(&DocumentJson::new(&self.inner))
+            .map_err(|e| crate::errors::PyUcpError::new_err(format!("Serialization error: {}", e)))
     }
 
     /// Get document version.
@@ -490,41 +543,23 @@ impl PyDocument {
 
     /// Get the depth of a block from the root (root has depth 0).
     fn depth(&self, id: &PyBlockId) -> usize {
-        let mut depth = 0;
-        let mut current = self.inner.parent(id.inner()).cloned();
-        while let Some(parent_id) = current {
-            depth += 1;
-            current = self.inner.parent(&parent_id).cloned();
-        }
-        depth
+        self.inner.ancestors(id.inner()).len()
     }
 
     /// Find blocks by semantic role.
     fn find_by_role(&self, role: &str) -> Vec<PyBlockId> {
         self.inner
-            .blocks
-            .values()
-            .filter(|block| {
-                block
-                    .metadata
-                    .semantic_role
-                    .as_ref()
-                    .map(|r| r.to_string() == role)
-                    .unwrap_or(false)
-            })
-            .map(|block| PyBlockId::from(block.id))
+            .find_by_role(role)
+            .into_iter()
+            .map(PyBlockId::from)
             .collect()
     }
 
     /// Get the path from root to a block (list of block IDs).
     fn path_from_root(&self, id: &PyBlockId) -> Vec<PyBlockId> {
-        let mut path = Vec::new();
-        let mut current = Some(*id.inner());
-        while let Some(block_id) = current {
-            path.push(PyBlockId::from(block_id));
-            current = self.inner.parent(&block_id).cloned();
-        }
-        path.reverse();
+        let ancestors = self.inner.ancestors(id.inner());
+        let mut path: Vec<PyBlockId> = ancestors.into_iter().rev().map(PyBlockId::from).collect();
+        path.push(PyBlockId::from(*id.inner()));
         path
     }
 
@@ -563,4 +598,15 @@ impl PyDocument {
     fn __len__(&self) -> usize {
         self.inner.block_count()
     }
+
+    /// Copy the document. The copy shares nothing with the original.
+    fn __copy__(&self) -> Self {
+        PyDocument::new(self.inner.clone())
+    }
+
+    /// Deep-copy the document; equivalent to `__copy__` since a document
+    /// holds no Python objects.
+    fn __deepcopy__(&self, _memo: &Bound<'_, PyAny>) -> Self {
+        self.__copy__()
+    }
 }
@@ -1,6 +1,8 @@
 //! Edge type wrappers for Python.
 
+use pyo3::intern;
 use pyo3::prelude::*;
+use pyo3::types::PyString;
 use std::str::FromStr;
 use ucm_core::{Edge, EdgeType};
 
@@ -81,6 +83,36 @@ impl From<PyEdgeType> for EdgeType {
     }
 }
 
+impl PyEdgeType {
+    /// Interned Python string for this edge type's name.
+    ///
+    /// The names are a fixed set, like content type tags, so each one is
+    /// created once per interpreter instead of once per call.
+    fn name_str<'py>(self, py: Python<'py>) -> Bound<'py, PyString> {
+        let name = match self {
+            PyEdgeType::DerivedFrom => intern!(py, "derived_from"),
+            PyEdgeType::Supersedes => intern!(py, "supersedes"),
+            PyEdgeType::TransformedFrom => intern!(py, "transformed_from"),
+            PyEdgeType::References => intern!(py, "references"),
+            PyEdgeType::CitedBy => intern!(py, "cited_by"),
+            PyEdgeType::LinksTo => intern!(py, "links_to"),
+            PyEdgeType::Supports => intern!(py, "supports"),
+            PyEdgeType::Contradicts => intern!(py, "contradicts"),
+            PyEdgeType::Elaborates => intern!(py, "elaborates"),
+            PyEdgeType::Summarizes => intern!(py, "summarizes"),
+            PyEdgeType::ParentOf => intern!(py, "parent_of"),
+            PyEdgeType::ChildOf => intern!(py, "child_of"),
+            PyEdgeType::SiblingOf => intern!(py, "sibling_of"),
+            PyEdgeType::PreviousSibling => intern!(py, "previous_sibling"),
+            PyEdgeType::NextSibling => intern!(py, "next_sibling"),
+            PyEdgeType::VersionOf => intern!(py, "version_of"),
+            PyEdgeType::AlternativeOf => intern!(py, "alternative_of"),
+            PyEdgeType::TranslationOf => intern!(py, "translation_of"),
+        };
+        name.clone()
+    }
+}
+
 #[pymethods]
 impl PyEdgeType {
     /// Parse an edge type from string.
@@ -92,9 +124,8 @@ impl PyEdgeType {
     }
 
     /// Convert to string representation.
-    fn as_string(&self) -> String {
-        let et: EdgeType = (*self).into();
-        et.as_str()
+    fn as_string<'py>(&self, py: Python<'py>) -> Bound<'py, PyString> {
+        self.name_str(py)
     }
 
     /// Check if this edge type is symmetric.
@@ -109,17 +140,18 @@ impl PyEdgeType {
         et.is_structural()
     }
 
-    fn __str__(&self) -> String {
-        self.as_string()
+    fn __str__<'py>(&self, py: Python<'py>) -> Bound<'py, PyString> {
+        self.name_str(py)
     }
 
     fn __repr__(&self) -> String {
-        format!("EdgeType.{}", self.as_string().to_uppercase())
+        let et: EdgeType = (*self).into();
+        format!("EdgeType.{}", et.as_str().to_uppercase())
     }
 }
 
 /// An edge representing a relationship between blocks.
-#[pyclass(name = "Edge")]
+#[pyclass(name = "Edge", frozen)]
 #[derive(Clone)]
 pub struct PyEdge(pub(crate) Edge);
 
@@ -3,10 +3,13 @@
 //! Exposes the UCM Engine with transaction support, validation, and batch operations.
 
 use pyo3::prelude::*;
+use pyo3::types::PyString;
+use std::sync::Arc;
+use ucm_core::ValidationSeverity;
 use ucm_engine::engine::{Engine, EngineConfig};
 use ucm_engine::traversal::{
-    NavigateDirection, TraversalConfig, TraversalEngine, TraversalFilter, TraversalOutput,
-    TraversalResult,
+    NavigateDirection, TraversalConfig, TraversalEngine, TraversalFilter, TraversalNode,
+    TraversalOutput, TraversalResult,
 };
 use ucm_engine::validate::{ResourceLimits, ValidationPipeline, ValidationResult};
 
@@ -251,26 +254,44 @@ impl PyResourceLimits {
 }
 
 /// Validation result.
-#[pyclass(name = "ValidationResult")]
+#[pyclass(name = "ValidationResult", frozen)]
 #[derive(Clone)]
 pub struct PyValidationResult {
     valid: bool,
     issues: Vec<PyValidationIssue>,
+    /// Positions in `issues` of errors and warnings, bucketed once on conversion
+    error_positions: Vec<usize>,
+    warning_positions: Vec<usize>,
 }
 
 impl From<ValidationResult> for PyValidationResult {
     fn from(result: ValidationResult) -> Self {
+        let mut issues = Vec::with_capacity(result.issues.len());
+        let mut error_positions = Vec::new();
+        let mut warning_positions = Vec::new();
+        for (pos, issue) in result.issues.into_iter().enumerate() {
+            match issue.severity {
+                ValidationSeverity::Error => error_positions.push(pos),
+                ValidationSeverity::Warning => warning_positions.push(pos),
+                ValidationSeverity::Info => {}
+            }
+            issues.push(PyValidationIssue::from(issue));
+        }
         Self {
             valid: result.valid,
-            issues: result
-                .issues
-                .into_iter()
-                .map(PyValidationIssue::from)
-                .collect(),
+            issues,
+            error_positions,
+            warning_positions,
         }
     }
 }
 
+impl PyValidationResult {
+    fn issues_at(&self, positions: &[usize]) -> Vec<PyValidationIssue> {
+        positions.iter().map(|&i| self.issues[i].clone()).collect()
+    }
+}
+
 #[pymethods]
 impl PyValidationResult {
     #[getter]
@@ -285,20 +306,12 @@ impl PyValidationResult {
 
     /// Get only error issues.
     fn errors(&self) -> Vec<PyValidationIssue> {
-        self.issues
-            .iter()
-            .filter(|i| i.severity == "error")
-            .cloned()
-            .collect()
+        self.issues_at(&self.error_positions)
     }
 
     /// Get only warning issues.
     fn warnings(&self) -> Vec<PyValidationIssue> {
-        self.issues
-            .iter()
-            .filter(|i| i.severity == "warning")
-            .cloned()
-            .collect()
+        self.issues_at(&self.warning_positions)
     }
 
     fn __repr__(&self) -> String {
@@ -315,11 +328,10 @@ impl PyValidationResult {
 }
 
 /// A single validation issue.
-#[pyclass(name = "ValidationIssue")]
+#[pyclass(name = "ValidationIssue", frozen)]
 #[derive(Clone)]
 pub struct PyValidationIssue {
-    #[pyo3(get)]
-    severity: String,
+    severity: &'static str,
     #[pyo3(get)]
     code: String,
     #[pyo3(get)]
@@ -329,7 +341,7 @@ pub struct PyValidationIssue {
 impl From<ucm_core::ValidationIssue> for PyValidationIssue {
     fn from(issue: ucm_core::ValidationIssue) -> Self {
         Self {
-            severity: format!("{:?}", issue.severity).to_lowercase(),
+            severity: issue.severity.as_str(),
             code: format!("{:?}", issue.code),
             message: issue.message,
         }
@@ -338,6 +350,12 @@ impl From<ucm_core::ValidationIssue> for PyValidationIssue {
 
 #[pymethods]
 impl PyValidationIssue {
+    /// Severity name; interned, so equal severities are the same object.
+    #[getter]
+    fn severity<'py>(&self, py: Python<'py>) -> Bound<'py, PyString> {
+        PyString::intern_bound(py, self.severity)
+    }
+
     fn __repr__(&self) -> String {
         format!(
             "ValidationIssue(severity='{}', code='{}', message='{}')",
@@ -410,7 +428,7 @@ fn parse_direction(s: &str) -> NavigateDirection {
 }
 
 /// Traversal filter for filtering blocks during traversal.
-#[pyclass(name = "TraversalFilter")]
+#[pyclass(name = "TraversalFilter", frozen)]
 #[derive(Clone, Default)]
 pub struct PyTraversalFilter {
     include_roles: Vec<String>,
@@ -468,7 +486,7 @@ impl From<&PyTraversalFilter> for TraversalFilter {
 }
 
 /// Traversal configuration.
-#[pyclass(name = "TraversalConfig")]
+#[pyclass(name = "TraversalConfig", frozen)]
 #[derive(Clone)]
 pub struct PyTraversalConfig {
     pub(crate) inner: TraversalConfig,
@@ -509,40 +527,72 @@ impl PyTraversalConfig {
 }
 
 /// A node in the traversal result.
-#[pyclass(name = "TraversalNode")]
+#[pyclass(name = "TraversalNode", frozen)]
 #[derive(Clone)]
 pub struct PyTraversalNode {
-    #[pyo3(get)]
-    id: String,
-    #[pyo3(get)]
-    depth: usize,
-    #[pyo3(get)]
-    parent_id: Option<String>,
-    #[pyo3(get)]
-    content_preview: Option<String>,
-    #[pyo3(get)]
-    semantic_role: Option<String>,
-    #[pyo3(get)]
-    child_count: usize,
-    #[pyo3(get)]
-    edge_count: usize,
+    /// Shares the result's nodes; fields are converted only when read.
+    nodes: Arc<[TraversalNode]>,
+    index: usize,
+}
+
+impl PyTraversalNode {
+    fn node(&self) -> &TraversalNode {
+        &self.nodes[self.index]
+    }
 }
 
 #[pymethods]
 impl PyTraversalNode {
+    #[getter]
+    fn id(&self) -> String {
+        self.node().id.to_string()
+    }
+
+    #[getter]
+    fn depth(&self) -> usize {
+        self.node().depth
+    }
+
+    #[getter]
+    fn parent_id(&self) -> Option<String> {
+        self.node().parent_id.map(|id| id.to_string())
+    }
+
+    #[getter]
+    fn content_preview(&self) -> Option<&str> {
+        self.node().content_preview.as_deref()
+    }
+
+    #[getter]
+    fn semantic_role(&self) -> Option<&str> {
+        self.node().semantic_role.as_deref()
+    }
+
+    #[getter]
+    fn child_count(&self) -> usize {
+        self.node().child_count
+    }
+
+    #[getter]
+    fn edge_count(&self) -> usize {
+        self.node().edge_count
+    }
+
     fn __repr__(&self) -> String {
+        let node = self.node();
         format!(
             "TraversalNode(id='{}', depth={}, role={:?})",
-            self.id, self.depth, self.semantic_role
+            node.id, node.depth, node.semantic_role
         )
     }
 }
 
 /// Traversal result containing nodes, edges, and summary.
-#[pyclass(name = "TraversalResult")]
+#[pyclass(name = "TraversalResult", frozen)]
 #[derive(Clone)]
 pub struct PyTraversalResult {
-    nodes: Vec<PyTraversalNode>,
+    /// Kept as Rust nodes; Python wrappers are only built when requested.
+    nodes: Arc<[TraversalNode]>,
     total_nodes: usize,
     max_depth: usize,
     execution_time_ms: Option<u64>,
@@ -551,19 +601,7 @@ pub struct PyTraversalResult {
 impl From<TraversalResult> for PyTraversalResult {
     fn from(result: TraversalResult) -> Self {
         Self {
-            nodes: result
-                .nodes
-                .into_iter()
-                .map(|n| PyTraversalNode {
-                    id: n.id.to_string(),
-                    depth: n.depth,
-                    parent_id: n.parent_id.map(|id| id.to_string()),
-                    content_preview: n.content_preview,
-                    semantic_role: n.semantic_role,
-                    child_count: n.child_count,
-                    edge_count: n.edge_count,
-                })
-                .collect(),
+            nodes: result.nodes.into(),
             total_nodes: result.summary.total_nodes,
             max_depth: result.summary.max_depth,
             execution_time_ms: result.metadata.execution_time_ms,
@@ -575,7 +613,12 @@ impl From<TraversalResult> for PyTraversalResult {
 impl PyTraversalResult {
     #[getter]
     fn nodes(&self) -> Vec<PyTraversalNode> {
-        self.nodes.clone()
+        (0..self.nodes.len())
+            .map(|index| PyTraversalNode {
+                nodes: Arc::clone(&self.nodes),
+                index,
+            })
+            .collect()
     }
 
     #[getter]
@@ -595,7 +638,7 @@ impl PyTraversalResult {
 
     /// Get node IDs only.
     fn node_ids(&self) -> Vec<String> {
-        self.nodes.iter().map(|n| n.id.clone()).collect()
+        self.nodes.iter().map(|n| n.id.to_string()).collect()
     }
 
     fn __len__(&self) -> usize {
@@ -702,6 +745,21 @@ impl PyTraversalEngine {
             .collect())
     }
 
+    /// Find a shortest path between two nodes, or None if unreachable.
+    fn shortest_path(
+        &self,
+        doc: &PyDocument,
+        from_id: &PyBlockId,
+        to_id: &PyBlockId,
+    ) -> PyResult<Option<Vec<PyBlockId>>> {
+        let path = self
+            .inner
+            .shortest_path(doc.inner(), from_id.inner(), to_id.inner())
+            .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))?;
+
+        Ok(path.map(|p| p.into_iter().map(PyBlockId::from).collect()))
+    }
+
     fn __repr__(&self) -> String {
         "TraversalEngine()".to_string()
     }
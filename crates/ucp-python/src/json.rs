@@ -1,4 +1,8 @@
+use std::collections::HashSet;
+
 use pyo3::prelude::*;
+use pyo3::types::{PyBool, PyDict, PyFloat, PyList, PyLong, PyString, PyTuple};
+use pyo3::PyTypeInfo;
 use serde::Serialize;
 use serde_json::Value;
 
@@ -21,12 +25,208 @@ pub fn to_python_json<T: Serialize>(py: Python<'_>, value: &T) -> PyResult<PyObj
     let mut json_value = serde_json::to_value(value)
         .map_err(|err| pyo3::exceptions::PyValueError::new_err(err.to_string()))?;
     normalize_block_ids(&mut json_value, None);
-    let json = serde_json::to_string(&json_value)
-        .map_err(|err| pyo3::exceptions::PyValueError::new_err(err.to_string()))?;
-    Ok(py
-        .import_bound("json")?
-        .call_method1("loads", (json,))?
-        .into())
+    json_value_to_py(py, &json_value)
+}
+
+/// Nesting limit for the conversions below, matching the interpreter's default
+/// recursion limit that `json.dumps` / `json.loads` run into.
+const MAX_DEPTH: usize = 1000;
+
+fn depth_exceeded(direction: &str) -> PyErr {
+    pyo3::exceptions::PyRecursionError::new_err(format!(
+        "maximum recursion depth exceeded while {}",
+        direction
+    ))
+}
+
+/// Convert a JSON value into the equivalent Python object.
+///
+/// Builds dicts and lists directly instead of serializing to a string and
+/// handing it to `json.loads`.
+pub fn json_value_to_py(py: Python<'_>, value: &Value) -> PyResult<PyObject> {
+    value_to_py(py, value, 0)
+}
+
+fn value_to_py(py: Python<'_>, value: &Value, depth: usize) -> PyResult<PyObject> {
+    Ok(match value {
+        Value::Null => py.None(),
+        Value::Bool(b) => (*b).into_py(py),
+        Value::Number(n) => {
+            if let Some(i) = n.as_i64() {
+                i.into_py(py)
+            } else if let Some(u) = n.as_u64() {
+                u.into_py(py)
+            } else {
+                n.as_f64().unwrap_or_default().into_py(py)
+            }
+        }
+        Value::String(s) => s.as_str().into_py(py),
+        Value::Array(items) => {
+            if depth >= MAX_DEPTH {
+                return Err(depth_exceeded("decoding a JSON array"));
+            }
+            let list = PyList::empty_bound(py);
+            for item in items {
+                list.append(value_to_py(py, item, depth + 1)?)?;
+            }
+            list.into_py(py)
+        }
+        Value::Object(map) => {
+            if depth >= MAX_DEPTH {
+                return Err(depth_exceeded("decoding a JSON object"));
+            }
+            let dict = PyDict::new_bound(py);
+            for (key, item) in map {
+                dict.set_item(key, value_to_py(py, item, depth + 1)?)?;
+            }
+            dict.into_py(py)
+        }
+    })
+}
+
+/// Convert a Python object into a JSON value.
+///
+/// Accepts the same types as `json.dumps` with its default settings, without
+/// going through an intermediate JSON string. Like `json.dumps`, containers
+/// that contain themselves raise `ValueError` and overly deep nesting raises
+/// `RecursionError`.
+pub fn py_to_json_value(obj: &Bound<'_, PyAny>) -> PyResult<Value> {
+    Encoder::default().encode(obj, 0)
+}
+
+/// Tracks the containers currently being encoded, as `json`'s `markers` do.
+#[derive(Default)]
+struct Encoder {
+    markers: HashSet<usize>,
+}
+
+impl Encoder {
+    fn encode(&mut self, obj: &Bound<'_, PyAny>, depth: usize) -> PyResult<Value> {
+        if obj.is_none() {
+            return Ok(Value::Null);
+        }
+        // bool is a subclass of int, so it must be checked first
+        if let Ok(b) = obj.downcast::<PyBool>() {
+            return Ok(Value::Bool(b.is_true()));
+        }
+        if obj.is_instance_of::<PyLong>() {
+            if let Ok(i) = obj.extract::<i64>() {
+                return Ok(Value::from(i));
+            }
+            if let Ok(u) = obj.extract::<u64>() {
+                return Ok(Value::from(u));
+            }
+            return json_float(obj.extract::<f64>()?);
+        }
+        if obj.is_instance_of::<PyFloat>() {
+            return json_float(obj.extract::<f64>()?);
+        }
+        if obj.is_instance_of::<PyString>() {
+            return Ok(Value::String(obj.extract()?));
+        }
+        if let Ok(list) = obj.downcast::<PyList>() {
+            return self.nested(obj, depth, "encoding a JSON array", |encoder| {
+                list.iter()
+                    .map(|item| encoder.encode(&item, depth + 1))
+                    .collect::<PyResult<Vec<_>>>()
+                    .map(Value::Array)
+            });
+        }
+        if let Ok(tuple) = obj.downcast::<PyTuple>() {
+            return self.nested(obj, depth, "encoding a JSON array", |encoder| {
+                tuple
+                    .iter()
+                    .map(|item| encoder.encode(&item, depth + 1))
+                    .collect::<PyResult<Vec<_>>>()
+                    .map(Value::Array)
+            });
+        }
+        if let Ok(dict) = obj.downcast::<PyDict>() {
+            return self.nested(obj, depth, "encoding a JSON object", |encoder| {
+                let mut map = serde_json::Map::with_capacity(dict.len());
+                for (key, item) in dict.iter() {
+                    map.insert(json_key(&key)?, encoder.encode(&item, depth + 1)?);
+                }
+                Ok(Value::Object(map))
+            });
+        }
+        Err(pyo3::exceptions::PyTypeError::new_err(format!(
+            "Object of type {} is not JSON serializable",
+            obj.get_type().name()?
+        )))
+    }
+
+    /// Encode a container's items with `obj` marked as in progress.
+    fn nested(
+        &mut self,
+        obj: &Bound<'_, PyAny>,
+        depth: usize,
+        direction: &str,
+        encode_items: impl FnOnce(&mut Self) -> PyResult<Value>,
+    ) -> PyResult<Value> {
+        if depth >= MAX_DEPTH {
+            return Err(depth_exceeded(direction));
+        }
+        let marker = obj.as_ptr() as usize;
+        if !self.markers.insert(marker) {
+            return Err(pyo3::exceptions::PyValueError::new_err(
+                "Circular reference detected",
+            ));
+        }
+        let result = encode_items(self);
+        self.markers.remove(&marker);
+        result
+    }
+}
+
+fn json_float(f: f64) -> PyResult<Value> {
+    serde_json::Number::from_f64(f)
+        .map(Value::Number)
+        .ok_or_else(|| {
+            pyo3::exceptions::PyValueError::new_err(format!(
+                "Invalid JSON: {} is not a valid JSON number",
+                f
+            ))
+        })
+}
+
+/// Convert a dict key the way `json.dumps` does.
+fn json_key(key: &Bound<'_, PyAny>) -> PyResult<String> {
+    if key.is_instance_of::<PyString>() {
+        return key.extract();
+    }
+    if key.is_none() {
+        return Ok("null".to_string());
+    }
+    if let Ok(b) = key.downcast::<PyBool>() {
+        return Ok(if b.is_true() { "true" } else { "false" }.to_string());
+    }
+    // json uses the base type's __repr__, so int/float subclasses such as
+    // IntEnum keep their numeric form, and non-finite floats get JS names
+    if key.is_instance_of::<PyFloat>() {
+        let f = key.extract::<f64>()?;
+        if f.is_nan() {
+            return Ok("NaN".to_string());
+        }
+        if f.is_infinite() {
+            return Ok(if f > 0.0 { "Infinity" } else { "-Infinity" }.to_string());
+        }
+        return base_repr::<PyFloat>(key);
+    }
+    if key.is_instance_of::<PyLong>() {
+        return base_repr::<PyLong>(key);
+    }
+    Err(pyo3::exceptions::PyTypeError::new_err(format!(
+        "keys must be str, int, float, bool or None, not {}",
+        key.get_type().name()?
+    )))
+}
+
+fn base_repr<T: PyTypeInfo>(obj: &Bound<'_, PyAny>) -> PyResult<String> {
+    obj.py()
+        .get_type_bound::<T>()
+        .call_method1("__repr__", (obj,))?
+        .extract()
 }
 
 fn normalize_block_ids(value: &mut Value, key: Option<&str>) {
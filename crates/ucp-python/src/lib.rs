@@ -50,15 +50,22 @@ use snapshot::{PySnapshotInfo, PySnapshotManager};
 use types::PyBlockId;
 
 /// Parse markdown into a Document.
+///
+/// The GIL is released while parsing, so other Python threads keep running.
 #[pyfunction]
 #[pyo3(name = "parse")]
-fn parse_markdown(markdown: &str) -> PyResult<PyDocument> {
-    let doc = ucp_translator_markdown::parse_markdown(markdown)
+fn parse_markdown(py: Python<'_>, markdown: &str) -> PyResult<PyDocument> {
+    let doc = py
+        .allow_threads(|| ucp_translator_markdown::parse_markdown(markdown))
         .map_err(|e| PyUcpError::new_err(e.to_string()))?;
     Ok(PyDocument::new(doc))
 }
 
 /// Render a Document to markdown.
+///
+/// Unlike `parse`, this keeps the GIL: `Document` is mutable, and releasing the
+/// GIL while it is borrowed would make a concurrent `add_block` from another
+/// thread fail with "Already borrowed" instead of waiting its turn.
 #[pyfunction]
 #[pyo3(name = "render")]
 fn render_markdown(doc: &PyDocument) -> PyResult<String> {
@@ -77,13 +84,14 @@ fn parse_html(html: &str) -> PyResult<PyDocument> {
 /// Clear a section's content with undo support.
 #[pyfunction]
 fn clear_section_with_undo(
+    py: Python<'_>,
     doc: &mut PyDocument,
     section_id: &PyBlockId,
 ) -> PyResult<PyClearResult> {
     let result =
         ucm_engine::section::clear_section_content_with_undo(doc.inner_mut(), section_id.inner())
             .map_err(|e| PyUcpError::new_err(e.to_string()))?;
-    Ok(PyClearResult::from(result))
+    PyClearResult::new(py, result)
 }
 
 /// Restore previously deleted section content.
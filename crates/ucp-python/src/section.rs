@@ -3,7 +3,7 @@
 use pyo3::prelude::*;
 use pyo3::types::PyDict;
 use ucm_engine::section::{
-    clear_section_content_with_undo, integrate_section_blocks, restore_deleted_content,
+    clear_section_content_with_undo, integrate_section_blocks, restore_deleted_content_owned,
     ClearResult, DeletedContent,
 };
 
@@ -45,7 +45,7 @@ pub fn write_section(
         base_heading_level,
     )
     .map_err(|e| {
-        let _ = restore_deleted_content(doc.inner_mut(), &deleted_content);
+        let _ = restore_deleted_content_owned(doc.inner_mut(), deleted_content);
         pyo3::exceptions::PyRuntimeError::new_err(format!(
             "Failed to integrate section {}: {}",
             section_id.inner(),
@@ -62,7 +62,7 @@ pub fn write_section(
 }
 
 /// Result of writing markdown into a section.
-#[pyclass(name = "WriteSectionResult")]
+#[pyclass(name = "WriteSectionResult", frozen)]
 #[derive(Clone)]
 pub struct PyWriteSectionResult {
     #[pyo3(get)]
@@ -88,23 +88,23 @@ impl PyWriteSectionResult {
 }
 
 /// Result of a section clear operation with undo support.
-#[pyclass(name = "ClearResult")]
-#[derive(Clone)]
+#[pyclass(name = "ClearResult", frozen)]
 pub struct PyClearResult {
     removed_ids: Vec<PyBlockId>,
-    deleted_content: PyDeletedContent,
+    /// Shared with Python so the snapshot is not copied on every access.
+    deleted_content: Py<PyDeletedContent>,
 }
 
-impl From<ClearResult> for PyClearResult {
-    fn from(result: ClearResult) -> Self {
-        Self {
+impl PyClearResult {
+    pub fn new(py: Python<'_>, result: ClearResult) -> PyResult<Self> {
+        Ok(Self {
             removed_ids: result
                 .removed_ids
                 .into_iter()
                 .map(PyBlockId::from)
                 .collect(),
-            deleted_content: PyDeletedContent::from(result.deleted_content),
-        }
+            deleted_content: Py::new(py, PyDeletedContent::from(result.deleted_content))?,
+        })
     }
 }
 
@@ -118,8 +118,8 @@ impl PyClearResult {
 
     /// Get the deleted content for potential restoration.
     #[getter]
-    fn deleted_content(&self) -> PyDeletedContent {
-        self.deleted_content.clone()
+    fn deleted_content(&self, py: Python<'_>) -> Py<PyDeletedContent> {
+        self.deleted_content.clone_ref(py)
     }
 
     /// Get the number of removed blocks.
@@ -133,7 +133,7 @@ impl PyClearResult {
 }
 
 /// Deleted content that can be restored.
-#[pyclass(name = "DeletedContent")]
+#[pyclass(name = "DeletedContent", frozen)]
 #[derive(Clone)]
 pub struct PyDeletedContent {
     inner: DeletedContent,
@@ -206,7 +206,8 @@ impl PyDeletedContent {
 
     /// Serialize to JSON string for persistence.
     fn to_json(&self) -> PyResult<String> {
-        serde_json::to_string(&self.inner)
+        self.inner
+            .to_json()
             .map_err(|e| pyo3::exceptions::PyValueError::new_err(e.to_string()))
     }
 
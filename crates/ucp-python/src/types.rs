@@ -1,8 +1,6 @@
 //! Core type wrappers for Python.
 
 use pyo3::prelude::*;
-use std::collections::hash_map::DefaultHasher;
-use std::hash::{Hash, Hasher};
 use ucm_core::BlockId;
 
 /// A content-addressed block identifier.
@@ -10,6 +8,20 @@ use ucm_core::BlockId;
 #[derive(Clone)]
 pub struct PyBlockId(pub(crate) BlockId);
 
+/// Python hash for a block ID.
+///
+/// IDs are truncated SHA-256 digests and already uniformly distributed, so
+/// folding the 12 bytes into a word is enough; running them through SipHash
+/// again buys nothing.
+pub(crate) fn block_id_hash(id: &BlockId) -> isize {
+    let bytes = id.as_bytes();
+    let mut low = [0u8; 8];
+    low.copy_from_slice(&bytes[..8]);
+    let mut high = [0u8; 4];
+    high.copy_from_slice(&bytes[8..]);
+    (u64::from_le_bytes(low) ^ (u32::from_le_bytes(high) as u64).rotate_left(32)) as isize
+}
+
 impl PyBlockId {
     pub fn inner(&self) -> &BlockId {
         &self.0
@@ -57,9 +69,7 @@ impl PyBlockId {
     }
 
     fn __hash__(&self) -> isize {
-        let mut hasher = DefaultHasher::new();
-        self.0.hash(&mut hasher);
-        hasher.finish() as isize
+        block_id_hash(&self.0)
     }
 
     fn __eq__(&self, other: &Self) -> bool {
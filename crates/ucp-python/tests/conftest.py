@@ -1,5 +1,6 @@
 """Pytest configuration and fixtures for UCP tests."""
 
+import copy
 import pytest
 import sys
 import os
@@ -13,28 +14,61 @@ else:
     print("✓ Using ucp from local build")
 
 
-@pytest.fixture
-def empty_doc():
-    """Create an empty document."""
+@pytest.fixture(scope="session", autouse=True)
+def _warmup():
+    """Touch the lazily initialised parts of the bindings once per session.
+
+    Interned strings and compiled UCL patterns are built on first use; doing
+    that here keeps the one-off cost out of whichever test happens to run first.
+    """
+    import ucp
+
+    doc = ucp.parse("# Warm-up\n\nParagraph\n")
+    ucp.render(doc)
+    mapper = ucp.IdMapper.from_document(doc)
+    mapper.expand_ucl("EDIT 1 SET text = \"x\"")
+    ucp.PromptBuilder.with_all_capabilities().build_system_prompt()
+    ucp.EdgeType.References.as_string()
+
+
+@pytest.fixture(scope="session")
+def _empty_doc_template():
+    """Empty document built once and copied into each test."""
     import ucp
 
     return ucp.create()
 
 
-@pytest.fixture
-def doc_with_title():
-    """Create a document with a title."""
+@pytest.fixture(scope="session")
+def _titled_doc_template():
+    """Titled document built once and copied into each test."""
     import ucp
 
     return ucp.create("Test Document")
 
 
-@pytest.fixture
-def doc_with_blocks():
-    """Create a document with several blocks."""
+@pytest.fixture(scope="session")
+def parsed_section_doc():
+    """Parsed title/section/content document, shared read-only per session."""
     import ucp
 
-    doc = ucp.create("Test Document")
+    return ucp.parse("# Title\n\n## Section\n\nContent")
+
+
+@pytest.fixture
+def empty_doc(_empty_doc_template):
+    """Create an empty document."""
+    return copy.deepcopy(_empty_doc_template)
+
+
+@pytest.fixture
+def doc_with_title(_titled_doc_template):
+    """Create a document with a title."""
+    return copy.deepcopy(_titled_doc_template)
+
+
+def _build_doc_with_blocks(template):
+    doc = copy.deepcopy(template)
     root = doc.root_id
 
     # Add some blocks
@@ -43,3 +77,20 @@ def doc_with_blocks():
     block3 = doc.add_block(block1, "Nested block", role="note")
 
     return doc, root, block1, block2, block3
+
+
+@pytest.fixture
+def doc_with_blocks(_titled_doc_template):
+    """Create a document with several blocks."""
+    return _build_doc_with_blocks(_titled_doc_template)
+
+
+@pytest.fixture(scope="module")
+def mapped_doc_with_blocks(_titled_doc_template):
+    """Document with several blocks plus its IdMapper, shared read-only per module."""
+    import ucp
+
+    doc, root, block1, block2, block3 = _build_doc_with_blocks(_titled_doc_template)
+    mapper = ucp.IdMapper.from_document(doc)
+
+    return doc, mapper, root, block1, block2, block3
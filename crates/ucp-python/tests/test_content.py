@@ -1,5 +1,7 @@
 """Tests for Content types."""
 
+import pytest
+
 
 class TestContentCreation:
     """Test content type creation."""
@@ -14,6 +16,15 @@ class TestContentCreation:
         assert content.is_empty is False
         assert content.as_text() == "Hello, World!"
 
+    def test_type_tag_is_shared(self):
+        """Test type tags are interned strings shared across instances."""
+        import ucp
+
+        first = ucp.Content.text("one")
+        second = ucp.Content.markdown("two")
+
+        assert first.type_tag is second.type_tag
+
     def test_markdown_content(self):
         """Test creating markdown content."""
         import ucp
@@ -33,6 +44,8 @@ class TestContentCreation:
         lang, source = content.as_code()
         assert lang == "python"
         assert source == "print('hello')"
+        assert content.language == "python"
+        assert ucp.Content.text("plain").language is None
 
     def test_table_content(self):
         """Test creating table content."""
@@ -55,6 +68,72 @@ class TestContentCreation:
         assert result["key"] == "value"
         assert result["count"] == 42
 
+    def test_json_content_roundtrip_types(self):
+        """Test JSON content preserves nested values and json.dumps key rules."""
+        import ucp
+
+        data = {
+            "nested": {"list": [1, 2.5, True, None], "tuple": ("a", "b")},
+            1: "int key",
+            "big": 2**63,
+        }
+        content = ucp.Content.json(data)
+
+        assert content.as_json() == {
+            "nested": {"list": [1, 2.5, True, None], "tuple": ["a", "b"]},
+            "1": "int key",
+            "big": 2**63,
+        }
+
+    def test_json_content_rejects_unserializable(self):
+        """Test JSON content rejects values json.dumps would reject."""
+        import ucp
+
+        with pytest.raises(TypeError):
+            ucp.Content.json({"value": object()})
+        with pytest.raises(ValueError):
+            ucp.Content.json(float("nan"))
+
+    def test_json_content_rejects_circular_and_deep_values(self):
+        """Test JSON content raises like json.dumps on cycles and deep nesting."""
+        import ucp
+
+        cyclic = []
+        cyclic.append(cyclic)
+        with pytest.raises(ValueError, match="Circular reference detected"):
+            ucp.Content.json(cyclic)
+
+        cyclic_dict = {}
+        cyclic_dict["self"] = [cyclic_dict]
+        with pytest.raises(ValueError, match="Circular reference detected"):
+            ucp.Content.json(cyclic_dict)
+
+        deep = []
+        for _ in range(100_000):
+            deep = [deep]
+        with pytest.raises(RecursionError):
+            ucp.Content.json(deep)
+
+        # Shared, non-cyclic references are fine
+        shared = [1, 2]
+        assert ucp.Content.json([shared, shared]).as_json() == [[1, 2], [1, 2]]
+
+    def test_json_content_keys_match_json_dumps(self):
+        """Test non-string keys are rendered with json.dumps's key rules."""
+        import enum
+        import json
+
+        import ucp
+
+        class Color(enum.IntEnum):
+            RED = 1
+
+        data = {Color.RED: "a", 1.5: "b", float("nan"): "c", float("-inf"): "d"}
+        content = ucp.Content.json(data)
+
+        assert content.as_json() == json.loads(json.dumps(data))
+        assert set(content.as_json()) == {"1", "1.5", "NaN", "-Infinity"}
+
     def test_math_content(self):
         """Test creating math content."""
         import ucp
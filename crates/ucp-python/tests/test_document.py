@@ -1,5 +1,7 @@
 """Tests for Document operations."""
 
+import json
+
 
 class TestDocumentCreation:
     """Test document creation and basic properties."""
@@ -38,6 +40,18 @@ class TestDocumentCreation:
         assert empty_doc.created_at is not None
         assert empty_doc.modified_at is not None
 
+    def test_copy_is_independent(self, doc_with_title):
+        """Test that a copied document does not share blocks with the original."""
+        import copy
+
+        clone = copy.deepcopy(doc_with_title)
+        clone.add_block(clone.root_id, "Only in the copy")
+        clone.title = "Copy"
+
+        assert clone.block_count == doc_with_title.block_count + 1
+        assert doc_with_title.title == "Test Document"
+        assert copy.copy(doc_with_title).root_id == doc_with_title.root_id
+
 
 class TestBlockOperations:
     """Test block CRUD operations."""
@@ -50,6 +64,15 @@ class TestBlockOperations:
         assert block_id is not None
         assert empty_doc.block_count == 2
 
+    def test_add_blocks(self, empty_doc):
+        """Test adding several blocks in one call."""
+        root = empty_doc.root_id
+        ids = empty_doc.add_blocks(root, [f"Block {i}" for i in range(4)])
+
+        assert len(ids) == 4
+        assert empty_doc.block_count == 5
+        assert empty_doc.children(root) == ids
+
     def test_add_block_with_role(self, empty_doc):
         """Test adding a block with a role."""
         root = empty_doc.root_id
@@ -57,6 +80,8 @@ class TestBlockOperations:
 
         block = empty_doc.get_block(block_id)
         assert block.role == "intro"
+        # Bare role categories are interned
+        assert block.role is empty_doc.get_block(block_id).role
 
     def test_add_block_with_label(self, empty_doc):
         """Test adding a block with a label."""
@@ -104,6 +129,19 @@ class TestBlockOperations:
         assert block is not None
         assert block.id == block1
 
+    def test_get_block_hash_and_eq(self, doc_with_blocks):
+        """Test blocks hash by ID and compare by value."""
+        doc, root, block1, block2, block3 = doc_with_blocks
+
+        first = doc.get_block(block1)
+        again = doc.get_block(block1)
+        other = doc.get_block(block2)
+
+        assert first == again
+        assert first != other
+        assert hash(first) == hash(again) == hash(block1)
+        assert len({first, again, other}) == 2
+
     def test_get_nonexistent_block(self, empty_doc):
         """Test getting a nonexistent block returns None."""
         import ucp
@@ -295,6 +333,7 @@ class TestTags:
         doc.add_tag(block1, "new-tag")
         block = doc.get_block(block1)
         assert "new-tag" in block.tags
+        assert doc.find_by_tag("new-tag") == [block1]
 
     def test_remove_tag(self, empty_doc):
         """Test removing a tag from a block."""
@@ -307,6 +346,8 @@ class TestTags:
         block = empty_doc.get_block(block_id)
         assert "tag1" not in block.tags
         assert "tag2" in block.tags
+        assert block_id not in empty_doc.find_by_tag("tag1")
+        assert block_id in empty_doc.find_by_tag("tag2")
 
     def test_set_label(self, doc_with_blocks):
         """Test setting a block's label."""
@@ -329,6 +370,11 @@ class TestSerialization:
         assert "blocks" in json_str
         assert "structure" in json_str
 
+        data = json.loads(json_str)
+        assert data["metadata"]["title"] == "Test Document"
+        assert len(data["blocks"]) == 4
+        assert data["structure"][str(root)] == [str(block1), str(block2)]
+
     def test_block_ids(self, doc_with_blocks):
         """Test getting all block IDs."""
         doc, root, block1, block2, block3 = doc_with_blocks
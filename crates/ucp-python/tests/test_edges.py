@@ -1,5 +1,7 @@
 """Tests for Edge operations."""
 
+import pytest
+
 
 class TestEdgeTypes:
     """Test edge type enumeration."""
@@ -28,22 +30,31 @@ class TestEdgeTypes:
 
         et = ucp.EdgeType.References
         assert et.as_string() == "references"
-
-    def test_edge_type_is_symmetric(self):
-        """Test checking if edge type is symmetric."""
-        import ucp
-
-        # SiblingOf should be symmetric
-        assert ucp.EdgeType.SiblingOf.is_symmetric() is True
-        # References is not symmetric
-        assert ucp.EdgeType.References.is_symmetric() is False
-
-    def test_edge_type_is_structural(self):
-        """Test checking if edge type is structural."""
+        assert str(et) == "references"
+        # Names are interned, so repeated calls hand back the same object
+        assert et.as_string() is ucp.EdgeType.References.as_string()
+
+    @pytest.mark.parametrize(
+        "name, symmetric, structural",
+        [
+            ("References", False, False),
+            ("CitedBy", False, False),
+            ("Supports", False, False),
+            ("Contradicts", True, False),
+            ("SiblingOf", True, True),
+            ("ParentOf", False, True),
+            ("ChildOf", False, True),
+            ("PreviousSibling", False, True),
+            ("NextSibling", False, True),
+        ],
+    )
+    def test_edge_type_classification(self, name, symmetric, structural):
+        """Test symmetric and structural classification of edge types."""
         import ucp
 
-        assert ucp.EdgeType.ParentOf.is_structural() is True
-        assert ucp.EdgeType.References.is_structural() is False
+        et = getattr(ucp.EdgeType, name)
+        assert et.is_symmetric() is symmetric
+        assert et.is_structural() is structural
 
 
 class TestEdgeCreation:
@@ -114,6 +125,20 @@ class TestEdgeOperations:
         edges = doc.outgoing_edges(block1)
         assert len(edges) >= 2
 
+    def test_has_edge(self, doc_with_blocks):
+        """Test checking for an edge through the document."""
+        import ucp
+
+        doc, root, block1, block2, block3 = doc_with_blocks
+
+        doc.add_edge(block1, ucp.EdgeType.References, block2)
+
+        assert doc.has_edge(block1, block2) is True
+        assert doc.has_edge(block1, block2, ucp.EdgeType.References) is True
+        assert doc.has_edge(block1, block2, ucp.EdgeType.Supports) is False
+        assert doc.has_edge(block2, block1) is False
+        assert doc.has_edge(block1, block3) is False
+
     def test_incoming_edges(self, doc_with_blocks):
         """Test getting incoming edges."""
         import ucp
@@ -141,6 +166,7 @@ class TestBlockEdges:
         block = doc.get_block(block1)
         edges = block.edges
         assert len(edges) > 0
+        assert block.edge_count == len(edges)
 
     def test_block_edges_of_type(self, doc_with_blocks):
         """Test getting edges of a specific type from a block."""
@@ -154,3 +180,17 @@ class TestBlockEdges:
         block = doc.get_block(block1)
         ref_edges = block.edges_of_type(ucp.EdgeType.References)
         assert len(ref_edges) >= 1
+
+    def test_block_has_edge_to(self, doc_with_blocks):
+        """Test edge existence checks from a block."""
+        import ucp
+
+        doc, root, block1, block2, block3 = doc_with_blocks
+
+        doc.add_edge(block1, ucp.EdgeType.References, block2)
+
+        block = doc.get_block(block1)
+        assert block.has_edge_to(block2)
+        assert block.has_edge_to(block2, ucp.EdgeType.References)
+        assert not block.has_edge_to(block2, ucp.EdgeType.Supports)
+        assert not block.has_edge_to(block3)
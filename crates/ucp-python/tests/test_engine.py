@@ -1,5 +1,7 @@
 """Tests for Engine, ValidationPipeline, and TraversalEngine."""
 
+import pytest
+
 
 class TestEngine:
     """Test Engine class with transaction support."""
@@ -161,6 +163,32 @@ class TestValidationPipeline:
         assert result.valid is False
         assert len(result.errors()) > 0
 
+    @pytest.mark.parametrize(
+        "method, severity", [("errors", "error"), ("warnings", "warning")]
+    )
+    def test_validation_result_filters_by_severity(self, method, severity):
+        """Test that each filter returns exactly the issues of its severity."""
+        import ucp
+
+        pipeline = ucp.ValidationPipeline(ucp.ResourceLimits(max_block_count=2))
+        doc = ucp.create("Test")
+        parent = doc.add_block(doc.root_id, "Parent")
+        doc.add_block(parent, "Child")
+        doc.add_block(doc.root_id, "Sibling")
+        # Deleting only the parent leaves its child unreachable, which the
+        # pipeline reports as an orphan warning alongside the size error
+        doc.delete_block(parent)
+
+        result = pipeline.validate(doc)
+        filtered = getattr(result, method)()
+        assert filtered
+        assert all(issue.severity == severity for issue in filtered)
+        # Severity names are interned, so separate getter calls hand back the
+        # same object
+        interned = next(i.severity for i in result.issues if i.severity == severity)
+        assert all(issue.severity is interned for issue in filtered)
+        assert len(filtered) == sum(1 for i in result.issues if i.severity == severity)
+
     def test_validation_result_methods(self):
         """Test ValidationResult methods."""
         import ucp
@@ -221,20 +249,15 @@ Content 2
         assert len(result.nodes) > 0
         assert result.max_depth >= 1
 
-    def test_navigate_up(self):
+    def test_navigate_up(self, parsed_section_doc):
         """Test navigating up from a node."""
         import ucp
 
-        doc = ucp.parse("# Title\n\n## Section\n\nContent")
+        doc = parsed_section_doc
         engine = ucp.TraversalEngine()
 
         # Get a leaf node
-        blocks = doc.blocks
-        leaf_id = None
-        for block in blocks:
-            if block.content_type == "text":
-                leaf_id = block.id
-                break
+        leaf_id = next((b.id for b in doc.blocks if b.content_type == "text"), None)
 
         if leaf_id:
             result = engine.navigate(doc, "up", start_id=leaf_id)
@@ -285,46 +308,51 @@ Content 2
         result = engine.expand(doc, doc.root_id)
         assert len(result.nodes) > 0
 
-    def test_path_to_root(self):
+    def test_path_to_root(self, parsed_section_doc):
         """Test getting path to root."""
         import ucp
 
-        doc = ucp.parse("# Title\n\n## Section\n\nContent")
+        doc = parsed_section_doc
         engine = ucp.TraversalEngine()
 
         # Find a non-root block
-        blocks = doc.blocks
-        non_root = None
-        for block in blocks:
-            if block.id != doc.root_id:
-                non_root = block.id
-                break
+        non_root = next((b.id for b in doc.blocks if b.id != doc.root_id), None)
 
         if non_root:
             path = engine.path_to_root(doc, non_root)
             assert len(path) >= 2
             assert path[0] == doc.root_id
 
-    def test_find_paths(self):
+    def test_find_paths(self, parsed_section_doc):
         """Test finding paths between nodes."""
         import ucp
 
-        doc = ucp.parse("# Title\n\n## Section\n\nContent")
+        doc = parsed_section_doc
         engine = ucp.TraversalEngine()
 
         # Find paths from root to a descendant
-        blocks = doc.blocks
-        descendant = None
-        for block in blocks:
-            if block.id != doc.root_id:
-                descendant = block.id
-                break
+        descendant = next((b.id for b in doc.blocks if b.id != doc.root_id), None)
 
         if descendant:
             paths = engine.find_paths(doc, doc.root_id, descendant)
             assert len(paths) >= 1
             assert paths[0][0] == doc.root_id
 
+    def test_shortest_path(self, parsed_section_doc):
+        """Test finding a shortest path between nodes."""
+        import ucp
+
+        doc = parsed_section_doc
+        engine = ucp.TraversalEngine()
+
+        for block in doc.blocks:
+            if block.id != doc.root_id:
+                path = engine.shortest_path(doc, doc.root_id, block.id)
+                assert path is not None
+                assert path[0] == doc.root_id
+                assert path[-1] == block.id
+                assert engine.shortest_path(doc, block.id, doc.root_id) is None
+
     def test_traversal_result_node_ids(self):
         """Test getting node IDs from traversal result."""
         import ucp
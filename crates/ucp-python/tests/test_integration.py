@@ -68,6 +68,54 @@ Another paragraph.
         assert "Test Document" in rendered
         assert "test paragraph" in rendered.lower()
 
+    def test_render_while_other_threads_mutate(self, doc_with_blocks):
+        """Test render and mutation of one document from several threads."""
+        import threading
+
+        import ucp
+
+        doc, root, block1, block2, block3 = doc_with_blocks
+        errors = []
+
+        def render_loop():
+            try:
+                for _ in range(200):
+                    ucp.render(doc)
+            except Exception as exc:  # pragma: no cover - reported below
+                errors.append(exc)
+
+        def mutate_loop():
+            try:
+                for i in range(200):
+                    doc.add_block(root, f"Added {i}", role="paragraph")
+            except Exception as exc:  # pragma: no cover - reported below
+                errors.append(exc)
+
+        threads = [threading.Thread(target=render_loop) for _ in range(2)]
+        threads.append(threading.Thread(target=mutate_loop))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Render holds the GIL, so a concurrent add_block never sees the
+        # document already borrowed
+        assert errors == []
+        assert "Added 199" in ucp.render(doc)
+
+    def test_parse_from_several_threads(self):
+        """Test parse runs concurrently without sharing state between threads."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        import ucp
+
+        sources = [f"# Doc {i}\n\nParagraph {i}\n" for i in range(8)]
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            rendered = list(pool.map(lambda md: ucp.render(ucp.parse(md)), sources))
+
+        for i, md in enumerate(rendered):
+            assert f"Paragraph {i}" in md
+
 
 class TestUclExecution:
     """Test UCL command execution."""
@@ -1,5 +1,7 @@
 """Tests for LLM utilities (IdMapper, PromptBuilder)."""
 
+import pytest
+
 
 class TestIdMapper:
     """Test IdMapper for token-efficient LLM prompts."""
@@ -30,37 +32,28 @@ class TestIdMapper:
         short_id = mapper.register(block_id)
         assert short_id == 1  # First registered ID
 
-    def test_to_short_id(self, doc_with_blocks):
+    def test_to_short_id(self, mapped_doc_with_blocks):
         """Test converting block ID to short ID."""
-        import ucp
-
-        doc, root, block1, block2, block3 = doc_with_blocks
+        doc, mapper, root, block1, block2, block3 = mapped_doc_with_blocks
 
-        mapper = ucp.IdMapper.from_document(doc)
         short_id = mapper.to_short_id(root)
 
         assert short_id is not None
         assert isinstance(short_id, int)
 
-    def test_to_block_id(self, doc_with_blocks):
+    def test_to_block_id(self, mapped_doc_with_blocks):
         """Test converting short ID back to block ID."""
-        import ucp
-
-        doc, root, block1, block2, block3 = doc_with_blocks
+        doc, mapper, root, block1, block2, block3 = mapped_doc_with_blocks
 
-        mapper = ucp.IdMapper.from_document(doc)
         short_id = mapper.to_short_id(root)
         block_id = mapper.to_block_id(short_id)
 
         assert block_id == root
 
-    def test_shorten_text(self, doc_with_blocks):
+    def test_shorten_text(self, mapped_doc_with_blocks):
         """Test shortening text with block IDs."""
-        import ucp
+        doc, mapper, root, block1, block2, block3 = mapped_doc_with_blocks
 
-        doc, root, block1, block2, block3 = doc_with_blocks
-
-        mapper = ucp.IdMapper.from_document(doc)
         text = f"Edit block {root}"
         shortened = mapper.shorten_text(text)
 
@@ -68,13 +61,10 @@ class TestIdMapper:
         assert str(root) not in shortened
         assert "Edit block" in shortened
 
-    def test_expand_text(self, doc_with_blocks):
+    def test_expand_text(self, mapped_doc_with_blocks):
         """Test expanding text with short IDs."""
-        import ucp
+        doc, mapper, root, block1, block2, block3 = mapped_doc_with_blocks
 
-        doc, root, block1, block2, block3 = doc_with_blocks
-
-        mapper = ucp.IdMapper.from_document(doc)
         short_id = mapper.to_short_id(root)
         text = f"block {short_id}"
         expanded = mapper.expand_text(text)
@@ -82,13 +72,10 @@ class TestIdMapper:
         # Should expand short ID back to long ID
         assert str(root) in expanded
 
-    def test_shorten_ucl(self, doc_with_blocks):
+    def test_shorten_ucl(self, mapped_doc_with_blocks):
         """Test shortening UCL commands."""
-        import ucp
+        doc, mapper, root, block1, block2, block3 = mapped_doc_with_blocks
 
-        doc, root, block1, block2, block3 = doc_with_blocks
-
-        mapper = ucp.IdMapper.from_document(doc)
         ucl = f'EDIT {block1} SET text = "hello"'
         shortened = mapper.shorten_ucl(ucl)
 
@@ -96,13 +83,10 @@ class TestIdMapper:
         assert str(block1) not in shortened
         assert "EDIT" in shortened
 
-    def test_expand_ucl(self, doc_with_blocks):
+    def test_expand_ucl(self, mapped_doc_with_blocks):
         """Test expanding UCL commands."""
-        import ucp
-
-        doc, root, block1, block2, block3 = doc_with_blocks
+        doc, mapper, root, block1, block2, block3 = mapped_doc_with_blocks
 
-        mapper = ucp.IdMapper.from_document(doc)
         short_id = mapper.to_short_id(block1)
         ucl = f'EDIT {short_id} SET text = "hello"'
         expanded = mapper.expand_ucl(ucl)
@@ -110,13 +94,10 @@ class TestIdMapper:
         # Short ID should be expanded
         assert str(block1) in expanded
 
-    def test_estimate_token_savings(self, doc_with_blocks):
+    def test_estimate_token_savings(self, mapped_doc_with_blocks):
         """Test estimating token savings."""
-        import ucp
-
-        doc, root, block1, block2, block3 = doc_with_blocks
+        doc, mapper, root, block1, block2, block3 = mapped_doc_with_blocks
 
-        mapper = ucp.IdMapper.from_document(doc)
         text = f"Block {root} references {block1} which elaborates {block2}"
 
         original, shortened, savings = mapper.estimate_token_savings(text)
@@ -124,25 +105,19 @@ class TestIdMapper:
         assert original > shortened
         assert savings > 0
 
-    def test_document_to_prompt(self, doc_with_blocks):
+    def test_document_to_prompt(self, mapped_doc_with_blocks):
         """Test generating document prompt."""
-        import ucp
+        doc, mapper, root, block1, block2, block3 = mapped_doc_with_blocks
 
-        doc, root, block1, block2, block3 = doc_with_blocks
-
-        mapper = ucp.IdMapper.from_document(doc)
         prompt = mapper.document_to_prompt(doc)
 
         assert "Document structure:" in prompt
         assert "Blocks:" in prompt
 
-    def test_mapping_table(self, doc_with_blocks):
+    def test_mapping_table(self, mapped_doc_with_blocks):
         """Test getting mapping table."""
-        import ucp
+        doc, mapper, root, block1, block2, block3 = mapped_doc_with_blocks
 
-        doc, root, block1, block2, block3 = doc_with_blocks
-
-        mapper = ucp.IdMapper.from_document(doc)
         table = mapper.mapping_table()
 
         assert "ID Mapping:" in table
@@ -213,6 +188,20 @@ class TestPromptBuilder:
         assert builder.has_capability(ucp.UclCapability.Edit) is True
         assert builder.has_capability(ucp.UclCapability.Delete) is False
 
+    @pytest.mark.parametrize(
+        "name",
+        ["Edit", "Append", "Move", "Delete", "Link", "Snapshot", "Transaction"],
+    )
+    def test_single_capability_prompt(self, name):
+        """Test that a single-capability prompt documents its commands."""
+        import ucp
+
+        cap = getattr(ucp.UclCapability, name)
+        prompt = ucp.PromptBuilder().with_capability(cap).build_system_prompt()
+
+        for command in cap.command_names():
+            assert command in prompt
+
     def test_without_capability(self):
         """Test removing a capability."""
         import ucp
@@ -293,49 +282,29 @@ class TestPromptBuilder:
 class TestPromptPresets:
     """Test preset prompt configurations."""
 
-    def test_basic_editing(self):
-        """Test basic editing preset."""
-        import ucp
-
-        builder = ucp.PromptPresets.basic_editing()
-
-        assert builder.has_capability(ucp.UclCapability.Edit) is True
-        assert builder.has_capability(ucp.UclCapability.Append) is True
-        assert builder.has_capability(ucp.UclCapability.Delete) is True
-        assert builder.has_capability(ucp.UclCapability.Move) is False
-
-    def test_structure_manipulation(self):
-        """Test structure manipulation preset."""
-        import ucp
-
-        builder = ucp.PromptPresets.structure_manipulation()
-
-        assert builder.has_capability(ucp.UclCapability.Move) is True
-        assert builder.has_capability(ucp.UclCapability.Link) is True
-        assert builder.has_capability(ucp.UclCapability.Edit) is False
-
-    def test_full_editing(self):
-        """Test full editing preset."""
-        import ucp
-
-        builder = ucp.PromptPresets.full_editing()
-
-        assert builder.has_capability(ucp.UclCapability.Edit) is True
-        assert builder.has_capability(ucp.UclCapability.Append) is True
-        assert builder.has_capability(ucp.UclCapability.Move) is True
-        assert builder.has_capability(ucp.UclCapability.Delete) is True
-        assert builder.has_capability(ucp.UclCapability.Link) is True
-        assert builder.has_capability(ucp.UclCapability.Transaction) is False
-
-    def test_version_control(self):
-        """Test version control preset."""
+    @pytest.mark.parametrize(
+        "preset, enabled, disabled",
+        [
+            ("basic_editing", ["Edit", "Append", "Delete"], ["Move"]),
+            ("structure_manipulation", ["Move", "Link"], ["Edit"]),
+            (
+                "full_editing",
+                ["Edit", "Append", "Move", "Delete", "Link"],
+                ["Transaction"],
+            ),
+            ("version_control", ["Snapshot", "Transaction"], ["Edit"]),
+        ],
+    )
+    def test_preset_capabilities(self, preset, enabled, disabled):
+        """Test which capabilities each preset turns on."""
         import ucp
 
-        builder = ucp.PromptPresets.version_control()
+        builder = getattr(ucp.PromptPresets, preset)()
 
-        assert builder.has_capability(ucp.UclCapability.Snapshot) is True
-        assert builder.has_capability(ucp.UclCapability.Transaction) is True
-        assert builder.has_capability(ucp.UclCapability.Edit) is False
+        for name in enabled:
+            assert builder.has_capability(getattr(ucp.UclCapability, name)) is True
+        for name in disabled:
+            assert builder.has_capability(getattr(ucp.UclCapability, name)) is False
 
     def test_token_efficient(self):
         """Test token efficient preset."""
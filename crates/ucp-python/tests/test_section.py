@@ -108,6 +108,8 @@ More content.
         assert len(result.removed_ids) > 0
         assert result.deleted_content is not None
         assert result.deleted_content.block_count > 0
+        # The snapshot is shared, not copied per access
+        assert result.deleted_content is result.deleted_content
 
         # Document should have fewer blocks
         assert doc.block_count < initial_count
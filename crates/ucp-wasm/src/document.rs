@@ -337,21 +337,9 @@ impl Document {
             .parse()
             .map_err(|_| JsValue::from_str(&format!("Invalid block ID: {}", id)))?;
 
-        let block = self
-            .inner
-            .get_block_mut(&block_id)
-            .ok_or_else(|| JsValue::from_str(&format!("Block not found: {}", id)))?;
-
-        if !block.metadata.tags.contains(&tag.to_string()) {
-            block.metadata.tags.push(tag.to_string());
-            // Update the tag index
-            self.inner
-                .indices
-                .by_tag
-                .entry(tag.to_string())
-                .or_default()
-                .insert(block_id);
-        }
+        self.inner
+            .add_tag(&block_id, tag)
+            .map_err(|_| JsValue::from_str(&format!("Block not found: {}", id)))?;
         Ok(())
     }
 
@@ -633,22 +621,9 @@ impl Document {
             .parse()
             .map_err(|_| JsValue::from_str(&format!("Invalid block ID: {}", id)))?;
 
-        let block = self
-            .inner
-            .get_block_mut(&block_id)
-            .ok_or_else(|| JsValue::from_str(&format!("Block not found: {}", id)))?;
-
-        let len_before = block.metadata.tags.len();
-        block.metadata.tags.retain(|t| t != tag);
-        let removed = block.metadata.tags.len() < len_before;
-
-        if removed {
-            // Update the tag index
-            if let Some(set) = self.inner.indices.by_tag.get_mut(tag) {
-                set.remove(&block_id);
-            }
-        }
-        Ok(removed)
+        self.inner
+            .remove_tag(&block_id, tag)
+            .map_err(|_| JsValue::from_str(&format!("Block not found: {}", id)))
     }
 
     /// Set a block's label.
@@ -855,12 +830,8 @@ impl Document {
     #[wasm_bindgen(js_name = findByRole)]
     pub fn find_by_role(&self, role: &str) -> js_sys::Array {
         let arr = js_sys::Array::new();
-        for block in self.inner.blocks.values() {
-            if let Some(ref block_role) = block.metadata.semantic_role {
-                if block_role.to_string() == role {
-                    arr.push(&JsValue::from_str(&block.id.to_string()));
-                }
-            }
+        for id in self.inner.find_by_role(role) {
+            arr.push(&JsValue::from_str(&id.to_string()));
         }
         arr
     }
@@ -307,7 +307,7 @@ impl WasmValidationResult {
 #[wasm_bindgen]
 #[derive(Clone)]
 pub struct WasmValidationIssue {
-    severity: String,
+    severity: &'static str,
     code: String,
     message: String,
 }
@@ -315,7 +315,7 @@ pub struct WasmValidationIssue {
 impl From<ucm_core::ValidationIssue> for WasmValidationIssue {
     fn from(issue: ucm_core::ValidationIssue) -> Self {
         Self {
-            severity: format!("{:?}", issue.severity).to_lowercase(),
+            severity: issue.severity.as_str(),
             code: format!("{:?}", issue.code),
             message: issue.message,
         }
@@ -326,7 +326,7 @@ impl From<ucm_core::ValidationIssue> for WasmValidationIssue {
 impl WasmValidationIssue {
     #[wasm_bindgen(getter)]
     pub fn severity(&self) -> String {
-        self.severity.clone()
+        self.severity.to_string()
     }
 
     #[wasm_bindgen(getter)]
@@ -2,7 +2,7 @@
 
 use ucm_engine::section::{
     clear_section_content_with_undo, integrate_section_blocks, restore_deleted_content,
-    ClearResult, DeletedContent,
+    restore_deleted_content_owned, ClearResult, DeletedContent,
 };
 use ucp_translator_markdown::parse_markdown as parse_markdown_to_doc;
 use wasm_bindgen::prelude::*;
@@ -253,7 +253,7 @@ pub fn write_section(
     let added_ids =
         integrate_section_blocks(doc.inner_mut(), &block_id, &temp_doc, base_heading_level)
             .map_err(|e| {
-                let _ = restore_deleted_content(doc.inner_mut(), &deleted_content);
+                let _ = restore_deleted_content_owned(doc.inner_mut(), deleted_content);
                 JsValue::from_str(&e.to_string())
             })?;
 
@@ -4,36 +4,43 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import re
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import tomllib
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
+# Multi-part paths use joinpath so each constant is built in one step
 CARGO_TOML = REPO_ROOT / "Cargo.toml"
-PYPROJECT_TOML = REPO_ROOT / "crates" / "ucp-python" / "pyproject.toml"
-PYTHON_INIT_PATH = (
-    REPO_ROOT / "crates" / "ucp-python" / "python" / "ucp" / "__init__.py"
+PYPROJECT_TOML = REPO_ROOT.joinpath("crates", "ucp-python", "pyproject.toml")
+PYTHON_INIT_PATH = REPO_ROOT.joinpath(
+    "crates", "ucp-python", "python", "ucp", "__init__.py"
 )
-WASM_PACK_TOML = REPO_ROOT / "crates" / "ucp-wasm" / "Cargo.toml"
+WASM_PACK_TOML = REPO_ROOT.joinpath("crates", "ucp-wasm", "Cargo.toml")
 # WASM package.json is generated in pkg/, but we can check the Cargo.toml metadata or the editor package
 # For now, let's point to ucm-editor as the representative JS package, or skip JS check if not applicable
 # ucm-editor moved out of repository - JS version check disabled
 PACKAGE_JSON = None
 README_PATH = REPO_ROOT / "README.md"
 DOCS_DIR = REPO_ROOT / "docs"
-DOC_INSTALL_PATH = DOCS_DIR / "getting-started" / "installation.md"
+DOC_INSTALL_PATH = DOCS_DIR.joinpath("getting-started", "installation.md")
 DOC_README_PATH = DOCS_DIR / "README.md"
-DOC_UCM_CORE_PATH = DOCS_DIR / "ucm-core" / "README.md"
-DOC_UCM_ENGINE_PATH = DOCS_DIR / "ucm-engine" / "README.md"
-DOC_UCL_PARSER_PATH = DOCS_DIR / "ucl-parser" / "README.md"
-DOC_UCP_API_PATH = DOCS_DIR / "ucp-api" / "README.md"
-DOC_UCP_OBSERVE_PATH = DOCS_DIR / "ucp-observe" / "README.md"
-DOC_TRANSLATOR_MD_PATH = DOCS_DIR / "translators" / "markdown" / "README.md"
+DOC_UCM_CORE_PATH = DOCS_DIR.joinpath("ucm-core", "README.md")
+DOC_UCM_ENGINE_PATH = DOCS_DIR.joinpath("ucm-engine", "README.md")
+DOC_UCL_PARSER_PATH = DOCS_DIR.joinpath("ucl-parser", "README.md")
+DOC_UCP_API_PATH = DOCS_DIR.joinpath("ucp-api", "README.md")
+DOC_UCP_OBSERVE_PATH = DOCS_DIR.joinpath("ucp-observe", "README.md")
+DOC_TRANSLATOR_MD_PATH = DOCS_DIR.joinpath("translators", "markdown", "README.md")
 CHANGELOG_PATH = REPO_ROOT / "changelog.json"
+GIT_DIR = REPO_ROOT / ".git"
+
+CHANGELOG_ENTRIES_START = re.compile(r'"entries"\s*:\s*\[\s*')
+CHANGELOG_DECODER = json.JSONDecoder()
 
 VERSION_CAPTURE = r"(?P<version>[0-9][0-9A-Za-z.\-]*)"
 PYTHON_INIT_VERSION = re.compile(
@@ -58,82 +65,66 @@ README_PATTERNS: list[tuple[re.Pattern[str], str]] = [
         "JavaScript install command",
     ),
 ]
-DOC_PATTERNS: list[tuple[Path, re.Pattern[str], str]] = [
-    (
-        DOC_INSTALL_PATH,
-        re.compile(rf"ucp-api\s*=\s*\"{VERSION_CAPTURE}\""),
-        "getting-started ucp-api dependency example",
-    ),
-    (
-        DOC_INSTALL_PATH,
-        re.compile(rf"ucm-core\s*=\s*\"{VERSION_CAPTURE}\""),
-        "getting-started ucm-core dependency example",
-    ),
-    (
-        DOC_INSTALL_PATH,
-        re.compile(rf"ucm-engine\s*=\s*\"{VERSION_CAPTURE}\""),
-        "getting-started ucm-engine dependency example",
-    ),
-    (
-        DOC_INSTALL_PATH,
-        re.compile(rf"ucl-parser\s*=\s*\"{VERSION_CAPTURE}\""),
-        "getting-started ucl-parser dependency example",
-    ),
-    (
-        DOC_INSTALL_PATH,
-        re.compile(rf"ucp-translator-markdown\s*=\s*\"{VERSION_CAPTURE}\""),
-        "getting-started markdown translator dependency example",
-    ),
-    (
-        DOC_INSTALL_PATH,
-        re.compile(rf"ucp-observe\s*=\s*\"{VERSION_CAPTURE}\""),
-        "getting-started ucp-observe dependency example",
-    ),
-    (
-        DOC_INSTALL_PATH,
-        re.compile(rf"ucm-core\s*=\s*\"{VERSION_CAPTURE}\"\s*\nucm-engine"),
-        "getting-started version conflict snippet",
-    ),
-    (
-        DOC_README_PATH,
-        re.compile(rf"ucp-api\s*=\s*\"{VERSION_CAPTURE}\""),
-        "docs README installation snippet",
-    ),
-    (
-        DOC_UCM_CORE_PATH,
-        re.compile(rf"ucm-core\s*=\s*\"{VERSION_CAPTURE}\""),
-        "ucm-core README dependency example",
-    ),
-    (
-        DOC_UCM_ENGINE_PATH,
-        re.compile(rf"ucm-engine\s*=\s*\"{VERSION_CAPTURE}\""),
-        "ucm-engine README dependency example",
-    ),
-    (
-        DOC_UCL_PARSER_PATH,
-        re.compile(rf"ucl-parser\s*=\s*\"{VERSION_CAPTURE}\""),
-        "ucl-parser README dependency example",
-    ),
-    (
-        DOC_UCP_API_PATH,
-        re.compile(rf"ucp-api\s*=\s*\"{VERSION_CAPTURE}\""),
-        "ucp-api README dependency example",
-    ),
-    (
-        DOC_UCP_OBSERVE_PATH,
-        re.compile(rf"ucp-observe\s*=\s*\"{VERSION_CAPTURE}\""),
-        "ucp-observe README dependency example",
-    ),
-    (
-        DOC_TRANSLATOR_MD_PATH,
-        re.compile(rf"ucp-translator-markdown\s*=\s*\"{VERSION_CAPTURE}\""),
-        "markdown translator README dependency example",
-    ),
-]
-
-
+# The README patterns joined into one alternation so the README is scanned
+# once. Each alternative captures into its own `v<index>` group, which
+# `lastgroup` maps back to the README_PATTERNS entry.
+README_PATTERN = re.compile(
+    "|".join(
+        pattern.pattern.replace("(?P<version>", f"(?P<v{index}>")
+        for index, (pattern, _) in enumerate(README_PATTERNS)
+    )
+)
+# One pattern covers every `<crate> = "<version>"` dependency line, so each doc
+# is scanned once regardless of how many crates it mentions.
+CRATE_PATTERN = re.compile(
+    r"(?P<crate>ucp-api|ucm-core|ucm-engine|ucl-parser|ucp-translator-markdown|ucp-observe)"
+    rf"\s*=\s*\"{VERSION_CAPTURE}\""
+)
+DOC_CRATES: dict[Path, list[tuple[str, str]]] = {
+    DOC_INSTALL_PATH: [
+        ("ucp-api", "getting-started ucp-api dependency example"),
+        ("ucm-core", "getting-started ucm-core dependency example"),
+        ("ucm-engine", "getting-started ucm-engine dependency example"),
+        ("ucl-parser", "getting-started ucl-parser dependency example"),
+        (
+            "ucp-translator-markdown",
+            "getting-started markdown translator dependency example",
+        ),
+        ("ucp-observe", "getting-started ucp-observe dependency example"),
+    ],
+    DOC_README_PATH: [("ucp-api", "docs README installation snippet")],
+    DOC_UCM_CORE_PATH: [("ucm-core", "ucm-core README dependency example")],
+    DOC_UCM_ENGINE_PATH: [("ucm-engine", "ucm-engine README dependency example")],
+    DOC_UCL_PARSER_PATH: [("ucl-parser", "ucl-parser README dependency example")],
+    DOC_UCP_API_PATH: [("ucp-api", "ucp-api README dependency example")],
+    DOC_UCP_OBSERVE_PATH: [("ucp-observe", "ucp-observe README dependency example")],
+    DOC_TRANSLATOR_MD_PATH: [
+        ("ucp-translator-markdown", "markdown translator README dependency example")
+    ],
+}
+# Display names for messages, computed once rather than per check/fix pass
+DOC_RELPATH: dict[Path, str] = {
+    path: path.relative_to(REPO_ROOT).as_posix() for path in DOC_CRATES
+}
+# Multi-line snippets that the crate pattern cannot express
+DOC_SNIPPET_PATTERNS: dict[Path, list[tuple[re.Pattern[str], str]]] = {
+    DOC_INSTALL_PATH: [
+        (
+            re.compile(rf"ucm-core\s*=\s*\"{VERSION_CAPTURE}\"\s*\nucm-engine"),
+            "getting-started version conflict snippet",
+        ),
+    ],
+}
+
+
+def read_text(path: Path) -> str:
+    """Read a small UTF-8 file in one unbuffered read."""
+    return path.read_bytes().decode("utf-8")
+
+
+@functools.cache
 def load_workspace_version() -> str:
-    with CARGO_TOML.open("rb") as fp:
+    with CARGO_TOML.open("rb", buffering=0) as fp:
         data = tomllib.load(fp)
     try:
         return data["workspace"]["package"]["version"]
@@ -141,8 +132,9 @@ def load_workspace_version() -> str:
         raise SystemExit("Cargo.toml is missing [workspace.package].version") from exc
 
 
+@functools.cache
 def load_python_version() -> str:
-    with PYPROJECT_TOML.open("rb") as fp:
+    with PYPROJECT_TOML.open("rb", buffering=0) as fp:
         data = tomllib.load(fp)
     try:
         return data["project"]["version"]
@@ -150,8 +142,9 @@ def load_python_version() -> str:
         raise SystemExit("pyproject.toml is missing [project].version") from exc
 
 
+@functools.cache
 def load_python_package_version() -> str:
-    content = PYTHON_INIT_PATH.read_text(encoding="utf-8")
+    content = read_text(PYTHON_INIT_PATH)
     match = PYTHON_INIT_VERSION.search(content)
     if not match:  # pragma: no cover
         raise SystemExit(
@@ -160,8 +153,9 @@ def load_python_package_version() -> str:
     return match.group("version")
 
 
+@functools.cache
 def load_wasm_pack_version() -> str:
-    with WASM_PACK_TOML.open("rb") as fp:
+    with WASM_PACK_TOML.open("rb", buffering=0) as fp:
         data = tomllib.load(fp)
     try:
         return data["package"]["metadata"]["wasm-pack"]["package"]["version"]
@@ -171,10 +165,11 @@ def load_wasm_pack_version() -> str:
         ) from exc
 
 
+@functools.cache
 def load_js_version() -> str:
     if PACKAGE_JSON is None:
         return "disabled"  # ucm-editor moved out of repository
-    content = PACKAGE_JSON.read_text(encoding="utf-8")
+    content = read_text(PACKAGE_JSON)
     data = json.loads(content)
     version = data.get("version")
     if not isinstance(version, str):  # pragma: no cover
@@ -184,13 +179,17 @@ def load_js_version() -> str:
 
 def check_readme(version: str) -> list[str]:
     errors: list[str] = []
-    content = README_PATH.read_text(encoding="utf-8")
-    for pattern, label in README_PATTERNS:
-        match = pattern.search(content)
-        if not match:
+    content = read_text(README_PATH)
+    found_versions: dict[int, str] = {}
+    for match in README_PATTERN.finditer(content):
+        found_versions.setdefault(int(match.lastgroup[1:]), match[match.lastgroup])
+        if len(found_versions) == len(README_PATTERNS):
+            break
+    for index, (_, label) in enumerate(README_PATTERNS):
+        found = found_versions.get(index)
+        if found is None:
             errors.append(f"README.md is missing the {label}.")
             continue
-        found = match.group("version")
         if found != version:
             errors.append(
                 f"README.md {label} references v{found}, expected v{version}."
@@ -198,17 +197,67 @@ def check_readme(version: str) -> list[str]:
     return errors
 
 
-def check_git_tag(version: str) -> list[str]:
-    expected_tag = f"v{version}"
+def resolve_git_ref(ref: str) -> str | None:
+    """Resolve a ref to a SHA from the loose ref file or packed-refs.
+
+    For annotated tags in packed-refs the peeled commit is returned; a loose
+    annotated tag resolves to the tag object, which never equals HEAD.
+    """
+    loose = GIT_DIR / ref
+    if loose.is_file():
+        return read_text(loose).strip()
+    packed = GIT_DIR / "packed-refs"
+    if not packed.is_file():
+        return None
+    lines = read_text(packed).splitlines()
+    for index, line in enumerate(lines):
+        sha, _, name = line.partition(" ")
+        if name != ref:
+            continue
+        peeled = lines[index + 1] if index + 1 < len(lines) else ""
+        return peeled[1:] if peeled.startswith("^") else sha
+    return None
+
+
+def head_has_tag(tag: str) -> bool:
+    """Check whether `tag` points at HEAD by reading .git directly.
+
+    Only a confirmed match is trusted; anything else (worktrees, loose
+    annotated tags, other ref storage) is left to `git describe`.
+    """
+    if not GIT_DIR.is_dir():
+        return False
     try:
-        tag = subprocess.run(
-            ["git", "describe", "--tags", "--exact-match", "HEAD"],
-            cwd=REPO_ROOT,
-            check=True,
-            text=True,
-            capture_output=True,
-        ).stdout.strip()
-    except subprocess.CalledProcessError:
+        head = read_text(GIT_DIR / "HEAD").strip()
+        if head.startswith("ref: "):
+            head = resolve_git_ref(head.removeprefix("ref: "))
+        return head is not None and head == resolve_git_ref(f"refs/tags/{tag}")
+    except (OSError, UnicodeDecodeError):
+        return False
+
+
+def start_describe_head() -> subprocess.Popen[str]:
+    """Start looking up the tag at HEAD without waiting for git to finish."""
+    return subprocess.Popen(
+        ["git", "describe", "--tags", "--exact-match", "HEAD"],
+        cwd=REPO_ROOT,
+        text=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def finish_describe_head(process: subprocess.Popen[str]) -> str | None:
+    """Return the tag pointing exactly at HEAD, or None if it is untagged."""
+    stdout, _ = process.communicate()
+    if process.returncode != 0:
+        return None
+    return stdout.strip()
+
+
+def check_git_tag(version: str, tag: str | None) -> list[str]:
+    expected_tag = f"v{version}"
+    if tag is None:
         return [
             "HEAD is not tagged. Create the release tag first or omit --require-tag."
         ]
@@ -217,67 +266,128 @@ def check_git_tag(version: str) -> list[str]:
     return []
 
 
-def check_docs(version: str) -> list[str]:
+def read_docs() -> dict[Path, str]:
+    """Read every doc that carries a version reference, once per file.
+
+    The reads are independent, so they are issued from a small thread pool.
+    """
+    paths = [path for path in DOC_CRATES if path.exists()]
+    with ThreadPoolExecutor(max_workers=min(8, len(paths) or 1)) as pool:
+        return dict(zip(paths, pool.map(read_text, paths)))
+
+
+def find_crate_versions(content: str) -> dict[str, str]:
+    """Map each crate to the version of its first dependency line in `content`."""
+    versions: dict[str, str] = {}
+    for match in CRATE_PATTERN.finditer(content):
+        versions.setdefault(match.group("crate"), match.group("version"))
+    return versions
+
+
+def check_docs(version: str, contents: dict[Path, str] | None = None) -> list[str]:
+    if contents is None:
+        contents = read_docs()
     errors: list[str] = []
-    cache: dict[Path, str] = {}
-    for path, pattern, label in DOC_PATTERNS:
-        if path not in cache:
-            if not path.exists():
-                errors.append(f"{path.relative_to(REPO_ROOT)} is missing.")
-                continue
-            cache[path] = path.read_text(encoding="utf-8")
-        content = cache[path]
-        match = pattern.search(content)
-        if not match:
-            errors.append(f"{path.relative_to(REPO_ROOT)} is missing {label}.")
+    for path, crates in DOC_CRATES.items():
+        rel_path = DOC_RELPATH[path]
+        content = contents.get(path)
+        if content is None:
+            errors.append(f"{rel_path} is missing.")
             continue
-        found = match.group("version")
-        if found != version:
-            errors.append(
-                f"{path.relative_to(REPO_ROOT)} {label} references {found}, expected {version}."
-            )
+        found_versions = find_crate_versions(content)
+        checks = [(found_versions.get(crate), label) for crate, label in crates]
+        for pattern, label in DOC_SNIPPET_PATTERNS.get(path, []):
+            match = pattern.search(content)
+            checks.append((match.group("version") if match else None, label))
+        for found, label in checks:
+            if found is None:
+                errors.append(f"{rel_path} is missing {label}.")
+            elif found != version:
+                errors.append(
+                    f"{rel_path} {label} references {found}, expected {version}."
+                )
     return errors
 
 
-def fix_docs(version: str) -> list[str]:
-    """Rewrite doc files to align version references."""
+def rewrite_versions(content: str, matches: list[re.Match[str]], version: str) -> str:
+    """Swap the `version` group of each match for `version` in one pass."""
+    pieces: list[str] = []
+    last = 0
+    for match in matches:
+        start, end = match.span("version")
+        pieces.append(content[last:start])
+        pieces.append(version)
+        last = end
+    pieces.append(content[last:])
+    return "".join(pieces)
+
+
+def fix_docs(version: str) -> tuple[list[str], dict[Path, str]]:
+    """Rewrite doc files to align version references.
+
+    Returns the change log and the post-fix file contents, so the caller can
+    re-check without reading the files back from disk.
+    """
     fixed: list[str] = []
-    cache: dict[Path, str] = {}
-    for path, pattern, label in DOC_PATTERNS:
-        if path not in cache:
-            if not path.exists():
+    contents = read_docs()
+    for path, content in contents.items():
+        rel_path = DOC_RELPATH[path]
+        original = content
+        expected = {crate for crate, _ in DOC_CRATES[path]}
+        stale = [
+            match
+            for match in CRATE_PATTERN.finditer(content)
+            if match.group("crate") in expected and match.group("version") != version
+        ]
+        found_versions = find_crate_versions(content)
+        for crate, label in DOC_CRATES[path]:
+            found = found_versions.get(crate)
+            if found is not None and found != version:
+                fixed.append(f"{rel_path} updated {label}: {found} → {version}")
+        content = rewrite_versions(content, stale, version)
+        for pattern, label in DOC_SNIPPET_PATTERNS.get(path, []):
+            stale = [
+                match
+                for match in pattern.finditer(content)
+                if match.group("version") != version
+            ]
+            if not stale:
                 continue
-            cache[path] = path.read_text(encoding="utf-8")
-        content = cache[path]
-        match = pattern.search(content)
-        if not match:
-            continue
-        found = match.group("version")
-        if found == version:
-            continue
-        # Replace only the captured version group
-        new_content = pattern.sub(
-            lambda match, new_version=version: match.group(0).replace(
-                match.group("version"), new_version, 1
-            ),
-            content,
-        )
-        path.write_text(new_content, encoding="utf-8")
-        fixed.append(
-            f"{path.relative_to(REPO_ROOT)} updated {label}: {found} → {version}"
-        )
-    return fixed
+            fixed.append(
+                f"{rel_path} updated {label}: {stale[0].group('version')} → {version}"
+            )
+            content = rewrite_versions(content, stale, version)
+        if content != original:
+            path.write_text(content, encoding="utf-8")
+            contents[path] = content
+    return fixed, contents
+
+
+def load_latest_changelog_entry(content: str) -> dict | None:
+    """Decode only the first object of the changelog's `entries` array.
+
+    Falls back to parsing the whole file when the array cannot be located
+    directly, e.g. if a string value happens to contain `"entries": [`.
+    """
+    match = CHANGELOG_ENTRIES_START.search(content)
+    if match is not None:
+        try:
+            latest, _ = CHANGELOG_DECODER.raw_decode(content, match.end())
+        except json.JSONDecodeError:
+            pass
+        else:
+            if isinstance(latest, dict):
+                return latest
+    entries = json.loads(content).get("entries", [])
+    return entries[0] if entries else None
 
 
 def check_changelog(version: str) -> list[str]:
     if not CHANGELOG_PATH.exists():
         return ["changelog.json is missing."]
-    with CHANGELOG_PATH.open(encoding="utf-8") as fp:
-        data = json.load(fp)
-    entries = data.get("entries", [])
-    if not entries:
+    latest = load_latest_changelog_entry(read_text(CHANGELOG_PATH))
+    if latest is None:
         return ["changelog.json has no entries."]
-    latest = entries[0]
     recorded = latest.get("version")
     expected = f"v{version}"
     if recorded != expected:
@@ -285,6 +395,11 @@ def check_changelog(version: str) -> list[str]:
     return []
 
 
+def print_errors(errors: list[str]) -> None:
+    for error in errors:
+        print(f"[version-sync] {error}", file=sys.stderr)
+
+
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(
         description="Validate that workspace, SDKs, docs, and changelog share the same version."
@@ -302,52 +417,79 @@ def main(argv: list[str] | None = None) -> int:
     )
     args = parser.parse_args(argv)
 
-    errors: list[str] = []
+    # Kept apart from the doc results so the --fix re-check still reports them
+    manifest_errors: list[str] = []
 
     workspace_version = load_workspace_version()
+
+    # Read the tag straight from .git when possible; otherwise let git run
+    # while the remaining version files are read
+    describe_process = None
+    head_tag = None
+    if args.require_tag:
+        expected_tag = f"v{workspace_version}"
+        if head_has_tag(expected_tag):
+            head_tag = expected_tag
+        else:
+            describe_process = start_describe_head()
     python_version = load_python_version()
     python_package_version = load_python_package_version()
     wasm_pack_version = load_wasm_pack_version()
     js_version = load_js_version()
 
     if python_version != workspace_version:
-        errors.append(
+        manifest_errors.append(
             f"crates/ucp-python/pyproject.toml version {python_version} does not match {workspace_version}."
         )
     if python_package_version != workspace_version:
-        errors.append(
+        manifest_errors.append(
             f"crates/ucp-python/python/ucp/__init__.py __version__ {python_package_version} does not match {workspace_version}."
         )
     if wasm_pack_version != workspace_version:
-        errors.append(
+        manifest_errors.append(
             f"crates/ucp-wasm/Cargo.toml [package.metadata.wasm-pack.package] version {wasm_pack_version} does not match {workspace_version}."
         )
     if js_version != workspace_version and js_version != "disabled":
-        errors.append(
+        manifest_errors.append(
             f"packages/ucp-js/package.json version {js_version} does not match {workspace_version}."
         )
 
-    errors.extend(check_readme(workspace_version))
+    # A manifest mismatch means the bump itself is incomplete and the doc checks
+    # would only add noise; --fix still continues so the docs get rewritten
+    if manifest_errors and not args.fix:
+        if describe_process is not None:
+            describe_process.kill()
+            describe_process.wait()
+        print_errors(manifest_errors)
+        return 1
+
+    # --fix only rewrites the docs, so these results stay valid for the re-check
+    readme_errors = check_readme(workspace_version)
+    changelog_errors = check_changelog(workspace_version)
+
+    errors = list(manifest_errors)
+    errors.extend(readme_errors)
     errors.extend(check_docs(workspace_version))
-    errors.extend(check_changelog(workspace_version))
+    errors.extend(changelog_errors)
     if args.require_tag:
-        errors.extend(check_git_tag(workspace_version))
+        if describe_process is not None:
+            head_tag = finish_describe_head(describe_process)
+        errors.extend(check_git_tag(workspace_version, head_tag))
 
     if args.fix:
-        fixed = fix_docs(workspace_version)
+        fixed, doc_contents = fix_docs(workspace_version)
         for line in fixed:
             print(f"[version-sync] {line}")
-        # Re-check after fixing
-        errors = []
-        errors.extend(check_readme(workspace_version))
-        errors.extend(check_docs(workspace_version))
-        errors.extend(check_changelog(workspace_version))
+        # Re-check after fixing, against the contents just written
+        errors = list(manifest_errors)
+        errors.extend(readme_errors)
+        errors.extend(check_docs(workspace_version, doc_contents))
+        errors.extend(changelog_errors)
         if args.require_tag:
-            errors.extend(check_git_tag(workspace_version))
+            errors.extend(check_git_tag(workspace_version, head_tag))
 
     if errors:
-        for error in errors:
-            print(f"[version-sync] {error}", file=sys.stderr)
+        print_errors(errors)
         return 1
 
     if not args.quiet:
@@ -5,12 +5,17 @@ from __future__ import annotations
 
 import argparse
 import subprocess
-import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Sibling script; importable because the scripts directory is on sys.path
+# when this file is run directly.
+import check_version_sync
+
 REPO_ROOT = Path(__file__).resolve().parents[1]
-CARGO_TOML = REPO_ROOT / "Cargo.toml"
-CHECK_SCRIPT = REPO_ROOT / "scripts" / "check_version_sync.py"
+# Shared by every spawn. The script opens no descriptors that git could
+# inherit, so the close_fds sweep in the child is skipped.
+SUBPROCESS_KW = {"cwd": REPO_ROOT, "text": True, "close_fds": False}
 
 
 def run(
@@ -19,50 +24,50 @@ def run(
     if dry_run:
         print(f"[dry-run] {' '.join(cmd)}")
         return None
-    return subprocess.run(
-        cmd, cwd=REPO_ROOT, check=True, text=True, capture_output=False
-    )
+    return subprocess.run(cmd, check=True, capture_output=False, **SUBPROCESS_KW)
 
 
 def captured(cmd: list[str]) -> str:
-    result = subprocess.run(
-        cmd, cwd=REPO_ROOT, check=True, text=True, capture_output=True
-    )
+    result = subprocess.run(cmd, check=True, capture_output=True, **SUBPROCESS_KW)
     return result.stdout.strip()
 
 
-def ensure_clean_worktree() -> None:
-    status = captured(["git", "status", "--porcelain"])
+def git_state(tag_name: str) -> tuple[str, str, str]:
+    """Return worktree status, current branch and matching tags.
+
+    The three queries are independent, so the git processes run concurrently.
+    """
+    cmds = [
+        ["git", "status", "--porcelain"],
+        ["git", "rev-parse", "--abbrev-ref", "HEAD"],
+        ["git", "tag", "--list", tag_name],
+    ]
+    with ThreadPoolExecutor(max_workers=len(cmds)) as pool:
+        status, branch, tags = pool.map(captured, cmds)
+    return status, branch, tags
+
+
+def ensure_clean_worktree(status: str) -> None:
     if status:
         raise SystemExit(
             "Working tree has uncommitted changes. Commit or stash before releasing."
         )
 
 
-def ensure_tag_absent(tag_name: str) -> None:
-    tags = captured(["git", "tag", "--list", tag_name])
+def ensure_tag_absent(tag_name: str, tags: str) -> None:
     if tags:
         raise SystemExit(f"Tag {tag_name} already exists. Delete or bump the version.")
 
 
-def ensure_on_branch(expected: str | None) -> None:
+def ensure_on_branch(expected: str | None, branch: str) -> None:
     if expected is None:
         return
-    branch = captured(["git", "rev-parse", "--abbrev-ref", "HEAD"])
     if branch != expected:
         raise SystemExit(
             f"Releases must run from {expected}, current branch is {branch}."
         )
 
 
-def load_version() -> str:
-    import tomllib
-
-    with CARGO_TOML.open("rb") as fp:
-        data = tomllib.load(fp)
-    return data["workspace"]["package"]["version"]
-
-
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(
         description="Run release checks and optionally tag the repo."
@@ -81,14 +86,18 @@ def main(argv: list[str] | None = None) -> int:
     )
     args = parser.parse_args(argv)
 
-    ensure_clean_worktree()
-    ensure_on_branch(args.branch)
-
-    version = load_version()
+    version = check_version_sync.load_workspace_version()
     tag_name = f"v{version}"
-    ensure_tag_absent(tag_name)
+    status, branch, tags = git_state(tag_name)
+
+    ensure_clean_worktree(status)
+    ensure_on_branch(args.branch, branch)
+    ensure_tag_absent(tag_name, tags)
 
-    run([sys.executable, str(CHECK_SCRIPT)])
+    # Run the version check in-process rather than in a fresh interpreter
+    check_status = check_version_sync.main([])
+    if check_status:
+        raise SystemExit(check_status)
 
     if args.tag:
         run(["git", "tag", tag_name], dry_run=args.dry_run)